@@ -0,0 +1,215 @@
+"""
+SignaturitClient benchmarks against the local stub server, results are printed as JSON.
+
+    python benchmarks/bench_client.py --output results.json
+    python benchmarks/bench_client.py --quick
+
+Every result has a name, its parameters, a value and a unit, so runs of different releases can be compared.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+from signaturit_sdk.resources.connection import Connection
+from signaturit_sdk.signaturit_client import SignaturitClient
+from stub_server import StubServer
+
+try:
+    import httpx
+    from signaturit_sdk.async_signaturit_client import AsyncSignaturitClient
+    from signaturit_sdk.resources.transport import HTTPXTransport
+except ImportError:
+    httpx = None
+
+
+def result(name, value, unit, **params):
+    return {'name': name, 'params': params, 'value': round(value, 3), 'unit': unit}
+
+
+def latencies(call, calls):
+    samples = []
+
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+
+    samples.sort()
+
+    return samples
+
+
+def bench_overhead(server, calls):
+    """
+    Latency of a single call, compared with a bare requests session to the same url
+    """
+    session = requests.Session()
+    url = server.url + '/v3/signatures/S00000001.json'
+    baseline = latencies(lambda: session.get(url).json(), calls)
+    session.close()
+
+    results = [result('baseline_latency_p50', baseline[len(baseline) // 2] * 1e6, 'us')]
+
+    for models in (False, True):
+        with SignaturitClient('TOKEN', base_url=server.url, models=models) as client:
+            samples = latencies(lambda: client.get_signature('S00000001'), calls)
+
+        results += [
+            result('get_signature_latency_p50', samples[len(samples) // 2] * 1e6, 'us', models=models),
+            result('get_signature_latency_p99', samples[int(len(samples) * 0.99)] * 1e6, 'us', models=models),
+            result('get_signature_overhead', (statistics.median(samples) - statistics.median(baseline)) * 1e6, 'us',
+                   models=models),
+        ]
+
+    return results
+
+
+def bench_throughput(server, calls, concurrencies):
+    results = []
+
+    for concurrency in concurrencies:
+        with SignaturitClient('TOKEN', base_url=server.url, pool_maxsize=concurrency) as client:
+            start = time.perf_counter()
+
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                list(executor.map(lambda index: client.get_signature('S%08d' % index), range(calls)))
+
+            elapsed = time.perf_counter() - start
+
+        results.append(result('throughput', calls / elapsed, 'calls/s', client='threads', concurrency=concurrency))
+
+    if httpx is None:
+        return results
+
+    for concurrency in concurrencies:
+        # The stub server only speaks HTTP/1.1
+        transport = HTTPXTransport(http2=False, max_connections=concurrency)
+
+        with SignaturitClient('TOKEN', base_url=server.url, transport=transport) as client:
+            start = time.perf_counter()
+
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                list(executor.map(lambda index: client.get_signature('S%08d' % index), range(calls)))
+
+            elapsed = time.perf_counter() - start
+
+        results.append(result('throughput', calls / elapsed, 'calls/s', client='httpx-threads',
+                              concurrency=concurrency))
+
+    async def run(concurrency):
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with AsyncSignaturitClient('TOKEN', base_url=server.url, max_connections=concurrency) as client:
+            async def call(index):
+                async with semaphore:
+                    return await client.get_signature('S%08d' % index)
+
+            start = time.perf_counter()
+            await asyncio.gather(*[call(index) for index in range(calls)])
+
+            return time.perf_counter() - start
+
+    for concurrency in concurrencies:
+        elapsed = asyncio.run(run(concurrency))
+
+        results.append(result('throughput', calls / elapsed, 'calls/s', client='asyncio', concurrency=concurrency))
+
+    return results
+
+
+def bench_pagination(server, page_size):
+    results = []
+
+    with SignaturitClient('TOKEN', base_url=server.url) as client:
+        for workers in (None, 4):
+            start = time.perf_counter()
+            count = sum(1 for _ in client.iter_signatures(page_size=page_size, workers=workers))
+            elapsed = time.perf_counter() - start
+
+            results.append(result('pagination', count / elapsed, 'items/s', page_size=page_size,
+                                  workers=workers or 0, items=count))
+
+    return results
+
+
+def bench_memory(server, size):
+    """
+    Peak of python allocations while uploading and downloading a file of the given size
+    """
+    results = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'contract.pdf')
+
+        with open(path, 'wb') as file:
+            file.truncate(size)
+
+        with SignaturitClient('TOKEN', base_url=server.url) as client:
+            tracemalloc.start()
+
+            response = client.create_signature(path, {'email': 'bob@signaturit.com', 'name': 'Bob'}, {})
+            assert response['received'] >= size, response
+
+            upload_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.reset_peak()
+
+            download = client.download_signed_document('S00000001', 'D1', destination=os.path.join(directory, 'out'))
+            assert download['bytes'] == server.server.download_size, download
+
+            download_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    results.append(result('upload_peak_memory', upload_peak / 1024.0, 'KiB', size=size))
+    results.append(result('download_peak_memory', download_peak / 1024.0, 'KiB', size=size))
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', help='Write the results to this file instead of stdout')
+    parser.add_argument('--quick', action='store_true', help='Fewer calls and smaller files')
+    args = parser.parse_args()
+
+    calls = 200 if args.quick else 2000
+    size = (8 if args.quick else 128) * 1024 * 1024
+    total = 1000 if args.quick else 10000
+
+    with StubServer(total=total, download_size=size) as server:
+        results = []
+        results += bench_overhead(server, calls)
+        results += bench_throughput(server, calls, (1, 4, 16))
+        results += bench_pagination(server, 100)
+        results += bench_memory(server, size)
+
+    report = {
+        'sdk': Connection.default_headers('')['user-agent'],
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'quick': args.quick,
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
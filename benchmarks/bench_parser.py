@@ -0,0 +1,81 @@
+"""
+Parser.fill_array microbenchmarks, compared with the previous recursive implementation.
+Both should be in the same range: the iterative walk is there so deeply nested params
+can't hit the recursion limit, not for speed.
+
+    python benchmarks/bench_parser.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from signaturit_sdk.resources.parser import Parser
+
+
+def recursive_fill_array(form_array, parameters, parent):
+    iterable = parameters.items() if isinstance(parameters, dict) else enumerate(parameters)
+
+    for key, value in iterable:
+        parent_key = "%s[%s]" % (parent, key) if len(parent) else key
+
+        if isinstance(value, dict):
+            recursive_fill_array(form_array, value, parent_key)
+        elif isinstance(value, list):
+            recursive_fill_array(form_array, value, parent_key)
+        else:
+            form_array[parent_key] = value
+
+
+def recipients(count, fields):
+    return [{
+        'email': 'signer%d@signaturit.com' % index,
+        'name': 'Signer %d' % index,
+        'require_sms_validation': 0,
+        'widgets': [{'page': 1, 'left': 10, 'top': 20, 'type': 'text', 'word_anchor': 'field%d' % field}
+                    for field in range(fields)],
+    } for index in range(count)]
+
+
+def flatten_recursive(items):
+    form = {}
+
+    for index, recipient in enumerate(items):
+        recursive_fill_array(form, recipient, 'recipients[%i]' % index)
+
+    return form
+
+
+def flatten(items):
+    parser = Parser()
+    form = {}
+
+    for index, recipient in enumerate(items):
+        parser.fill_array(form, recipient, 'recipients[%i]' % index)
+
+    return form
+
+
+def main():
+    for count, fields in ((1, 2), (100, 5), (500, 10)):
+        items = recipients(count, fields)
+        number = max(1, 500 // count)
+
+        assert flatten_recursive(items) == flatten(items)
+
+        results = [
+            ('recursive', min(timeit.repeat(lambda: flatten_recursive(items), number=number, repeat=7))),
+            ('iterative', min(timeit.repeat(lambda: flatten(items), number=number, repeat=7))),
+        ]
+
+        baseline = results[0][1]
+
+        print('%d recipients x %d widgets' % (count, fields))
+
+        for name, seconds in results:
+            print('  %-10s %9.1f us  x%.2f' % (name, seconds / number * 1e6, baseline / seconds))
+
+
+if __name__ == '__main__':
+    main()
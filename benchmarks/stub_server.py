@@ -0,0 +1,233 @@
+"""
+Local stand-in for the Signaturit v3 API, for benchmarks.
+
+It answers the signature, email, sms and count endpoints with generated data, consumes uploads
+without keeping them and streams downloads of a configurable size:
+
+    server = StubServer(total=5000, download_size=64 * 1024 * 1024)
+    server.start()
+
+    client = SignaturitClient('TOKEN', base_url=server.url)
+    ...
+    server.stop()
+
+It can also run alone: python benchmarks/stub_server.py --port 8080
+"""
+import argparse
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+CHUNK_SIZE = 65536
+
+
+def signature(index, documents=2):
+    return {
+        'id': 'S%08d' % index,
+        'created_at': '2016-01-01T10:%02d:%02d+0000' % (index // 60 % 60, index % 60),
+        'data': [{'key': 'crm_id', 'value': str(index)}],
+        'documents': [{
+            'id': 'D%08d-%d' % (index, document),
+            'created_at': '2016-01-01T10:00:00+0000',
+            'email': 'signer%d@signaturit.com' % document,
+            'name': 'Signer %d' % document,
+            'status': 'completed' if index % 3 else 'ready',
+            'events': [{'created_at': '2016-01-01T10:00:00+0000', 'type': 'email_processed'},
+                       {'created_at': '2016-01-01T10:05:00+0000', 'type': 'document_opened'}],
+            'file': {'name': 'contract.pdf', 'pages': 3, 'size': 81234},
+        } for document in range(documents)],
+    }
+
+
+def certified(index, prefix, key, value):
+    return {
+        'id': '%s%08d' % (prefix, index),
+        'created_at': '2016-01-01T10:00:00+0000',
+        'certificates': [{'id': 'C%08d' % index, 'created_at': '2016-01-01T10:00:00+0000', key: value,
+                          'name': 'Recipient', 'status': 'delivered', 'events': []}],
+    }
+
+
+RESOURCES = {
+    'signatures': signature,
+    'emails': lambda index: certified(index, 'E', 'email', 'bob@signaturit.com'),
+    'sms': lambda index: certified(index, 'M', 'phone', '34666666666'),
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    LIST = re.compile(r'^/v3/(signatures|emails|sms)\.json$')
+    COUNT = re.compile(r'^/v3/(signatures|emails|sms)/count\.json$')
+    SINGLE = re.compile(r'^/v3/(signatures|emails|sms)/([^/]+)\.json$')
+    DOWNLOAD = re.compile(r'^/v3/(signatures|emails|sms)/[^/]+/(documents|certificates)/[^/]+/download/')
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = dict(parse_qsl(url.query))
+        total = self.server.total
+
+        match = self.LIST.match(url.path)
+
+        if match:
+            ids = query.get('ids')
+
+            if ids:
+                indexes = [int(item[1:]) for item in ids.split(',') if item[1:].isdigit()]
+            else:
+                offset = int(query.get('offset', 0))
+                indexes = range(offset, min(offset + int(query.get('limit', 100)), total))
+
+            return self.send_json([RESOURCES[match.group(1)](index) for index in indexes if index < total])
+
+        if self.COUNT.match(url.path):
+            return self.send_json(total)
+
+        match = self.SINGLE.match(url.path)
+
+        if match:
+            index = match.group(2)[1:]
+
+            return self.send_json(RESOURCES[match.group(1)](int(index) if index.isdigit() else 0))
+
+        if self.DOWNLOAD.match(url.path):
+            return self.send_file(self.server.download_size)
+
+        self.send_json({'message': 'Not found'}, 404)
+
+    def do_POST(self):
+        received = self.consume_body()
+        match = self.LIST.match(urlsplit(self.path).path)
+
+        if match:
+            result = RESOURCES[match.group(1)](0)
+            result['received'] = received
+
+            return self.send_json(result)
+
+        self.send_json({'message': 'Not found'}, 404)
+
+    def consume_body(self):
+        """
+        Read and drop the request body
+        @return Bytes received
+        """
+        received = 0
+
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            while True:
+                size = int(self.rfile.readline().split(b';')[0], 16)
+
+                if size == 0:
+                    self.rfile.readline()
+
+                    return received
+
+                while size:
+                    read = len(self.rfile.read(min(size, CHUNK_SIZE)))
+                    received += read
+                    size -= read
+
+                self.rfile.readline()
+
+        remaining = int(self.headers.get('Content-Length') or 0)
+
+        while remaining:
+            read = len(self.rfile.read(min(remaining, CHUNK_SIZE)))
+
+            if not read:
+                break
+
+            received += read
+            remaining -= read
+
+        return received
+
+    def send_json(self, result, status=200):
+        body = json.dumps(result).encode('utf-8')
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_file(self, size):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/pdf')
+        self.send_header('Content-Length', str(size))
+        self.end_headers()
+
+        chunk = b'\0' * CHUNK_SIZE
+
+        while size:
+            self.wfile.write(chunk[:min(size, CHUNK_SIZE)])
+            size -= min(size, CHUNK_SIZE)
+
+
+class StubServer:
+    """
+    Threaded stub server running in background
+    """
+    def __init__(self, host='127.0.0.1', port=0, total=1000, download_size=1024 * 1024):
+        """
+        @port: Port to listen to, 0 picks a free one
+        @total: Number of signatures, emails and sms listed
+        @download_size: Bytes of every downloaded file
+        """
+        self.server = ThreadingHTTPServer((host, port), _Handler)
+        self.server.daemon_threads = True
+        self.server.total = total
+        self.server.download_size = download_size
+
+        self.__thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+
+        return 'http://%s:%d' % (host, port)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        self.__thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.__thread.start()
+
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--total', type=int, default=1000)
+    parser.add_argument('--download-size', type=int, default=1024 * 1024)
+    args = parser.parse_args()
+
+    server = StubServer(args.host, args.port, args.total, args.download_size)
+    print('Listening on %s' % server.url)
+
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        server.server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,212 @@
+import os
+
+from signaturit_sdk.resources.artifact_cache import AS_MMAP, AS_PATH
+from signaturit_sdk.resources.async_connection import AsyncConnection
+from signaturit_sdk.resources.deadline import DEFAULT_TIMEOUT
+from signaturit_sdk.resources.decoder import get_decoder
+from signaturit_sdk.resources.hooks import as_hooks
+from signaturit_sdk.resources.multi_get import afetch_by_ids
+from signaturit_sdk.resources.paginator import aiter_pages, aiter_pages_concurrently
+from signaturit_sdk.resources.retry import RetryPolicy
+from signaturit_sdk.resources.single_flight import AsyncSingleFlight
+from signaturit_sdk.signaturit_client import SignaturitClient
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+class AsyncSignaturitClient(SignaturitClient):
+    """
+    asyncio flavour of SignaturitClient. Every public method is a coroutine:
+
+        async with AsyncSignaturitClient('TOKEN') as client:
+            signature = await client.get_signature('SIGNATURE_ID')
+
+    The iter_* methods return async iterators:
+
+        async for signature in client.iter_signatures():
+            ...
+
+    Requests are sent through a pooled httpx.AsyncClient, install it with `pip install httpx`.
+    """
+    def __init__(self, token, production=False, max_connections=100, max_keepalive_connections=20,
+                 keepalive_expiry=5.0, http_client=None, rate_limiter=None, retry=None, cache=None,
+                 decoder=None, models=False, base_url=None, hooks=None, timeout=None, http2=False,
+                 single_flight=False, artifact_cache=None):
+        """
+        @token: Your access token
+        @production: Send requests to production instead of sandbox
+        @max_connections: Max concurrent connections
+        @max_keepalive_connections: Max idle connections kept alive
+        @keepalive_expiry: Seconds an idle connection is kept alive
+        @http_client: An already configured httpx.AsyncClient to use instead of building one
+        @rate_limiter: A TokenBucket shared by every request of the client
+        @retry: A RetryPolicy for idempotent requests, defaults to RetryPolicy(). Pass False to disable retries
+        @cache: A ResponseCache for brandings, templates, users, groups, contacts, subscriptions and finished signatures
+        @decoder: How response bodies are parsed: None for the standard library json, 'orjson', 'fastest'
+        (orjson when installed), 'raw' to get the bytes untouched, or a callable receiving the bytes
+        @models: Return typed models (Signature, Email, SMS, User...) instead of dicts
+        @base_url: Send requests to this server instead (ex: a local stub), production is ignored then
+        @hooks: A Hooks (ex: Metrics) or a list of them, called along the lifecycle of every request
+        @timeout: Seconds or a (connect, read) tuple, defaults to DEFAULT_TIMEOUT. Pass False to wait forever
+        @http2: Multiplex the requests over a single HTTP/2 connection, needs `pip install httpx[http2]`
+        @single_flight: Concurrent identical GET requests share the response of the first one instead of being sent again
+        @artifact_cache: An ArtifactCache keeping the downloaded documents and audit trails on disk
+        """
+        self.token = token
+        self._headers = AsyncConnection.default_headers(token)
+        self.production = production
+        self.base_url = base_url.rstrip('/') if base_url else None
+        self.rate_limiter = rate_limiter
+        self.retry = RetryPolicy() if retry is None else retry or None
+        self.cache = cache
+        self.decoder = get_decoder(decoder)
+        self.models = models
+        self.hooks = as_hooks(hooks)
+        self.timeout = DEFAULT_TIMEOUT if timeout is None else timeout or None
+        self.single_flight = AsyncSingleFlight() if single_flight else None
+        self.artifact_cache = artifact_cache
+
+        self._owns_session = http_client is None
+
+        if http_client is None:
+            if httpx is None:
+                raise ImportError('AsyncSignaturitClient requires httpx, install it with `pip install httpx`')
+
+            http_client = httpx.AsyncClient(http2=http2, limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            ))
+
+        self._session = http_client
+
+    def __enter__(self):
+        raise TypeError('Use "async with" with AsyncSignaturitClient')
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass  # pragma: no cover
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """
+        Release every pooled connection. Clients passed by the caller are left open.
+        """
+        if self._owns_session and self._session is not None:
+            await self._session.aclose()
+
+        self._session = None
+
+    # Returns a client, not a coroutine
+    with_timeout = SignaturitClient.with_timeout
+
+    def _connection(self):
+        """
+        Build an AsyncConnection bound to the shared http client
+        """
+        if self._session is None:
+            raise RuntimeError('AsyncSignaturitClient is closed')
+
+        return AsyncConnection(self.token, self._session, rate_limiter=self.rate_limiter, retry=self.retry,
+                               cache=self.cache, decoder=self.decoder,
+                               models=self.models, headers=self._headers,
+                               base_url=self.base_url, hooks=self.hooks, timeout=self.timeout,
+                               single_flight=self.single_flight)
+
+    async def _fetch_by_ids(self, fetch, chunks, workers):
+        return await afetch_by_ids(fetch, chunks, workers)
+
+    def _iter_pages(self, fetch, page_size, prefetch):
+        return aiter_pages(fetch, page_size, prefetch)
+
+    async def _iter_pages_concurrently(self, count, fetch, page_size, workers, ordered):
+        total = await count()
+
+        async for item in aiter_pages_concurrently(fetch, total, page_size, workers, ordered):
+            yield item
+
+    async def _owner_finished(self, url, ids):
+        if url not in self.ARTIFACT_OWNERS:
+            return False
+
+        getter, children = self.ARTIFACT_OWNERS[url]
+
+        return self._is_finished(await getattr(self, getter)(ids[0]), children)
+
+    async def _download(self, url, ids, destination, chunk_size, checksum, finished):
+        cache = self.artifact_cache
+
+        if cache is not None and finished is not False:
+            key = self._artifact_key(url, ids)
+            cached = cache.get(key)
+
+            if cached is not None or finished or await self._owner_finished(url, ids):
+                return await self._cached_download(cache, key, cached, url, ids, destination, chunk_size, checksum)
+
+        if destination in (AS_PATH, AS_MMAP):
+            raise ValueError('%r needs an artifact_cache and a finished process' % destination)
+
+        return await self._fetch(url, ids, destination, chunk_size, checksum)
+
+    async def _cached_download(self, cache, key, cached, url, ids, destination, chunk_size, checksum):
+        # The process wide lock of the key is not taken, not to block the event loop: processes downloading
+        # the same file at the same time store it once, as files are named by their content
+        for _ in range(3):
+            cached = cached or await self._fill(cache, key, url, ids, chunk_size)
+
+            if not isinstance(cached, tuple):
+                return cached  # error response
+
+            result = cache.deliver(*cached, destination, chunk_size)
+
+            if result is not None:
+                return result
+
+            cached = cache.get(key)
+
+        return await self._fetch(url, ids, destination, chunk_size, checksum)
+
+    async def _fill(self, cache, key, url, ids, chunk_size):
+        temporary = cache.temporary()
+
+        try:
+            result = await self._fetch(url, ids, temporary, chunk_size, True)
+
+            if not isinstance(result, dict) or 'path' not in result:
+                return result
+
+            return cache.put(key, temporary, result['sha256']), result['sha256']
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+    async def _fetch(self, url, ids, destination, chunk_size, checksum):
+        connection = self._connection()
+        connection.set_url(self.production, url % ids)
+        connection.set_endpoint(url)
+
+        response, headers = await connection.file_request(destination, chunk_size, checksum)
+
+        return response
+
+
+def _coroutine(method):
+    async def wrapper(self, *args, **kwargs):
+        return await method(self, *args, **kwargs)
+
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+
+    return wrapper
+
+
+for _name, _method in list(vars(SignaturitClient).items()):
+    if not _name.startswith(('_', 'iter_')) and callable(_method) and _name not in vars(AsyncSignaturitClient):
+        setattr(AsyncSignaturitClient, _name, _coroutine(_method))
@@ -0,0 +1,134 @@
+import os
+import threading
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from signaturit_sdk.resources.deadline import propagate
+
+BatchResult = namedtuple('BatchResult', ['index', 'job', 'response', 'error'])
+
+
+class DocumentCache:
+    """
+    Keeps the content of documents sent by many jobs in memory, so every path is read from disk once.
+    Entries are evicted in least recently used order when max_bytes is exceeded.
+    """
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, path):
+        """
+        @return A (filename, content) tuple for the path, or the path itself when it does not fit in the cache
+        """
+        stat = os.stat(path)
+        key = (os.path.realpath(path), stat.st_mtime_ns, stat.st_size)
+
+        if stat.st_size > self.max_bytes:
+            return path
+
+        with self.__lock:
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+
+                return self.__entries[key]
+
+        with open(path, 'rb') as document:
+            entry = (os.path.basename(path), document.read())
+
+        with self.__lock:
+            if key not in self.__entries:
+                self.__entries[key] = entry
+                self.size += stat.st_size
+
+            while self.size > self.max_bytes:
+                _, (_, content) = self.__entries.popitem(last=False)
+                self.size -= len(content)
+
+        return entry
+
+
+class BatchSender:
+    """
+    Sends many signature requests, certified emails or certified sms concurrently, yielding every
+    result in submission order as soon as it is available:
+
+        sender = BatchSender(client, max_in_flight=16)
+
+        for result in sender.send_signatures((files, recipients, params) for recipients in campaign):
+            if result.error is not None:
+                ...
+
+    Documents given as paths are read once and shared by every job that sends them.
+    """
+    def __init__(self, client, max_in_flight=8, document_cache=None):
+        """
+        @client: A SignaturitClient
+        @max_in_flight: Max requests sent at the same time
+        @document_cache: A DocumentCache, pass False to always stream documents from disk
+        """
+        self.client = client
+        self.max_in_flight = max_in_flight
+        self.document_cache = DocumentCache() if document_cache is None else document_cache
+
+    def send_signatures(self, jobs):
+        """
+        @jobs: An iterable of (files, recipients, params) tuples, same arguments as create_signature
+        @return An iterator of BatchResult
+        """
+        return self.__send(self.client.create_signature, jobs)
+
+    def send_emails(self, jobs):
+        """
+        @jobs: An iterable of (files, recipients, subject, body, params) tuples, same arguments as create_email
+        @return An iterator of BatchResult
+        """
+        return self.__send(self.client.create_email, jobs)
+
+    def send_SMS(self, jobs):
+        """
+        @jobs: An iterable of (files, recipients, body, params) tuples, same arguments as create_SMS
+        @return An iterator of BatchResult
+        """
+        return self.__send(self.client.create_SMS, jobs)
+
+    def __documents(self, files):
+        files = files if isinstance(files, list) else [files]
+
+        if not self.document_cache:
+            return files
+
+        return [self.document_cache.get(source) if isinstance(source, (str, os.PathLike)) else source
+                for source in files]
+
+    def __call(self, create, job):
+        files, arguments = job[0], job[1:]
+
+        return create(self.__documents(files), *arguments)
+
+    def __send(self, create, jobs):
+        pending = deque()
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            try:
+                for index, job in enumerate(jobs):
+                    pending.append((index, job, executor.submit(propagate(self.__call), create, job)))
+
+                    if len(pending) >= self.max_in_flight:
+                        yield self.__result(*pending.popleft())
+
+                while pending:
+                    yield self.__result(*pending.popleft())
+            finally:
+                for _, _, future in pending:
+                    future.cancel()
+
+    @staticmethod
+    def __result(index, job, future):
+        try:
+            return BatchResult(index, job, future.result(), None)
+        except Exception as error:
+            return BatchResult(index, job, None, error)
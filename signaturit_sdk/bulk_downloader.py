@@ -0,0 +1,181 @@
+import json
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from signaturit_sdk.resources.deadline import DeadlineExceeded, propagate
+from signaturit_sdk.resources.multi_get import chunk_ids
+
+
+class BulkDownloader:
+    """
+    Downloads the signed documents and audit trails of many signatures concurrently.
+
+    Every finished file is recorded in a manifest inside the destination directory, so running
+    the same download again after an interruption only fetches the files that are missing:
+
+        downloader = BulkDownloader(client, '/archive', workers=8)
+        summary = downloader.download(conditions={'status': 3})
+    """
+    SIGNED = 'signed'
+    AUDIT_TRAIL = 'audit_trail'
+
+    IDS_PER_REQUEST = 50
+    MANIFEST_NAME = 'manifest.jsonl'
+
+    def __init__(self, client, directory, workers=4, kinds=(SIGNED, AUDIT_TRAIL), only_completed=True,
+                 checksum=True):
+        """
+        @client: A SignaturitClient
+        @directory: Where the files and the manifest are stored
+        @workers: Max files downloaded concurrently
+        @kinds: Files to fetch for each document, SIGNED and/or AUDIT_TRAIL
+        @only_completed: Skip documents that are not completed yet
+        @checksum: Store the SHA-256 of every file in the manifest
+        """
+        self.client = client
+        self.directory = directory
+        self.workers = workers
+        self.kinds = kinds
+        self.only_completed = only_completed
+        self.checksum = checksum
+
+        self.__lock = threading.Lock()
+
+    @property
+    def manifest_path(self):
+        return os.path.join(self.directory, self.MANIFEST_NAME)
+
+    def completed(self):
+        """
+        @return A dict with the manifest entries of every downloaded file, by key
+        """
+        entries = {}
+
+        if not os.path.exists(self.manifest_path):
+            return entries
+
+        with open(self.manifest_path) as manifest:
+            for line in manifest:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # line cut by an interrupted run
+
+                if os.path.exists(os.path.join(self.directory, entry['path'])):
+                    entries[entry['key']] = entry
+
+        return entries
+
+    def download(self, signature_ids=None, conditions=None):
+        """
+        Download the files of the given signatures
+        @signature_ids: Ids of the signatures to download
+        @conditions: get_signatures conditions selecting the signatures to download, used when no ids are given
+        @return A dict with the downloaded and skipped counts, and the failed keys with the exception or error
+        response that made them fail. A DeadlineExceeded stops the whole download and is raised
+        """
+        os.makedirs(self.directory, exist_ok=True)
+
+        done = self.completed()
+        summary = {'downloaded': 0, 'skipped': 0, 'failed': {}}
+        pending = set()
+
+        with open(self.manifest_path, 'a') as manifest, ThreadPoolExecutor(max_workers=self.workers) as executor:
+            def collect(futures):
+                for future in futures:
+                    key, entry, error = future.result()
+
+                    if entry is None:
+                        summary['failed'][key] = error
+                    else:
+                        summary['downloaded'] += 1
+
+            try:
+                for key, signature_id, document_id, kind, final in self.__jobs(signature_ids, conditions):
+                    if key in done:
+                        summary['skipped'] += 1
+                        continue
+
+                    if len(pending) >= self.workers * 2:
+                        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        collect(finished)
+
+                    pending.add(executor.submit(propagate(self.__download), manifest, key, signature_id, document_id,
+                                                kind, final))
+
+                collect(wait(pending).done)
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+
+                raise
+
+        return summary
+
+    def __signatures(self, signature_ids, conditions):
+        if signature_ids is None:
+            for signature in self.client.iter_signatures(conditions or {}):
+                yield signature
+
+            return
+
+        for chunk in chunk_ids(signature_ids, len(self.client.SIGNS_URL), max_ids=self.IDS_PER_REQUEST):
+            for signature in self.client.iter_signatures({'ids': chunk}, prefetch=False):
+                yield signature
+
+    def __jobs(self, signature_ids, conditions):
+        for signature in self.__signatures(signature_ids, conditions):
+            for document in signature.get('documents', []):
+                if self.only_completed and document.get('status') != 'completed':
+                    continue
+
+                # The listing already tells whether the files can still change, the artifact cache needs no
+                # get_signature request per file
+                final = document.get('status') in self.client.FINISHED_STATUSES
+
+                for kind in self.kinds:
+                    key = '%s/%s/%s' % (signature['id'], document['id'], kind)
+
+                    yield key, signature['id'], document['id'], kind, final
+
+    def __download(self, manifest, key, signature_id, document_id, kind, final):
+        path = os.path.join(signature_id, '%s_%s.pdf' % (document_id, kind))
+        target = os.path.join(self.directory, path)
+        partial = target + '.part'
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+
+        if kind == self.SIGNED:
+            download = self.client.download_signed_document
+        else:
+            download = self.client.download_audit_trail
+
+        try:
+            result = download(signature_id, document_id, partial, checksum=self.checksum, finished=final)
+        except (DeadlineExceeded, KeyboardInterrupt):
+            self.__discard(partial)
+
+            raise
+        except Exception as error:
+            result = error
+
+        if not isinstance(result, dict) or 'bytes' not in result:
+            self.__discard(partial)
+
+            return key, None, result
+
+        os.replace(partial, target)
+
+        entry = {'key': key, 'path': path, 'bytes': result['bytes'], 'sha256': result['sha256']}
+
+        with self.__lock:
+            manifest.write(json.dumps(entry) + '\n')
+            manifest.flush()
+
+        return key, entry, None
+
+    @staticmethod
+    def __discard(partial):
+        if os.path.exists(partial):
+            os.remove(partial)
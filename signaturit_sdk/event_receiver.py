@@ -0,0 +1,242 @@
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qsl
+from wsgiref.simple_server import WSGIServer, make_server
+
+logger = logging.getLogger(__name__)
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class EventReceiver:
+    """
+    Receives the events sent to the urls registered with create_subscription.
+
+    It is a WSGI application, also usable as an ASGI one through `receiver.asgi`, or a standalone server:
+
+        receiver = EventReceiver(workers=8)
+
+        @receiver.on('document_completed')
+        def archive(event):
+            ...
+
+        receiver.serve('0.0.0.0', 8000)
+
+    Every event is answered as soon as it is queued and handled later by a bounded pool of threads
+    (coroutine handlers run on the event loop when served through ASGI, at most workers events at once).
+    Redelivered events are dropped, and when max_pending events are waiting the receiver answers 503 so
+    Signaturit sends them again later.
+    """
+    ACCEPTED = 'accepted'
+    DUPLICATE = 'duplicate'
+    BUSY = 'busy'
+    INVALID = 'invalid'
+
+    STATUSES = {
+        ACCEPTED: '200 OK',
+        DUPLICATE: '200 OK',
+        BUSY: '503 Service Unavailable',
+        INVALID: '400 Bad Request',
+    }
+
+    def __init__(self, workers=4, max_pending=1000, remember=10000):
+        """
+        @workers: Threads running the handlers, and events handled at once on the event loop
+        @max_pending: Max events queued or being handled
+        @remember: Number of recent events remembered to drop redeliveries
+        """
+        self.remember = remember
+
+        self.__handlers = {}
+        self.__executor = ThreadPoolExecutor(max_workers=workers)
+        self.__slots = asyncio.Semaphore(workers)
+        self.__pending = threading.BoundedSemaphore(max_pending)
+        self.__seen = OrderedDict()
+        self.__tasks = set()
+        self.__lock = threading.Lock()
+
+    def __call__(self, environ, start_response):
+        return self.wsgi(environ, start_response)
+
+    def on(self, event_type='*', handler=None):
+        """
+        Register a handler for an event type, '*' receives every event. Can be used as a decorator.
+        """
+        def register(handler):
+            self.__handlers.setdefault(event_type, []).append(handler)
+
+            return handler
+
+        return register(handler) if handler is not None else register
+
+    def dispatch(self, body, content_type='application/json'):
+        """
+        Parse an event and queue it for its handlers
+        @body: Raw request body
+        @content_type: Request content type
+        @return ACCEPTED, DUPLICATE, BUSY or INVALID
+        """
+        event = self.parse(body, content_type)
+
+        if event is None:
+            return self.INVALID
+
+        key = self.__key(event, body)
+
+        with self.__lock:
+            if key in self.__seen:
+                self.__seen.move_to_end(key)
+
+                return self.DUPLICATE
+
+            if not self.__pending.acquire(blocking=False):
+                return self.BUSY
+
+            self.__seen[key] = True
+
+            while len(self.__seen) > self.remember:
+                self.__seen.popitem(last=False)
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None:
+            task = loop.create_task(self.__handle_async(event))
+            self.__tasks.add(task)
+        else:
+            task = self.__executor.submit(self.__handle, event)
+
+        task.add_done_callback(self.__done)
+
+        return self.ACCEPTED
+
+    @staticmethod
+    def parse(body, content_type='application/json'):
+        """
+        @return The event as a dict, or None when the body is not a valid event
+        """
+        if isinstance(body, bytes):
+            body = body.decode('utf-8', 'replace')
+
+        try:
+            if content_type and content_type.startswith('application/x-www-form-urlencoded'):
+                event = dict(parse_qsl(body))
+            else:
+                event = json.loads(body)
+        except ValueError:
+            return None
+
+        return event if isinstance(event, dict) and 'type' in event else None
+
+    def wsgi(self, environ, start_response):
+        if environ.get('REQUEST_METHOD') != 'POST':
+            start_response('405 Method Not Allowed', [('Content-Type', 'text/plain'), ('Allow', 'POST')])
+
+            return [b'']
+
+        try:
+            length = int(environ.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            length = 0
+
+        result = self.dispatch(environ['wsgi.input'].read(length), environ.get('CONTENT_TYPE'))
+
+        start_response(self.STATUSES[result], [('Content-Type', 'text/plain')])
+
+        return [result.encode('utf-8')]
+
+    async def asgi(self, scope, receive, send):
+        if scope['type'] != 'http':
+            return
+
+        if scope['method'] != 'POST':
+            status, result = 405, b''
+        else:
+            body = b''
+            more = True
+
+            while more:
+                message = await receive()
+                body += message.get('body', b'')
+                more = message.get('more_body', False)
+
+            content_type = dict(scope.get('headers', [])).get(b'content-type', b'').decode('latin-1')
+
+            result = self.dispatch(body, content_type)
+            status, result = int(self.STATUSES[result][:3]), result.encode('utf-8')
+
+        await send({'type': 'http.response.start', 'status': status, 'headers': [(b'content-type', b'text/plain')]})
+        await send({'type': 'http.response.body', 'body': result})
+
+    def make_server(self, host='0.0.0.0', port=8000):
+        """
+        @return A threaded wsgiref server for this receiver, call serve_forever() on it
+        """
+        return make_server(host, port, self, server_class=_ThreadingWSGIServer)
+
+    def serve(self, host='0.0.0.0', port=8000):
+        """
+        Receive events until interrupted
+        """
+        server = self.make_server(host, port)
+
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            self.close()
+
+    def close(self, wait=True):
+        """
+        Stop the worker threads, waiting for the queued events when wait is True
+        """
+        self.__executor.shutdown(wait=wait)
+
+    @staticmethod
+    def __key(event, body):
+        for entity in ('document', 'email', 'sms', 'signature'):
+            if isinstance(event.get(entity), dict) and 'id' in event[entity] and 'created_at' in event:
+                return event['type'], event['created_at'], entity, event[entity]['id']
+
+        return hashlib.sha256(body if isinstance(body, bytes) else body.encode('utf-8')).hexdigest()
+
+    def __done(self, task):
+        self.__tasks.discard(task)
+        self.__pending.release()
+
+    def __handlers_for(self, event):
+        return self.__handlers.get(event['type'], []) + self.__handlers.get('*', [])
+
+    def __handle(self, event):
+        for handler in self.__handlers_for(event):
+            try:
+                result = handler(event)
+
+                if asyncio.iscoroutine(result):
+                    asyncio.run(result)
+            except Exception:
+                logger.exception('Error handling %s event', event['type'])
+
+    async def __handle_async(self, event):
+        loop = asyncio.get_running_loop()
+
+        # The queued events wait here, otherwise up to max_pending coroutine handlers would run at once
+        async with self.__slots:
+            for handler in self.__handlers_for(event):
+                try:
+                    if asyncio.iscoroutinefunction(handler):
+                        await handler(event)
+                    else:
+                        await loop.run_in_executor(self.__executor, handler, event)
+                except Exception:
+                    logger.exception('Error handling %s event', event['type'])
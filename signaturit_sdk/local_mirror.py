@@ -0,0 +1,250 @@
+import json
+import sqlite3
+
+from signaturit_sdk.resources.multi_get import chunk_ids
+
+
+class LocalMirror:
+    """
+    Keeps an indexed SQLite copy of your signatures, certified emails and certified sms.
+
+    Each sync only asks for the records created since the last one (using the `since` condition), and
+    refreshes the signatures that were not finished yet, upserting everything:
+
+        mirror = LocalMirror(client, '/var/lib/signaturit.db')
+        mirror.sync()
+
+        mirror.query('signatures', status='completed', email='bob@signaturit.com')
+    """
+    SIGNATURES = 'signatures'
+    EMAILS = 'emails'
+    SMS = 'sms'
+
+    RESOURCES = {
+        SIGNATURES: ('iter_signatures', 'documents', 'SIGNS_URL'),
+        EMAILS: ('iter_emails', 'certificates', 'EMAILS_URL'),
+        SMS: ('iter_SMS', 'certificates', 'SMS_URL'),
+    }
+
+    # Resources whose unfinished records are fetched again. Email and sms certificates have no final status
+    # (email_delivered, sms_delivered...), refreshing them would fetch the whole history on every sync
+    REFRESHED = (SIGNATURES,)
+
+    IDS_PER_REQUEST = 50
+
+    def __init__(self, client, path, page_size=100):
+        """
+        @client: A SignaturitClient
+        @path: SQLite database file, ':memory:' works too
+        @page_size: Items requested per page while syncing
+        """
+        self.client = client
+        self.page_size = page_size
+        self.database = sqlite3.connect(path)
+        self.database.row_factory = sqlite3.Row
+
+        self.__create_schema()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.database.close()
+
+    def __create_schema(self):
+        with self.database:
+            for resource in self.RESOURCES:
+                self.database.executescript('''
+                    CREATE TABLE IF NOT EXISTS %(table)s (
+                        id TEXT PRIMARY KEY,
+                        created_at TEXT,
+                        status TEXT,
+                        finished INTEGER NOT NULL DEFAULT 0,
+                        data TEXT NOT NULL
+                    );
+                    CREATE INDEX IF NOT EXISTS %(table)s_created_at ON %(table)s (created_at);
+                    CREATE INDEX IF NOT EXISTS %(table)s_status ON %(table)s (status);
+                    CREATE INDEX IF NOT EXISTS %(table)s_pending ON %(table)s (finished) WHERE finished = 0;
+                ''' % {'table': resource})
+
+            self.database.executescript('''
+                CREATE TABLE IF NOT EXISTS recipients (
+                    resource TEXT NOT NULL,
+                    record_id TEXT NOT NULL,
+                    email TEXT,
+                    phone TEXT
+                );
+                CREATE INDEX IF NOT EXISTS recipients_email ON recipients (email);
+                CREATE INDEX IF NOT EXISTS recipients_phone ON recipients (phone);
+                CREATE INDEX IF NOT EXISTS recipients_record ON recipients (resource, record_id);
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    resource TEXT PRIMARY KEY,
+                    high_water TEXT
+                );
+            ''')
+
+    def high_water(self, resource):
+        """
+        @return The creation date of the newest record synced, or None
+        """
+        row = self.database.execute('SELECT high_water FROM sync_state WHERE resource = ?', (resource,)).fetchone()
+
+        return row['high_water'] if row is not None else None
+
+    def sync(self, resources=(SIGNATURES, EMAILS, SMS), conditions=None):
+        """
+        Fetch the records created since the last sync and refresh unfinished signatures
+        @resources: Resources to sync
+        @conditions: Extra get_* conditions applied to the new records of every sync
+        @return A dict with the number of records stored by resource
+        """
+        stored = {}
+
+        for resource in resources:
+            high_water = self.high_water(resource)
+            stored[resource], newest = self.__sync_new(resource, high_water, conditions or {})
+
+            if resource in self.REFRESHED and high_water is not None:
+                stored[resource] += self.__refresh_pending(resource, high_water)
+
+            # Only once every record was fetched, a sync failing before resumes from the previous high water
+            if newest is not None:
+                with self.database:
+                    self.database.execute(
+                        'INSERT INTO sync_state (resource, high_water) VALUES (?, ?) '
+                        'ON CONFLICT (resource) DO UPDATE SET high_water = MAX(high_water, excluded.high_water)',
+                        (resource, newest))
+
+        return stored
+
+    def __sync_new(self, resource, high_water, conditions):
+        conditions = dict(conditions)
+
+        if high_water is not None:
+            conditions['since'] = high_water[:10]
+
+        iterate = getattr(self.client, self.RESOURCES[resource][0])
+
+        return self.__store(resource, iterate(conditions, page_size=self.page_size))
+
+    def __refresh_pending(self, resource, high_water):
+        """
+        Fetch again the unfinished records older than the ones already fetched by the since condition
+        """
+        ids = [row['id'] for row in self.database.execute(
+            'SELECT id FROM %s WHERE finished = 0 AND created_at < ?' % resource, (high_water[:10],))]
+        iterate_name, _, url_name = self.RESOURCES[resource]
+        iterate = getattr(self.client, iterate_name)
+        stored = 0
+
+        for chunk in chunk_ids(ids, len(getattr(self.client, url_name)), max_ids=self.IDS_PER_REQUEST):
+            stored += self.__store(resource, iterate({'ids': chunk}, prefetch=False))[0]
+
+        return stored
+
+    def __store(self, resource, records, batch_size=500):
+        """
+        @return The number of records stored, and the creation date of the newest one
+        """
+        stored = 0
+        newest = None
+        batch = []
+
+        for record in records:
+            batch.append(record)
+
+            if len(batch) >= batch_size:
+                stored += self.__upsert(resource, batch)
+                newest = self.__newest(newest, batch)
+                batch = []
+
+        if batch:
+            stored += self.__upsert(resource, batch)
+            newest = self.__newest(newest, batch)
+
+        return stored, newest
+
+    @staticmethod
+    def __newest(newest, records):
+        dates = [record.get('created_at') for record in records if record.get('created_at')]
+
+        if newest is not None:
+            dates.append(newest)
+
+        return max(dates) if dates else None
+
+    def __upsert(self, resource, records):
+        children_key = self.RESOURCES[resource][1]
+        rows = []
+        recipients = []
+
+        for record in records:
+            children = record.get(children_key) or []
+            statuses = set(child.get('status') for child in children)
+            status = statuses.pop() if len(statuses) == 1 else 'in_progress'
+            finished = bool(children) and all(
+                child.get('status') in self.client.FINISHED_STATUSES for child in children)
+
+            rows.append((record['id'], record.get('created_at'), status, int(finished),
+                         json.dumps(record if isinstance(record, dict) else dict(record))))
+            recipients.extend((resource, record['id'], child.get('email'), child.get('phone')) for child in children)
+
+        with self.database:
+            self.database.executemany(
+                'INSERT OR REPLACE INTO %s (id, created_at, status, finished, data) VALUES (?, ?, ?, ?, ?)' % resource,
+                rows)
+            self.database.executemany(
+                'DELETE FROM recipients WHERE resource = ? AND record_id = ?', [(resource, row[0]) for row in rows])
+            self.database.executemany(
+                'INSERT INTO recipients (resource, record_id, email, phone) VALUES (?, ?, ?, ?)', recipients)
+
+        return len(rows)
+
+    def query(self, resource, status=None, email=None, phone=None, since=None, until=None, limit=None):
+        """
+        Search the local copy
+        @resource: SIGNATURES, EMAILS or SMS
+        @status: Status shared by every document or certificate, 'in_progress' when they differ
+        @email: A recipient email
+        @phone: A recipient phone
+        @since: Min creation date, same format as created_at
+        @until: Max creation date, same format as created_at
+        @limit: Max records returned
+        @return A list of records, newest first
+        """
+        if resource not in self.RESOURCES:
+            raise ValueError('Unknown resource %s' % resource)
+
+        sql = 'SELECT data FROM %s' % resource
+        where = []
+        args = []
+
+        if status is not None:
+            where.append('status = ?')
+            args.append(status)
+
+        if since is not None:
+            where.append('created_at >= ?')
+            args.append(since)
+
+        if until is not None:
+            where.append('created_at <= ?')
+            args.append(until)
+
+        for column, value in (('email', email), ('phone', phone)):
+            if value is not None:
+                where.append('id IN (SELECT record_id FROM recipients WHERE resource = ? AND %s = ?)' % column)
+                args.extend((resource, value))
+
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+
+        sql += ' ORDER BY created_at DESC'
+
+        if limit is not None:
+            sql += ' LIMIT %d' % limit
+
+        return [json.loads(row['data']) for row in self.database.execute(sql, args)]
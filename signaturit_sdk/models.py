@@ -0,0 +1,217 @@
+from collections.abc import Mapping
+
+
+class Field:
+    """
+    Read only attribute backed by a key of the payload
+    """
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        return instance._data.get(self.name)
+
+
+class Children:
+    """
+    Read only attribute wrapping a list of the payload in models the first time it is read
+    """
+    __slots__ = ('name', 'model')
+
+    def __init__(self, name, model):
+        self.name = name
+        self.model = model
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        children = instance._children
+
+        if children is None:
+            children = instance._children = {}
+
+        if self.name not in children:
+            children[self.name] = [self.model(item) for item in instance._data.get(self.name) or ()]
+
+        return children[self.name]
+
+
+class Model(Mapping):
+    """
+    Typed view of a decoded payload. Fields are read from the payload on access and nested
+    children are only wrapped when read, so a page of models costs little more than its dicts.
+
+    It is still a read only mapping: model['documents'] returns the raw list, model.documents the models.
+    """
+    __slots__ = ('_data', '_children')
+
+    def __init__(self, data):
+        self._data = data
+        self._children = None
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            # _data is not set yet while copy and pickle rebuild the model
+            raise AttributeError(name)
+
+        try:
+            return self._data[name]
+        except KeyError:
+            raise AttributeError('%s has no field %s' % (type(self).__name__, name)) from None
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __reduce__(self):
+        return type(self), (self._data,)
+
+    def __eq__(self, other):
+        if isinstance(other, Model):
+            other = other._data
+
+        return self._data == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '<%s %s>' % (type(self).__name__, self._data.get('id'))
+
+    def to_dict(self):
+        """
+        @return The decoded payload
+        """
+        return self._data
+
+
+class Document(Model):
+    __slots__ = ()
+
+    id = Field('id')
+    created_at = Field('created_at')
+    email = Field('email')
+    name = Field('name')
+    status = Field('status')
+    decline_reason = Field('decline_reason')
+    events = Field('events')
+    file = Field('file')
+
+
+class Recipient(Model):
+    """
+    A certificate of a certified email or sms, one per recipient
+    """
+    __slots__ = ()
+
+    id = Field('id')
+    created_at = Field('created_at')
+    email = Field('email')
+    phone = Field('phone')
+    name = Field('name')
+    status = Field('status')
+    events = Field('events')
+    file = Field('file')
+
+
+class Signature(Model):
+    __slots__ = ()
+
+    id = Field('id')
+    created_at = Field('created_at')
+    data = Field('data')
+    url = Field('url')
+    documents = Children('documents', Document)
+
+
+class Email(Model):
+    __slots__ = ()
+
+    id = Field('id')
+    created_at = Field('created_at')
+    certificates = Children('certificates', Recipient)
+
+
+class SMS(Model):
+    __slots__ = ()
+
+    id = Field('id')
+    created_at = Field('created_at')
+    certificates = Children('certificates', Recipient)
+
+
+class User(Model):
+    __slots__ = ()
+
+    id = Field('id')
+    email = Field('email')
+    name = Field('name')
+    position = Field('position')
+    role = Field('role')
+    status = Field('status')
+
+
+class Group(Model):
+    __slots__ = ()
+
+    id = Field('id')
+    created_at = Field('created_at')
+    name = Field('name')
+    managers = Children('managers', User)
+    members = Children('members', User)
+
+
+class Contact(Model):
+    __slots__ = ()
+
+    id = Field('id')
+    created_at = Field('created_at')
+    email = Field('email')
+    name = Field('name')
+
+
+class Subscription(Model):
+    __slots__ = ()
+
+    id = Field('id')
+    created_at = Field('created_at')
+    url = Field('url')
+    events = Field('events')
+
+
+class Branding(Model):
+    __slots__ = ()
+
+    id = Field('id')
+    created_at = Field('created_at')
+    application_texts = Field('application_texts')
+    layout_color = Field('layout_color')
+    logo = Field('logo')
+    signature_color = Field('signature_color')
+    text_color = Field('text_color')
+    templates = Field('templates')
+
+
+def wrap(model, result):
+    """
+    Wrap a decoded result in models, error payloads (without id) and raw bytes are returned untouched
+    @model: Model class
+    @result: A decoded object or list of objects
+    """
+    if isinstance(result, dict):
+        return model(result) if 'id' in result else result
+
+    if isinstance(result, list):
+        return [model(item) if isinstance(item, dict) and 'id' in item else item for item in result]
+
+    return result
@@ -0,0 +1,241 @@
+import contextlib
+import hashlib
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+LOCK_STRIPES = 256
+
+
+class _View:
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+
+# download_* destinations returning the cached file itself instead of a copy
+AS_PATH = _View('AS_PATH')
+AS_MMAP = _View('AS_MMAP')
+
+
+class ArtifactCache:
+    """
+    On disk cache of downloaded signed documents and audit trails, which never change once a process is finished.
+
+        cache = ArtifactCache('/var/cache/signaturit', max_bytes=10 * 1024 ** 3)
+        client = SignaturitClient('TOKEN', artifact_cache=cache)
+
+        client.download_signed_document(signature_id, document_id)                # bytes
+        client.download_signed_document(signature_id, document_id, 'out.pdf')     # copy
+        client.download_signed_document(signature_id, document_id, AS_PATH)       # path of the cached file
+        client.download_signed_document(signature_id, document_id, AS_MMAP)       # read only mmap
+
+    Files are stored by the SHA-256 of their content, so a file shared by several documents is stored once,
+    and every (resource, id, document id, kind) points to one of them. Writes go to a temporary file renamed
+    in place, so readers never see partial files, and several processes can share the directory: a file
+    being downloaded by one of them is waited for by the others instead of downloaded again.
+    Once max_bytes is exceeded, the least recently read files are removed. A path returned with AS_PATH is
+    valid until its file is evicted; an open file or mmap stays readable after that.
+    """
+    def __init__(self, directory, max_bytes=1024 ** 3):
+        """
+        @directory: Cache directory, created when missing. Share it only between trusted services
+        @max_bytes: Max size of the cached files
+        """
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+
+        self.__thread_locks = [threading.Lock() for _ in range(LOCK_STRIPES + 1)] if fcntl is None else None
+
+        for name in ('objects', 'refs', 'locks', 'tmp'):
+            os.makedirs(os.path.join(self.directory, name), exist_ok=True)
+
+    @staticmethod
+    def __digest(key):
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    def __ref_path(self, digest):
+        return os.path.join(self.directory, 'refs', digest[:2], digest)
+
+    def object_path(self, sha256):
+        return os.path.join(self.directory, 'objects', sha256[:2], sha256)
+
+    def lock(self, key):
+        """
+        Lock of a key shared by the threads and processes using the directory, keys are spread over LOCK_STRIPES
+        """
+        return self.__lock(int(self.__digest(key)[:8], 16) % LOCK_STRIPES)
+
+    @contextlib.contextmanager
+    def __lock(self, stripe):
+        if fcntl is None:
+            with self.__thread_locks[stripe]:
+                yield
+
+            return
+
+        # flock locks are held by the open file, so they also exclude the other threads of the process
+        with open(os.path.join(self.directory, 'locks', '%03d' % stripe), 'a+b') as file:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+
+            try:
+                yield
+            finally:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+    def get(self, key):
+        """
+        @return The (path, sha256) of the cached file for the key, or None
+        """
+        ref = self.__ref_path(self.__digest(key))
+
+        try:
+            with open(ref) as file:
+                sha256 = file.read().strip()
+        except FileNotFoundError:
+            return None
+
+        path = self.object_path(sha256)
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(ref)
+
+            return None
+
+        return path, sha256
+
+    def temporary(self):
+        """
+        @return A new empty file path in the cache directory, to download to before put
+        """
+        descriptor, path = tempfile.mkstemp(dir=os.path.join(self.directory, 'tmp'), suffix='.part')
+        os.close(descriptor)
+
+        return path
+
+    def put(self, key, temporary, sha256):
+        """
+        Move a downloaded file in the cache
+        @temporary: Path returned by temporary
+        @sha256: Hex SHA-256 of the file content
+        @return The path of the cached file
+        """
+        path = self.object_path(sha256)
+        digest = self.__digest(key)
+        ref = self.__ref_path(digest)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.makedirs(os.path.dirname(ref), exist_ok=True)
+        os.replace(temporary, path)
+
+        descriptor, ref_temporary = tempfile.mkstemp(dir=os.path.join(self.directory, 'tmp'))
+
+        with os.fdopen(descriptor, 'w') as file:
+            file.write(sha256)
+
+        os.replace(ref_temporary, ref)
+
+        self.evict(keep=path)
+
+        return path
+
+    def __objects(self):
+        root = os.path.join(self.directory, 'objects')
+
+        for prefix in os.scandir(root):
+            if not prefix.is_dir():
+                continue
+
+            for entry in os.scandir(prefix.path):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+
+                yield stat.st_mtime, stat.st_size, entry.path
+
+    def size(self):
+        """
+        @return Bytes used by the cached files
+        """
+        return sum(size for _, size, _ in self.__objects())
+
+    def evict(self, keep=None):
+        """
+        Remove the least recently read files until the cache fits in max_bytes
+        @keep: Path never removed, usually the one just added
+        """
+        with self.__lock(LOCK_STRIPES):
+            objects = sorted(self.__objects())
+            total = sum(size for _, size, _ in objects)
+
+            for _, size, path in objects:
+                if total <= self.max_bytes:
+                    break
+
+                if path == keep:
+                    continue
+
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(path)
+
+                total -= size
+
+    def clear(self):
+        with self.__lock(LOCK_STRIPES):
+            for name in ('objects', 'refs'):
+                shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+                os.makedirs(os.path.join(self.directory, name), exist_ok=True)
+
+    @staticmethod
+    def deliver(path, sha256, destination, chunk_size=65536):
+        """
+        Hand a cached file over the way download_* would have returned it
+        @destination: None for the bytes, AS_PATH, AS_MMAP (b'' for an empty file), or a path or writable file object
+        to copy it to
+        @return None when the file was evicted meanwhile
+        """
+        try:
+            file = open(path, 'rb')
+        except FileNotFoundError:
+            return None
+
+        if destination is AS_PATH:
+            file.close()
+
+            return path
+
+        with file:
+            # The open file stays readable once evicted, its path does not
+            size = os.fstat(file.fileno()).st_size
+
+            if destination is None:
+                return file.read()
+
+            if destination is AS_MMAP:
+                # Empty files can't be mapped
+                return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+
+            if isinstance(destination, (str, bytes, os.PathLike)):
+                with open(destination, 'wb') as target:
+                    shutil.copyfileobj(file, target, chunk_size)
+
+                return {'bytes': size, 'sha256': sha256, 'path': os.fspath(destination)}
+
+            shutil.copyfileobj(file, destination, chunk_size)
+
+            return {'bytes': size, 'sha256': sha256}
@@ -0,0 +1,193 @@
+import asyncio
+import json
+import time
+
+from signaturit_sdk.resources import deadline
+from signaturit_sdk.resources.base_connection import BaseConnection
+from signaturit_sdk.resources.download import DownloadWriter
+from signaturit_sdk.resources.hooks import call_hook
+from signaturit_sdk.resources.multipart import MultipartEncoder
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+def _http_timeout(timeout):
+    """
+    @timeout: None, seconds or a (connect, read) tuple
+    @return The matching httpx.Timeout
+    """
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+
+        return httpx.Timeout(read, connect=connect)
+
+    return httpx.Timeout(timeout)
+
+
+class AsyncConnection(BaseConnection):
+    """
+    Class to handle all the GET, POST, PUT, DELETE & PATCH operations over an asyncio http client
+    """
+    def __init__(self, token, client, rate_limiter=None, retry=None, cache=None, decoder=None, models=False,
+                 headers=None, base_url=None, hooks=None, timeout=None, single_flight=None):
+        super().__init__(token, rate_limiter=rate_limiter, retry=retry, cache=cache, decoder=decoder, models=models,
+                         headers=headers, base_url=base_url, hooks=hooks, timeout=timeout,
+                         single_flight=single_flight)
+
+        self.__client = client
+
+    async def __send(self, method, headers=None, stream=False, **kwargs):
+        """
+        Send the request, waiting for the rate limiter and retrying it when the retry policy allows it
+        """
+        info = self._request_info(method, headers, kwargs)
+        attempt = 0
+
+        while True:
+            started = time.perf_counter()
+
+            if info is not None:
+                info.attempt = attempt
+
+            if self._rate_limiter is not None:
+                delay = self._rate_limiter.reserve()
+
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            sent = time.perf_counter()
+
+            if info is not None:
+                info.queued = sent - started
+
+            try:
+                request = self.__client.build_request(
+                    method,
+                    self._base_url,
+                    headers=headers if headers is not None else self._headers,
+                    timeout=_http_timeout(deadline.clamp(self._timeout)),
+                    **kwargs)
+
+                if info is not None:
+                    if info.bytes_sent is None and 'Content-Length' in request.headers:
+                        info.bytes_sent = int(request.headers['Content-Length'])
+
+                    call_hook(self._hooks, 'before_send', info)
+
+                response = await self.__client.send(request, stream=stream)
+            except (httpx.NetworkError, httpx.RemoteProtocolError, httpx.TimeoutException,
+                    deadline.DeadlineExceeded) as error:
+                delay = self._retry_error(method, attempt, error, info, sent)
+
+                if delay is None:
+                    raise
+
+                await asyncio.sleep(delay)
+                attempt += 1
+
+                continue
+
+            delay = self._retry_response(method, attempt, response, info, sent, stream)
+
+            if delay is None:
+                return response
+
+            await response.aclose()
+
+            if response.status_code == 429 and self._rate_limiter is not None:
+                self._rate_limiter.hold(delay)
+            else:
+                await asyncio.sleep(delay)
+
+            attempt += 1
+
+    async def get_request(self):
+        if self._uses_cache():
+            return await self.__cached_get_request()
+
+        response = await self.__get()
+
+        return self._load(response.content, response.status_code)
+
+    async def __get(self, headers=None, etag=None):
+        """
+        Send a GET request, sharing the response of an identical request already in flight
+        """
+        if self._single_flight is None:
+            return await self.__send('GET', headers=headers)
+
+        return await self._single_flight.do(self._flight_key(etag), lambda: self.__send('GET', headers=headers))
+
+    async def __cached_get_request(self):
+        key, entry = self._cache_entry()
+
+        if entry is not None and entry.fresh():
+            return self._load(entry.body)
+
+        response = await self.__get(*self._revalidation(entry))
+
+        return self._cached_result(key, entry, response)
+
+    async def post_request(self):
+        if self._files:
+            with MultipartEncoder(self._params or {}, self._files.items()) as body:
+                headers = dict(self._headers)
+                headers['Content-Type'] = body.content_type
+
+                if body.len is not None:
+                    headers['Content-Length'] = str(body.len)
+
+                response = await self.__send('POST', headers=headers, content=body.__aiter__())
+        elif isinstance(self._params, str):
+            response = await self.__send('POST', content=self._params)
+        else:
+            response = await self.__send('POST', data=self._params)
+
+        return self._load(response.content, response.status_code)
+
+    async def put_request(self):
+        raw = self._files['files'].read()
+
+        response = await self.__send('PUT', content=raw)
+
+        return self._load(response.content, response.status_code)
+
+    async def delete_request(self):
+        response = await self.__send('DELETE')
+
+        return self._load(response.content, response.status_code)
+
+    async def patch_request(self):
+        response = await self.__send('PATCH', content=json.dumps(self._params))
+
+        return self._load(response.content, response.status_code)
+
+    async def file_request(self, destination=None, chunk_size=65536, checksum=False):
+        """
+        Request that retrieve a binary file
+        @destination: Path or writable file object to stream the file to, instead of returning it
+        @chunk_size: Bytes read per chunk when streaming
+        @checksum: Compute the SHA-256 of the streamed file
+        """
+        if destination is None:
+            response = await self.__send('GET')
+
+            return response.content, response.headers
+
+        response = await self.__send('GET', stream=True)
+
+        try:
+            if response.status_code >= 400:
+                return self._load(await response.aread(), response.status_code), response.headers
+
+            with DownloadWriter(destination, checksum) as writer:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    deadline.check()
+                    writer.write(chunk)
+
+            return writer.result(), response.headers
+        finally:
+            await response.aclose()
@@ -0,0 +1,250 @@
+import json
+import time
+from urllib.parse import urlsplit
+
+from signaturit_sdk.models import wrap
+from signaturit_sdk.resources import deadline
+from signaturit_sdk.resources.decoder import get_decoder
+from signaturit_sdk.resources.hooks import RequestInfo, body_size, call_hook, response_size
+
+
+class ResponseError(ValueError):
+    """
+    Error response whose body could not be decoded, ex: the HTML page of a proxy once the retries ran out
+    """
+    def __init__(self, status_code, body):
+        super().__init__('HTTP %d: %r' % (status_code, body[:200]))
+
+        self.status_code = status_code
+        self.body = body
+
+
+class BaseConnection:
+    """
+    Request building, decoding, caching and retry decisions shared by Connection and AsyncConnection,
+    which only send the requests
+    """
+    def __init__(self, token, rate_limiter=None, retry=None, cache=None, decoder=None, models=False,
+                 headers=None, base_url=None, hooks=None, timeout=None, single_flight=None):
+        self._rate_limiter = rate_limiter
+        self._retry = retry
+        self._cache = cache
+        self.__decode = get_decoder(decoder)
+        self.__models = models
+        self.__model = None
+        self._cache_group = None
+        self.__cache_condition = None
+        self.__invalidates = ()
+        self._hooks = hooks
+        self._timeout = timeout
+        self._single_flight = single_flight
+        self.__endpoint = None
+        self.__host = base_url
+        self._base_url = None
+        self._params = None
+        self._files = None
+        self._headers = headers if headers is not None else self.default_headers(token)
+        self.__shared_headers = headers is not None
+
+    @staticmethod
+    def default_headers(token):
+        return {'Authorization': 'Bearer %s' % token, 'user-agent': 'signaturit-python-sdk 1.1.0'}
+
+    def add_header(self, header, value):
+        if self.__shared_headers:
+            self._headers = dict(self._headers)
+            self.__shared_headers = False
+
+        self._headers[header] = value
+
+    def add_params(self, params, json_format=None):
+        if json_format is True:
+            self._params = json.dumps(params)
+        else:
+            self._params = params
+
+    def add_files(self, files):
+        self._files = files
+
+    def cache_as(self, group, condition=None):
+        """
+        Serve the GET request from the cache when possible
+        @group: Cache group of the response, used for ttls and invalidation
+        @condition: Callable receiving the result, the response is only cached when it returns True
+        """
+        self._cache_group = group
+        self.__cache_condition = condition
+
+    def model_as(self, model):
+        """
+        Wrap the result in the given Model class when the client asked for models
+        """
+        self.__model = model
+
+    def _load(self, body, status=None):
+        """
+        Decode a response body
+        @status: Status code of the response, decoding errors of error responses raise ResponseError
+        """
+        try:
+            result = self.__decode(body)
+        except ValueError as error:
+            if status is None or status < 400:
+                raise
+
+            raise ResponseError(status, body) from error
+
+        if self.__models and self.__model is not None:
+            return wrap(self.__model, result)
+
+        return result
+
+    def invalidates(self, *groups):
+        """
+        Drop the cached responses of the given groups once the request is sent
+        """
+        self.__invalidates = groups
+
+    def set_endpoint(self, endpoint):
+        """
+        Path template reported to the hooks instead of the url, ex: /v3/signatures/%s.json
+        """
+        self.__endpoint = endpoint
+
+    def set_url(self, prod, url):
+        if self.__host is not None:
+            self._base_url = self.__host
+        elif prod is False:
+            self._base_url = 'https://api.sandbox.signaturit.com'
+        else:
+            self._base_url = 'https://api.signaturit.com'
+
+        self._base_url += url
+
+    def _request_info(self, method, headers, kwargs):
+        """
+        @return The RequestInfo passed to the hooks, None without hooks
+        """
+        if self._hooks is None:
+            return None
+
+        body = kwargs.get('data', kwargs.get('content'))
+        size = body_size(body)
+
+        if size is None and headers is not None and 'Content-Length' in headers:
+            size = int(headers['Content-Length'])
+
+        endpoint = self.__endpoint if self.__endpoint is not None else urlsplit(self._base_url).path
+
+        return RequestInfo(method, endpoint, self._base_url, size, time.perf_counter(),
+                           headers if headers is not None else self._headers, body)
+
+    def _retry_error(self, method, attempt, error, info, sent):
+        """
+        Decide whether an attempt failing without response is retried, and call the hooks
+        @sent: perf_counter value when the attempt was sent
+        @return The seconds to wait before retrying, or None to raise the error
+        """
+        retry = (self._retry is not None and not isinstance(error, deadline.DeadlineExceeded) and
+                 self._retry.can_retry(method, attempt))
+        delay = self._retry.delay(attempt) if retry else None
+        retry = retry and deadline.allows(delay)
+
+        if info is not None:
+            info.error = error
+            info.status = None
+            info.response_headers = None
+            info.elapsed = time.perf_counter() - sent
+
+            if retry:
+                call_hook(self._hooks, 'on_retry', info, delay)
+            else:
+                info.total = time.perf_counter() - info.started
+                call_hook(self._hooks, 'on_error', info)
+
+        return delay if retry else None
+
+    def _retry_response(self, method, attempt, response, info, sent, stream):
+        """
+        Decide whether a response is retried, and call the hooks. The final response invalidates the cache groups
+        @sent: perf_counter value when the attempt was sent
+        @stream: Whether the response body is streamed
+        @return The seconds to wait before retrying, or None when the response is the final one
+        """
+        retry = self._retry is not None and self._retry.should_retry(method, response.status_code, attempt)
+
+        if retry:
+            delay = self._retry.delay(attempt, response.headers)
+            retry = deadline.allows(delay)
+
+        if info is not None:
+            info.error = None
+            info.status = response.status_code
+            info.response_headers = response.headers
+            info.elapsed = time.perf_counter() - sent
+
+        if retry:
+            if info is not None:
+                call_hook(self._hooks, 'on_retry', info, delay)
+
+            return delay
+
+        if self._cache is not None and self.__invalidates:
+            self._cache.invalidate(*self.__invalidates)
+
+        if info is not None:
+            info.bytes_received = response_size(response, stream)
+            info.response_body = None if stream else response.content
+            info.total = time.perf_counter() - info.started
+            call_hook(self._hooks, 'after_response', info)
+
+            if response.status_code >= 400:
+                call_hook(self._hooks, 'on_error', info)
+
+        return None
+
+    def _uses_cache(self):
+        return self._cache is not None and self._cache_group is not None
+
+    def _flight_key(self, etag=None):
+        """
+        @return The key shared by identical GET requests in flight
+        """
+        return self._headers['Authorization'], self._base_url, etag
+
+    def _cache_entry(self):
+        """
+        @return The cache key of the GET request and its entry, None when missing
+        """
+        key = (self._headers['Authorization'], self._base_url)
+
+        return key, self._cache.get(key)
+
+    def _revalidation(self, entry):
+        """
+        @entry: Expired cache entry, or None
+        @return The headers and etag of the GET request revalidating it
+        """
+        if entry is None:
+            return self._headers, None
+
+        headers = dict(self._headers)
+        headers['If-None-Match'] = entry.etag
+
+        return headers, entry.etag
+
+    def _cached_result(self, key, entry, response):
+        """
+        Decode the response of a cached GET request, keeping it when cacheable
+        """
+        if response.status_code == 304 and entry is not None:
+            self._cache.refresh(key)
+
+            return self._load(entry.body)
+
+        result = self._load(response.content, response.status_code)
+
+        if response.status_code == 200 and (self.__cache_condition is None or self.__cache_condition(result)):
+            self._cache.set(key, self._cache_group, response.content, response.headers.get('ETag'))
+
+        return result
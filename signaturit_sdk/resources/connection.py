@@ -1,86 +1,169 @@
 import requests
 import json
+import time
 
+from signaturit_sdk.resources import deadline
+from signaturit_sdk.resources.base_connection import BaseConnection
+from signaturit_sdk.resources.download import DownloadWriter
+from signaturit_sdk.resources.hooks import body_size, call_hook
+from signaturit_sdk.resources.multipart import MultipartEncoder
+from signaturit_sdk.resources.transport import RequestsTransport
 
-class Connection:
+
+class Connection(BaseConnection):
     """
     Class to handle all the GET, POST, PUT, DELETE & PATCH operations
     """
-    def __init__(self, token):
-        self.__base_url = None
-        self.__params = None
-        self.__files = None
-        self.__headers = {'Authorization': 'Bearer %s' % token, 'user-agent': 'signaturit-python-sdk 1.1.0'}
+    def __init__(self, token, session=None, rate_limiter=None, retry=None, cache=None, decoder=None, models=False,
+                 headers=None, base_url=None, hooks=None, timeout=None, transport=None, single_flight=None):
+        super().__init__(token, rate_limiter=rate_limiter, retry=retry, cache=cache, decoder=decoder, models=models,
+                         headers=headers, base_url=base_url, hooks=hooks, timeout=timeout,
+                         single_flight=single_flight)
+
+        self.__transport = transport if transport is not None else RequestsTransport(session)
+
+    def __send(self, method, headers=None, **kwargs):
+        """
+        Send the request, waiting for the rate limiter and retrying it when the retry policy allows it
+        """
+        info = self._request_info(method, headers, kwargs)
+        attempt = 0
+
+        while True:
+            started = time.perf_counter()
+
+            if info is not None:
+                info.attempt = attempt
+
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
 
-    def add_header(self, header, value):
-        self.__headers[header] = value
+            sent = time.perf_counter()
 
-    def add_params(self, params, json_format=None):
-        if json_format is True:
-            self.__params = json.dumps(params)
-        else:
-            self.__params = params
+            if info is not None:
+                info.queued = sent - started
+                call_hook(self._hooks, 'before_send', info)
 
-    def add_files(self, files):
-        self.__files = files
+            try:
+                response = self.__transport.request(
+                    method,
+                    self._base_url,
+                    headers=headers if headers is not None else self._headers,
+                    timeout=deadline.clamp(self._timeout),
+                    **kwargs)
+            except (requests.ConnectionError, requests.Timeout, deadline.DeadlineExceeded) as error:
+                delay = self._retry_error(method, attempt, error, info, sent)
 
-    def set_url(self, prod, url):
-        if prod is False:
-            self.__base_url = 'https://api.sandbox.signaturit.com'
-        else:
-            self.__base_url = 'https://api.signaturit.com'
+                if delay is None:
+                    raise
 
-        self.__base_url += url
+                time.sleep(delay)
+                attempt += 1
+
+                continue
+
+            if info is not None and info.bytes_sent is None and response.request is not None:
+                info.bytes_sent = body_size(response.request.body)
+
+            delay = self._retry_response(method, attempt, response, info, sent, kwargs.get('stream', False))
+
+            if delay is None:
+                return response
+
+            response.close()
+
+            if response.status_code == 429 and self._rate_limiter is not None:
+                self._rate_limiter.hold(delay)
+            else:
+                time.sleep(delay)
+
+            attempt += 1
 
     def get_request(self):
-        response = requests.get(
-            self.__base_url,
-            headers=self.__headers)
+        if self._uses_cache():
+            return self.__cached_get_request()
+
+        response = self.__get()
 
-        return json.loads(response.text)
+        return self._load(response.content, response.status_code)
+
+    def __get(self, headers=None, etag=None):
+        """
+        Send a GET request, sharing the response of an identical request already in flight
+        """
+        if self._single_flight is None:
+            return self.__send('GET', headers=headers)
+
+        def send():
+            response = self.__send('GET', headers=headers)
+            response.content  # read the body before sharing the response
+
+            return response
+
+        return self._single_flight.do(self._flight_key(etag), send)
+
+    def __cached_get_request(self):
+        key, entry = self._cache_entry()
+
+        if entry is not None and entry.fresh():
+            return self._load(entry.body)
+
+        response = self.__get(*self._revalidation(entry))
+
+        return self._cached_result(key, entry, response)
 
     def post_request(self):
-        response = requests.post(
-            self.__base_url,
-            headers=self.__headers,
-            files=self.__files,
-            data=self.__params
-        )
+        if not self._files:
+            response = self.__send('POST', data=self._params)
+
+            return self._load(response.content, response.status_code)
+
+        with MultipartEncoder(self._params or {}, self._files.items()) as body:
+            headers = dict(self._headers)
+            headers['Content-Type'] = body.content_type
 
-        return json.loads(response.text)
+            response = self.__send('POST', headers=headers, data=body)
+
+        return self._load(response.content, response.status_code)
 
     def put_request(self):
-        raw = self.__files['files'].read()
+        raw = self._files['files'].read()
 
-        response = requests.put(
-            self.__base_url,
-            headers=self.__headers,
-            data=raw)
+        response = self.__send('PUT', data=raw)
 
-        return json.loads(response.text)
+        return self._load(response.content, response.status_code)
 
     def delete_request(self):
-        response = requests.delete(
-            self.__base_url,
-            headers=self.__headers)
+        response = self.__send('DELETE')
 
-        return json.loads(response.text)
+        return self._load(response.content, response.status_code)
 
     def patch_request(self):
-        response = requests.patch(
-            self.__base_url,
-            headers=self.__headers,
-            data=json.dumps(self.__params))
+        response = self.__send('PATCH', data=json.dumps(self._params))
 
-        return json.loads(response.text)
+        return self._load(response.content, response.status_code)
 
-    def file_request(self):
+    def file_request(self, destination=None, chunk_size=65536, checksum=False):
         """
         Request that retrieve a binary file
+        @destination: Path or writable file object to stream the file to, instead of returning it
+        @chunk_size: Bytes read per chunk when streaming
+        @checksum: Compute the SHA-256 of the streamed file
         """
-        response = requests.get(
-            self.__base_url,
-            headers=self.__headers,
-            stream=True)
+        response = self.__send('GET', stream=True)
+
+        if destination is None:
+            return response.raw.read(), response.headers
+
+        try:
+            if response.status_code >= 400:
+                return self._load(response.content, response.status_code), response.headers
+
+            with DownloadWriter(destination, checksum) as writer:
+                for chunk in response.iter_content(chunk_size):
+                    deadline.check()
+                    writer.write(chunk)
 
-        return response.raw.read(), response.headers
+            return writer.result(), response.headers
+        finally:
+            response.close()
@@ -0,0 +1,106 @@
+import contextlib
+import contextvars
+import time
+
+# Default (connect, read) timeouts in seconds. The read timeout bounds each wait for data, not the whole response
+DEFAULT_TIMEOUT = (10.0, 60.0)
+
+_deadline = contextvars.ContextVar('signaturit_deadline', default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """
+    The time budget of the operation ran out before the request could be sent or answered
+    """
+
+
+@contextlib.contextmanager
+def deadline(seconds):
+    """
+    Bound the total time of every request sent inside the block, retries and pages included:
+
+        with deadline(30):
+            signatures = list(client.iter_signatures())
+
+    Nested deadlines can only shorten the budget. The budget follows the iter_*, *_by_ids, BulkDownloader
+    and BatchSender worker threads, and the asyncio tasks started inside the block.
+    """
+    at = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(at if current is None else min(current, at))
+
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining():
+    """
+    @return Seconds left before the current deadline, None when there is no deadline
+    """
+    at = _deadline.get()
+
+    return None if at is None else at - time.monotonic()
+
+
+def check():
+    """
+    Raise DeadlineExceeded when the current deadline has passed
+    """
+    at = _deadline.get()
+
+    if at is not None and time.monotonic() >= at:
+        raise DeadlineExceeded('Deadline exceeded')
+
+
+def allows(seconds):
+    """
+    @return True when waiting the given seconds still leaves time before the current deadline
+    """
+    at = _deadline.get()
+
+    return at is None or time.monotonic() + seconds < at
+
+
+def clamp(timeout):
+    """
+    Shorten a timeout to the time left before the current deadline
+    @timeout: None, seconds or a (connect, read) tuple
+    @return The timeout, in the same shape
+    """
+    left = remaining()
+
+    if left is None:
+        return timeout
+
+    if left <= 0:
+        raise DeadlineExceeded('Deadline exceeded')
+
+    if timeout is None:
+        return left
+
+    if isinstance(timeout, tuple):
+        return tuple(left if value is None else min(value, left) for value in timeout)
+
+    return min(timeout, left)
+
+
+def propagate(function):
+    """
+    Wrap a callable sent to another thread so it runs under the deadline of the caller
+    """
+    at = _deadline.get()
+
+    if at is None:
+        return function
+
+    def wrapper(*args, **kwargs):
+        token = _deadline.set(at)
+
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _deadline.reset(token)
+
+    return wrapper
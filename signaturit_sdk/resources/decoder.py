@@ -0,0 +1,58 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def decode_json(body):
+    """
+    Parse a response body with the standard library, straight from bytes
+    """
+    return json.loads(body)
+
+
+def decode_orjson(body):
+    """
+    Parse a response body with orjson, several times faster on big list pages
+    """
+    return orjson.loads(body)
+
+
+def decode_raw(body):
+    """
+    Return the response body untouched, for callers forwarding the payload
+    """
+    return body
+
+
+DECODERS = {
+    'json': decode_json,
+    'orjson': decode_orjson,
+    'raw': decode_raw,
+}
+
+
+def get_decoder(decoder=None):
+    """
+    @decoder: None for the standard library, 'json', 'orjson', 'raw', 'fastest' (orjson when installed)
+    or a callable receiving the body bytes
+    @return The decoding callable
+    """
+    if decoder is None:
+        return decode_json
+
+    if callable(decoder):
+        return decoder
+
+    if decoder == 'fastest':
+        decoder = 'orjson' if orjson is not None else 'json'
+
+    if decoder not in DECODERS:
+        raise ValueError('Unknown decoder %s, use one of %s' % (decoder, ', '.join(sorted(DECODERS))))
+
+    if decoder == 'orjson' and orjson is None:
+        raise ImportError('The orjson decoder requires orjson, install it with `pip install orjson`')
+
+    return DECODERS[decoder]
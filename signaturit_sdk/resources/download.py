@@ -0,0 +1,42 @@
+import hashlib
+import os
+
+
+class DownloadWriter:
+    """
+    Writes a downloaded body chunk by chunk to a path or a writable file object,
+    optionally computing its SHA-256 on the fly
+    """
+    def __init__(self, destination, checksum=False):
+        self.__destination = destination
+        self.__owns_file = isinstance(destination, (str, bytes, os.PathLike))
+        self.__file = None
+        self.__hash = hashlib.sha256() if checksum else None
+        self.__size = 0
+
+    def __enter__(self):
+        self.__file = open(self.__destination, 'wb') if self.__owns_file else self.__destination
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.__owns_file:
+            self.__file.close()
+
+    def write(self, chunk):
+        self.__file.write(chunk)
+        self.__size += len(chunk)
+
+        if self.__hash is not None:
+            self.__hash.update(chunk)
+
+    def result(self):
+        """
+        @return A dict with the written bytes, the sha256 (when requested) and the path (for paths)
+        """
+        result = {'bytes': self.__size, 'sha256': self.__hash.hexdigest() if self.__hash is not None else None}
+
+        if self.__owns_file:
+            result['path'] = os.fspath(self.__destination)
+
+        return result
@@ -0,0 +1,395 @@
+import inspect
+from urllib.parse import urlencode
+
+from signaturit_sdk.models import Branding, Contact, Email, Group, SMS, Signature, Subscription, User
+
+REQUIRED = inspect.Parameter.empty
+
+REQUESTS = {
+    'GET': 'get_request',
+    'POST': 'post_request',
+    'PUT': 'put_request',
+    'DELETE': 'delete_request',
+    'PATCH': 'patch_request',
+}
+
+
+def encode_query(params):
+    """
+    Url encode query params, lists (ex: ids) are sent comma separated
+    """
+    return urlencode([(key, ','.join(map(str, value)) if isinstance(value, (list, tuple)) else value)
+                      for key, value in params.items()])
+
+
+class Endpoint:
+    """
+    Declaration of an API call, SignaturitClient builds a method for every endpoint of ENDPOINTS.
+
+    The method receives the path arguments, then limit and offset when paginated, then the filters
+    dict, then the body fields (or a single body dict), in this order.
+    """
+    __slots__ = ('name', 'method', 'path', 'args', 'paginated', 'filters', 'fields', 'optional', 'body', 'json',
+                 'cache', 'cache_condition', 'invalidates', 'model', 'doc', 'parameters', 'defaults', 'request')
+
+    def __init__(self, name, method, path, args=(), paginated=False, filters=None, fields=(), optional=False,
+                 body=None, json=False, cache=None, cache_condition=None, invalidates=(), model=None, doc=''):
+        """
+        @name: Name of the client method
+        @method: Http method
+        @path: Path template, formatted with the path arguments
+        @args: Names of the path arguments
+        @paginated: Send limit and offset in the query
+        @filters: Name of the argument with a dict of query filters
+        @fields: Names of the arguments sent as body fields
+        @optional: Fields default to None and are left out of the body when None
+        @body: Name of the argument sent as the whole body
+        @json: Send the body as json
+        @cache: ResponseCache group of the response
+        @cache_condition: Name of the client method deciding whether a response is cached
+        @invalidates: ResponseCache groups dropped by the call
+        @model: Model class of the result
+        @doc: Docstring of the method
+        """
+        self.name = name
+        self.method = method
+        self.path = path
+        self.args = args
+        self.paginated = paginated
+        self.filters = filters
+        self.fields = fields
+        self.optional = optional
+        self.body = body
+        self.json = json
+        self.cache = cache
+        self.cache_condition = cache_condition
+        self.invalidates = invalidates
+        self.model = model
+        self.doc = doc
+        self.request = REQUESTS[method]
+
+        self.parameters = list(args)
+        self.defaults = {}
+
+        if paginated:
+            self.parameters += ['limit', 'offset']
+            self.defaults.update(limit=100, offset=0)
+
+        if filters is not None:
+            self.parameters.append(filters)
+            self.defaults[filters] = {}
+
+        self.parameters += fields
+
+        if optional:
+            self.defaults.update((field, None) for field in fields)
+
+        if body is not None:
+            self.parameters.append(body)
+
+    def bind(self, args, kwargs):
+        """
+        @return A dict of argument values by name, like calling a function with this signature
+        """
+        if len(args) > len(self.parameters):
+            raise TypeError('%s() takes %d arguments but %d were given' % (self.name, len(self.parameters), len(args)))
+
+        values = dict(zip(self.parameters, args))
+
+        for key, value in kwargs.items():
+            if key not in self.parameters:
+                raise TypeError('%s() got an unexpected keyword argument %r' % (self.name, key))
+
+            if key in values:
+                raise TypeError('%s() got multiple values for argument %r' % (self.name, key))
+
+            values[key] = value
+
+        if len(values) < len(self.parameters):
+            for name in self.parameters:
+                if name not in values:
+                    if name not in self.defaults:
+                        raise TypeError('%s() missing required argument %r' % (self.name, name))
+
+                    values[name] = self.defaults[name]
+
+        return values
+
+    def url(self, values):
+        """
+        @return The path with its arguments and encoded query
+        """
+        path = self.path % tuple(values[name] for name in self.args) if self.args else self.path
+
+        if not self.paginated and self.filters is None:
+            return path
+
+        query = {'limit': values['limit'], 'offset': values['offset']} if self.paginated else {}
+
+        if self.filters is not None:
+            query.update(values[self.filters])
+
+        return '%s?%s' % (path, encode_query(query)) if query else path
+
+    def params(self, values):
+        """
+        @return The request body, or None
+        """
+        if self.body is not None:
+            return values[self.body]
+
+        if not self.fields:
+            return None
+
+        if self.optional:
+            return dict((field, values[field]) for field in self.fields if values[field] is not None)
+
+        return dict((field, values[field]) for field in self.fields)
+
+    def signature(self):
+        parameters = [inspect.Parameter('self', inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+        parameters += [inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                                         default=self.defaults.get(name, REQUIRED)) for name in self.parameters]
+
+        return inspect.Signature(parameters)
+
+
+def make_method(endpoint):
+    """
+    Build the client method of an endpoint, it calls client._call(endpoint, values)
+    """
+    def method(self, *args, **kwargs):
+        return self._call(endpoint, endpoint.bind(args, kwargs))
+
+    method.__name__ = endpoint.name
+    method.__qualname__ = 'SignaturitClient.%s' % endpoint.name
+    method.__doc__ = endpoint.doc
+    method.__signature__ = endpoint.signature()
+
+    return method
+
+
+ENDPOINTS = (
+    # Signatures
+    Endpoint('get_signatures', 'GET', '/v3/signatures.json', paginated=True, filters='conditions', model=Signature,
+             doc='''
+        Get all signatures
+        @conditions: Filters, ex: {'status': 3, 'since': '2014-07-20', 'ids': ['ID1', 'ID2'], 'crm_id': 'CUSTOM_ID'}
+        '''),
+    Endpoint('get_signature', 'GET', '/v3/signatures/%s.json', args=('signature_id',), cache='signatures',
+             cache_condition='_is_finished', model=Signature, doc='''
+        Get a concrete Signature
+        @return Signature data
+        '''),
+    Endpoint('count_signatures', 'GET', '/v3/signatures/count.json', filters='conditions', doc='''
+        Count all signatures
+        '''),
+    Endpoint('cancel_signature', 'PATCH', '/v3/signatures/%s/cancel.json', args=('signature_id',),
+             invalidates=('signatures',), model=Signature, doc='''
+        Cancel a concrete Signature
+        @signature_id: Id of signature
+        @return Signature data
+        '''),
+    Endpoint('send_signature_reminder', 'POST', '/v3/signatures/%s/reminder.json', args=('signature_id',),
+             invalidates=('signatures',), doc='''
+        Send a reminder email
+        @signature_id: Id of signature
+        '''),
+
+    # Brandings
+    Endpoint('get_branding', 'GET', '/v3/brandings/%s.json', args=('branding_id',), cache='brandings', model=Branding,
+             doc='''
+        Get a concrete branding
+        @branding_id: Id of the branding to fetch
+        @return Branding
+        '''),
+    Endpoint('get_brandings', 'GET', '/v3/brandings.json', cache='brandings', model=Branding, doc='''
+        Get all account brandings
+        @return List of brandings
+        '''),
+    Endpoint('create_branding', 'POST', '/v3/brandings.json', body='params', json=True, invalidates=('brandings',),
+             model=Branding, doc='''
+        Create a new branding
+        @params: An array of params (all params are optional)
+            - layout: Default color for all application widgets (hex code)
+            - text: Default text color for all application widgets (hex code)
+            - application_texts: A dict with the new text values
+            - sign_button: Text for sign button
+            - send_button: Text for send button
+            - decline_button: Text for decline button:
+            - decline_modal_title: Title for decline modal (when you click decline button)
+            - decline_modal_body: Body for decline modal (when you click decline button)
+            - photo: Photo message text, which tells the user that a photo is needed in the current process
+            - multi_pages: Header of the document, which tells the user the number of pages to sign
+            ex: { 'photo': 'Hey! Take a photo of yourself to validate the process!'}
+        '''),
+    Endpoint('update_branding', 'PATCH', '/v3/brandings/%s.json', args=('branding_id',), body='params', json=True,
+             invalidates=('brandings',), model=Branding, doc='''
+        Update a existing branding
+        @branding_id: Id of the branding to update
+        @params: Same params as method create_branding, see above
+        @return: A dict with updated branding data
+        '''),
+
+    # Templates
+    Endpoint('get_templates', 'GET', '/v3/templates.json', paginated=True, cache='templates', doc='''
+        Get all account templates
+        '''),
+
+    # Certified emails
+    Endpoint('get_emails', 'GET', '/v3/emails.json', paginated=True, filters='conditions', model=Email, doc='''
+        Get all certified emails
+        '''),
+    Endpoint('count_emails', 'GET', '/v3/emails/count.json', filters='conditions', doc='''
+        Count all certified emails
+        '''),
+    Endpoint('get_email', 'GET', '/v3/emails/%s.json', args=('email_id',), model=Email, doc='''
+        Get a specific email
+        '''),
+
+    # Certified sms
+    Endpoint('get_SMS', 'GET', '/v3/sms.json', paginated=True, filters='conditions', model=SMS, doc='''
+        Get all certified sms
+        '''),
+    Endpoint('count_SMS', 'GET', '/v3/sms/count.json', filters='conditions', doc='''
+        Count all certified sms
+        '''),
+    Endpoint('get_single_SMS', 'GET', '/v3/sms/%s.json', args=('sms_id',), model=SMS, doc='''
+        Get a specific sms
+        '''),
+
+    # Team
+    Endpoint('get_users', 'GET', '/v3/team/users.json', paginated=True, model=User, doc='''
+        Get all users from your current team
+        '''),
+    Endpoint('get_seats', 'GET', '/v3/team/seats.json', paginated=True, doc='''
+        Get all seats from your current team
+        '''),
+    Endpoint('get_user', 'GET', '/v3/team/users/%s.json', args=('user_id',), cache='users', model=User, doc='''
+        Get a single user
+        '''),
+    Endpoint('invite_user', 'POST', '/v3/team/users.json', fields=('email', 'role'), invalidates=('users', 'groups'),
+             doc='''
+        Send an invitation to email with a link to join your team
+        :param email: Email to add to your team
+        :param role: Can be admin or member
+        '''),
+    Endpoint('change_user_role', 'PATCH', '/v3/team/users/%s.json', args=('user_id',), fields=('role',),
+             invalidates=('users', 'groups'), model=User, doc='''
+        Change role of current user
+        :param user_id: Id of user
+        :param role: Can be admin or member
+        '''),
+    Endpoint('remove_user', 'DELETE', '/v3/team/users/%s.json', args=('user_id',), invalidates=('users', 'groups'),
+             doc='''
+        Remove a user from your team
+        :param user_id: Id of user
+        '''),
+    Endpoint('remove_seat', 'DELETE', '/v3/team/seats/%s.json', args=('seat_id',), doc='''
+        Remove a seat from your team
+        :param seat_id: Id of user
+        '''),
+    Endpoint('get_groups', 'GET', '/v3/team/groups.json', paginated=True, model=Group, doc='''
+        Get all groups from your current team
+        '''),
+    Endpoint('get_group', 'GET', '/v3/team/groups/%s.json', args=('group_id',), cache='groups', model=Group, doc='''
+        Get a single group
+        '''),
+    Endpoint('create_group', 'POST', '/v3/team/groups.json', fields=('name',), invalidates=('groups', 'users'),
+             model=Group, doc='''
+        Create group
+        :param name: Group name
+        '''),
+    Endpoint('update_group', 'PATCH', '/v3/team/groups/%s.json', args=('group_id',), fields=('name',), json=True,
+             invalidates=('groups', 'users'), model=Group, doc='''
+        Change group name
+        :param group_id: Id of group
+        :param name: Group name
+        '''),
+    Endpoint('delete_group', 'DELETE', '/v3/team/groups/%s.json', args=('group_id',), invalidates=('groups', 'users'),
+             doc='''
+        Remove a group from your team
+        :param group_id: Id of group
+        '''),
+    Endpoint('add_member_to_group', 'POST', '/v3/team/groups/%s/members/%s.json', args=('group_id', 'user_id'),
+             invalidates=('groups', 'users'), doc='''
+        Add a user to a group as a member
+        :param group_id:
+        :param user_id:
+        '''),
+    Endpoint('remove_member_from_group', 'DELETE', '/v3/team/groups/%s/members/%s.json', args=('group_id', 'user_id'),
+             invalidates=('groups', 'users'), doc='''
+        Remove a user from the members of a group
+        :param group_id:
+        :param user_id:
+        '''),
+    Endpoint('add_manager_to_group', 'POST', '/v3/team/groups/%s/managers/%s.json', args=('group_id', 'user_id'),
+             invalidates=('groups', 'users'), doc='''
+        Add a user to a group as a manager
+        :param group_id:
+        :param user_id:
+        '''),
+    Endpoint('remove_manager_from_group', 'DELETE', '/v3/team/groups/%s/managers/%s.json',
+             args=('group_id', 'user_id'), invalidates=('groups', 'users'), doc='''
+        Remove a user from the managers of a group
+        :param group_id:
+        :param user_id:
+        '''),
+
+    # Subscriptions
+    Endpoint('get_subscriptions', 'GET', '/v3/subscriptions.json', paginated=True, filters='params',
+             model=Subscription, doc='''
+        Get all subscriptions
+        '''),
+    Endpoint('count_subscriptions', 'GET', '/v3/subscriptions/count.json', filters='params', doc='''
+        Count all subscriptions
+        '''),
+    Endpoint('get_subscription', 'GET', '/v3/subscriptions/%s.json', args=('subscription_id',),
+             cache='subscriptions', model=Subscription, doc='''
+        Get single subscription
+        '''),
+    Endpoint('create_subscription', 'POST', '/v3/subscriptions.json', fields=('url', 'events'), json=True,
+             invalidates=('subscriptions',), model=Subscription, doc='''
+        Create subscription
+        :param events: Events to subscribe
+        :param url: Url to send events
+        '''),
+    Endpoint('update_subscription', 'PATCH', '/v3/subscriptions/%s.json', args=('subscription_id',),
+             fields=('url', 'events'), optional=True, json=True, invalidates=('subscriptions',), model=Subscription,
+             doc='''
+        Update subscription
+        :param subscription_id: Subscription to update
+        :param events: Events to subscribe
+        :param url: Url to send events
+        '''),
+    Endpoint('delete_subscription', 'DELETE', '/v3/subscriptions/%s.json', args=('subscription_id',),
+             invalidates=('subscriptions',), doc='''
+        Delete single subscription
+        '''),
+
+    # Contacts
+    Endpoint('get_contacts', 'GET', '/v3/contacts.json', paginated=True, filters='params', model=Contact, doc='''
+        Get all account contacts
+        '''),
+    Endpoint('get_contact', 'GET', '/v3/contacts/%s.json', args=('contact_id',), cache='contacts', model=Contact,
+             doc='''
+        Get single contact
+        '''),
+    Endpoint('create_contact', 'POST', '/v3/contacts.json', fields=('email', 'name'), json=True,
+             invalidates=('contacts',), model=Contact, doc='''
+        Create a new contact
+        :param email: user email
+        :param name: user name
+        '''),
+    Endpoint('update_contact', 'PATCH', '/v3/contacts/%s.json', args=('contact_id',), fields=('email', 'name'),
+             optional=True, json=True, invalidates=('contacts',), model=Contact, doc='''
+        Update a current contact
+        :param contact_id: contact id
+        :param email: user email
+        :param name: user name
+        '''),
+    Endpoint('delete_contact', 'DELETE', '/v3/contacts/%s.json', args=('contact_id',), invalidates=('contacts',),
+             doc='''
+        Delete single contact
+        '''),
+)
@@ -0,0 +1,151 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class RequestInfo:
+    """
+    What is known about a request while it goes through its lifecycle, passed to every hook.
+    Times are in seconds, measured with time.perf_counter.
+    """
+    __slots__ = ('method', 'endpoint', 'url', 'attempt', 'status', 'error', 'bytes_sent', 'bytes_received',
+                 'started', 'queued', 'elapsed', 'total', 'headers', 'body', 'response_headers', 'response_body')
+
+    def __init__(self, method, endpoint, url, bytes_sent, started, headers=None, body=None):
+        # Http method
+        self.method = method
+        # Path template of the endpoint, ex: /v3/signatures/%s.json
+        self.endpoint = endpoint
+        # Requested url
+        self.url = url
+        # 0 for the first try, then 1, 2... on retries
+        self.attempt = 0
+        # Status code of the last response, None when none was received
+        self.status = None
+        # Exception raised by the last attempt
+        self.error = None
+        # Body bytes sent by each attempt, None when unknown
+        self.bytes_sent = bytes_sent
+        # Body bytes received, None when unknown (ex: streamed downloads without Content-Length)
+        self.bytes_received = None
+        # When the call started
+        self.started = started
+        # Seconds waited for the rate limiter by the last attempt
+        self.queued = 0.0
+        # Seconds from sending the last attempt to receiving its response
+        self.elapsed = 0.0
+        # Seconds since the call started, including retries and backoff
+        self.total = 0.0
+        # Request headers and body, as given to the http library
+        self.headers = headers
+        self.body = body
+        # Headers of the last response
+        self.response_headers = None
+        # Body of the final response, None when streamed
+        self.response_body = None
+
+    def __repr__(self):
+        return '<RequestInfo %s %s attempt=%d status=%s total=%.3fs>' % (
+            self.method, self.endpoint, self.attempt, self.status, self.total)
+
+
+class Hooks:
+    """
+    Request lifecycle hooks, subclass it and override the ones you need:
+
+        class SlowRequests(Hooks):
+            def after_response(self, info):
+                if info.total > 1:
+                    logger.warning('%s %s took %.1fs', info.method, info.endpoint, info.total)
+
+        client = SignaturitClient('TOKEN', hooks=SlowRequests())
+
+    Hooks run in the thread (or event loop) sending the request, keep them fast.
+    Exceptions raised by a hook are logged and ignored.
+    """
+    def before_send(self, info):
+        """
+        Called before every attempt, once the rate limiter let it go
+        """
+
+    def after_response(self, info):
+        """
+        Called once per call with its final response, whatever its status code
+        """
+
+    def on_error(self, info):
+        """
+        Called once per call when it fails: info.error is set when no response was received,
+        otherwise info.status is 400 or more
+        """
+
+    def on_retry(self, info, delay):
+        """
+        Called when an attempt failed and is retried after delay seconds
+        """
+
+
+class HookList(Hooks):
+    """
+    Several hooks called in order
+    """
+    def __init__(self, hooks):
+        self.hooks = list(hooks)
+
+    def before_send(self, info):
+        for hook in self.hooks:
+            hook.before_send(info)
+
+    def after_response(self, info):
+        for hook in self.hooks:
+            hook.after_response(info)
+
+    def on_error(self, info):
+        for hook in self.hooks:
+            hook.on_error(info)
+
+    def on_retry(self, info, delay):
+        for hook in self.hooks:
+            hook.on_retry(info, delay)
+
+
+def as_hooks(hooks):
+    """
+    @hooks: None, a Hooks or a list of them
+    @return None or a single Hooks
+    """
+    if hooks is None or isinstance(hooks, Hooks):
+        return hooks
+
+    hooks = list(hooks)
+
+    return HookList(hooks) if hooks else None
+
+
+def call_hook(hooks, name, *args):
+    try:
+        getattr(hooks, name)(*args)
+    except Exception:
+        logger.exception('Error in %s hook', name)
+
+
+def body_size(body):
+    """
+    @return The length of a request body, or None when unknown
+    """
+    if body is None:
+        return 0
+
+    if isinstance(body, (bytes, bytearray, str)):
+        return len(body)
+
+    return getattr(body, 'len', None)
+
+
+def response_size(response, streamed):
+    if not streamed:
+        return len(response.content)
+
+    length = response.headers.get('Content-Length')
+
+    return int(length) if length is not None and length.isdigit() else None
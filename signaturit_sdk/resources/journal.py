@@ -0,0 +1,202 @@
+import collections
+import json
+import threading
+import time
+from collections.abc import Mapping
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from signaturit_sdk.resources.hooks import Hooks
+
+REDACTED = '[REDACTED]'
+SECRET_HEADERS = frozenset(['authorization', 'cookie', 'set-cookie', 'proxy-authorization'])
+SECRET_PARAMS = frozenset(['token', 'access_token', 'api_key', 'apikey', 'password'])
+
+
+class Journal(Hooks):
+    """
+    Keeps the last requests sent by a client in a fixed size ring buffer, to find out what happened
+    around a latency spike or an error:
+
+        journal = Journal(size=500)
+        client = SignaturitClient('TOKEN', hooks=journal)
+        ...
+        journal.dump('signaturit.har')
+
+    Every attempt is recorded, retried ones included. Credentials are redacted and bodies truncated,
+    so memory stays bounded whatever the load. Without it no request is recorded nor timed.
+    """
+    def __init__(self, size=1000, max_body=4096):
+        """
+        @size: Entries kept, the oldest ones are dropped first
+        @max_body: Bytes of request and response bodies kept per entry, 0 to drop them
+        """
+        self.size = size
+        self.max_body = max_body
+
+        self.__entries = collections.deque(maxlen=size)
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def on_retry(self, info, delay):
+        self.__record(info)
+
+    def after_response(self, info):
+        self.__record(info)
+
+    def on_error(self, info):
+        if info.error is not None:
+            self.__record(info)
+
+    def __record(self, info):
+        entry = (time.time() - info.elapsed - info.queued, info.method, info.url, info.endpoint, info.attempt,
+                 self.redact_headers(info.headers), self.__truncate(info.body), info.bytes_sent,
+                 info.status, self.redact_headers(info.response_headers), self.__truncate(info.response_body),
+                 info.bytes_received, repr(info.error) if info.error is not None else None,
+                 info.queued, info.elapsed)
+
+        with self.__lock:
+            self.__entries.append(entry)
+
+    def __truncate(self, body):
+        if body is None or not self.max_body:
+            return None
+
+        if isinstance(body, Mapping):
+            body = urlencode(self.redact_params(body.items()))
+
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        elif not isinstance(body, (bytes, bytearray)):
+            return None
+
+        return bytes(body[:self.max_body])
+
+    @staticmethod
+    def redact_headers(headers):
+        if headers is None:
+            return None
+
+        return [(name, REDACTED if name.lower() in SECRET_HEADERS else value) for name, value in headers.items()]
+
+    @staticmethod
+    def redact_params(params):
+        return [(name, REDACTED if name.lower() in SECRET_PARAMS else value) for name, value in params]
+
+    @classmethod
+    def redact_url(cls, url):
+        parts = urlsplit(url)
+
+        if not parts.query:
+            return url
+
+        query = urlencode(cls.redact_params(parse_qsl(parts.query, keep_blank_values=True)), safe=',[]')
+
+        return urlunsplit((parts.scheme, parts.netloc, parts.path, query, parts.fragment))
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    def entries(self):
+        """
+        @return The recorded requests, oldest first, as dicts
+        """
+        with self.__lock:
+            entries = list(self.__entries)
+
+        return [{
+            'started': started,
+            'method': method,
+            'url': self.redact_url(url),
+            'endpoint': endpoint,
+            'attempt': attempt,
+            'request_headers': headers,
+            'request_body': body,
+            'bytes_sent': sent,
+            'status': status,
+            'response_headers': response_headers,
+            'response_body': response_body,
+            'bytes_received': received,
+            'error': error,
+            'queued': queued,
+            'elapsed': elapsed,
+        } for (started, method, url, endpoint, attempt, headers, body, sent, status, response_headers,
+               response_body, received, error, queued, elapsed) in entries]
+
+    def har(self):
+        """
+        @return The recorded requests in the HAR 1.2 format, bodies decoded as utf-8
+        """
+        return {'log': {
+            'version': '1.2',
+            'creator': {'name': 'signaturit-python-sdk', 'version': '1.1.0'},
+            'entries': [self.__har_entry(entry) for entry in self.entries()],
+        }}
+
+    @staticmethod
+    def __har_entry(entry):
+        def headers(items):
+            return [{'name': name, 'value': str(value)} for name, value in items or ()]
+
+        def content_type(items):
+            return next((str(value) for name, value in items or () if name.lower() == 'content-type'), '')
+
+        def text(body):
+            return body.decode('utf-8', 'replace') if body is not None else ''
+
+        request = {
+            'method': entry['method'],
+            'url': entry['url'],
+            'httpVersion': 'HTTP/1.1',
+            'headers': headers(entry['request_headers']),
+            'queryString': [{'name': name, 'value': value}
+                            for name, value in parse_qsl(urlsplit(entry['url']).query, keep_blank_values=True)],
+            'cookies': [],
+            'headersSize': -1,
+            'bodySize': entry['bytes_sent'] if entry['bytes_sent'] is not None else -1,
+        }
+
+        if entry['request_body'] is not None:
+            request['postData'] = {'mimeType': content_type(entry['request_headers']),
+                                   'text': text(entry['request_body'])}
+
+        received = entry['bytes_received'] if entry['bytes_received'] is not None else -1
+
+        return {
+            'startedDateTime': time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(entry['started'])) +
+            '.%03dZ' % (entry['started'] % 1 * 1000),
+            'time': (entry['queued'] + entry['elapsed']) * 1000,
+            'request': request,
+            'response': {
+                'status': entry['status'] or 0,
+                'statusText': '',
+                'httpVersion': 'HTTP/1.1',
+                'headers': headers(entry['response_headers']),
+                'cookies': [],
+                'content': {'size': received, 'mimeType': content_type(entry['response_headers']),
+                            'text': text(entry['response_body'])},
+                'redirectURL': '',
+                'headersSize': -1,
+                'bodySize': received,
+            },
+            'cache': {},
+            'timings': {'blocked': entry['queued'] * 1000, 'send': 0, 'wait': entry['elapsed'] * 1000, 'receive': 0},
+            '_endpoint': entry['endpoint'],
+            '_attempt': entry['attempt'],
+            '_error': entry['error'],
+        }
+
+    def dump(self, destination):
+        """
+        Write the recorded requests as a HAR file
+        @destination: Path or writable text file object
+        """
+        if hasattr(destination, 'write'):
+            json.dump(self.har(), destination, indent=2)
+
+            return
+
+        with open(destination, 'w') as file:
+            json.dump(self.har(), file, indent=2)
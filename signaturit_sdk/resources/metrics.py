@@ -0,0 +1,168 @@
+import bisect
+import threading
+
+from signaturit_sdk.resources.hooks import Hooks
+
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class _Endpoint:
+    __slots__ = ('buckets', 'count', 'sum', 'max', 'statuses', 'errors', 'retries', 'bytes_sent', 'bytes_received')
+
+    def __init__(self, size):
+        self.buckets = [0] * (size + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.statuses = {}
+        self.errors = {}
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+
+class Metrics(Hooks):
+    """
+    Aggregates the latency, status codes, errors, retries and bytes of every call by endpoint.
+    Pass it as a client hook and read it whenever you want:
+
+        metrics = Metrics()
+        client = SignaturitClient('TOKEN', hooks=metrics)
+        ...
+        metrics.snapshot()      # dict
+        metrics.prometheus()    # prometheus text exposition format
+
+    Latencies are kept in fixed histogram buckets, so memory does not grow with the number of calls.
+    """
+    def __init__(self, buckets=BUCKETS):
+        """
+        @buckets: Upper bounds in seconds of the latency histogram buckets, sorted
+        """
+        self.bounds = tuple(buckets)
+
+        self.__endpoints = {}
+        self.__lock = threading.Lock()
+
+    def __get(self, info):
+        key = (info.method, info.endpoint)
+        endpoint = self.__endpoints.get(key)
+
+        if endpoint is None:
+            endpoint = self.__endpoints[key] = _Endpoint(len(self.bounds))
+
+        return endpoint
+
+    def after_response(self, info):
+        with self.__lock:
+            endpoint = self.__get(info)
+            endpoint.buckets[bisect.bisect_left(self.bounds, info.total)] += 1
+            endpoint.count += 1
+            endpoint.sum += info.total
+            endpoint.max = max(endpoint.max, info.total)
+            endpoint.statuses[info.status] = endpoint.statuses.get(info.status, 0) + 1
+            endpoint.bytes_sent += info.bytes_sent or 0
+            endpoint.bytes_received += info.bytes_received or 0
+
+    def on_error(self, info):
+        error = str(info.status) if info.error is None else type(info.error).__name__
+
+        with self.__lock:
+            errors = self.__get(info).errors
+            errors[error] = errors.get(error, 0) + 1
+
+    def on_retry(self, info, delay):
+        with self.__lock:
+            self.__get(info).retries += 1
+
+    def reset(self):
+        with self.__lock:
+            self.__endpoints.clear()
+
+    def quantile(self, buckets, count, q, maximum):
+        """
+        Estimate a quantile from histogram bucket counts, interpolating inside the bucket
+        """
+        if not count:
+            return None
+
+        rank = q * count
+        seen = 0
+
+        for index, bucket in enumerate(buckets):
+            if seen + bucket >= rank and bucket:
+                lower = self.bounds[index - 1] if index else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else maximum
+
+                return min(maximum, lower + (upper - lower) * (rank - seen) / bucket)
+
+            seen += bucket
+
+        return maximum
+
+    def snapshot(self):
+        """
+        @return A list with a dict of metrics by endpoint, slowest p99 first
+        """
+        with self.__lock:
+            items = [(key, list(endpoint.buckets), endpoint.count, endpoint.sum, endpoint.max, dict(endpoint.statuses),
+                      dict(endpoint.errors), endpoint.retries, endpoint.bytes_sent, endpoint.bytes_received)
+                     for key, endpoint in self.__endpoints.items()]
+
+        result = []
+
+        for (method, path), buckets, count, total, maximum, statuses, errors, retries, sent, received in items:
+            result.append({
+                'method': method,
+                'endpoint': path,
+                'count': count,
+                'errors': errors,
+                'retries': retries,
+                'statuses': statuses,
+                'bytes_sent': sent,
+                'bytes_received': received,
+                'sum': total,
+                'mean': total / count if count else None,
+                'max': maximum,
+                'p50': self.quantile(buckets, count, 0.5, maximum),
+                'p90': self.quantile(buckets, count, 0.9, maximum),
+                'p99': self.quantile(buckets, count, 0.99, maximum),
+                'buckets': dict(zip([str(bound) for bound in self.bounds] + ['+Inf'], buckets)),
+            })
+
+        result.sort(key=lambda item: item['p99'] or 0, reverse=True)
+
+        return result
+
+    def prometheus(self, prefix='signaturit'):
+        """
+        @return The metrics in the prometheus text exposition format
+        """
+        lines = [
+            '# TYPE %s_request_duration_seconds histogram' % prefix,
+        ]
+        counters = []
+
+        for item in self.snapshot():
+            labels = 'method="%s",endpoint="%s"' % (item['method'], item['endpoint'].replace('"', '\\"'))
+            cumulative = 0
+
+            for bound, count in item['buckets'].items():
+                cumulative += count
+                lines.append('%s_request_duration_seconds_bucket{%s,le="%s"} %d' % (prefix, labels, bound, cumulative))
+
+            lines.append('%s_request_duration_seconds_sum{%s} %f' % (prefix, labels, item['sum']))
+            lines.append('%s_request_duration_seconds_count{%s} %d' % (prefix, labels, item['count']))
+
+            for error, count in sorted(item['errors'].items()):
+                counters.append(('errors_total', '%s,error="%s"' % (labels, error), count))
+
+            counters.append(('retries_total', labels, item['retries']))
+            counters.append(('sent_bytes_total', labels, item['bytes_sent']))
+            counters.append(('received_bytes_total', labels, item['bytes_received']))
+
+        for name in ('errors_total', 'retries_total', 'sent_bytes_total', 'received_bytes_total'):
+            lines.append('# TYPE %s_%s counter' % (prefix, name))
+            lines.extend('%s_%s{%s} %d' % (prefix, name, labels, value)
+                         for counter, labels, value in counters if counter == name)
+
+        return '\n'.join(lines) + '\n'
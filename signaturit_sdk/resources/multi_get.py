@@ -0,0 +1,82 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from signaturit_sdk.resources.deadline import propagate
+
+# Room kept for the scheme, host, limit, offset and ids parameter names
+URL_OVERHEAD = 100
+
+
+def chunk_ids(ids, base_length, max_url_length=2000, max_ids=100):
+    """
+    Split ids in chunks whose comma joined query string fits in the url
+    @ids: Ids to split, duplicates are dropped
+    @base_length: Length of the url without the ids
+    @max_url_length: Max length of the whole url
+    @max_ids: Max ids in a chunk, the page size of the request
+    @return A list of lists of ids
+    """
+    budget = max_url_length - base_length - URL_OVERHEAD
+    chunks = []
+    chunk = []
+    length = 0
+
+    for item in dict.fromkeys(ids):
+        item = str(item)
+        # escaped comma separator
+        size = len(item) + 3
+
+        if size > budget:
+            raise ValueError('Id %s does not fit in a %d characters url' % (item, max_url_length))
+
+        if chunk and (length + size > budget or len(chunk) >= max_ids):
+            chunks.append(chunk)
+            chunk = []
+            length = 0
+
+        chunk.append(item)
+        length += size
+
+    if chunk:
+        chunks.append(chunk)
+
+    return chunks
+
+
+def merge_by_id(pages):
+    results = {}
+
+    for page in pages:
+        if not isinstance(page, list):
+            raise ValueError('Expected a list of results, got: %r' % (page,))
+
+        for item in page:
+            results[item['id']] = item
+
+    return results
+
+
+def fetch_by_ids(fetch, chunks, workers=4):
+    """
+    Fetch every chunk concurrently and merge the results
+    @fetch: Callable receiving a list of ids and returning a page (list)
+    @return A dict of results by id
+    """
+    if len(chunks) <= 1:
+        return merge_by_id(fetch(chunk) for chunk in chunks)
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        return merge_by_id(executor.map(propagate(fetch), chunks))
+
+
+async def afetch_by_ids(fetch, chunks, workers=4):
+    """
+    asyncio version of fetch_by_ids, fetch must return an awaitable
+    """
+    semaphore = asyncio.Semaphore(workers)
+
+    async def bounded(chunk):
+        async with semaphore:
+            return await fetch(chunk)
+
+    return merge_by_id(await asyncio.gather(*[bounded(chunk) for chunk in chunks]))
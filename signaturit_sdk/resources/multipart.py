@@ -0,0 +1,234 @@
+import asyncio
+import mimetypes
+import os
+import uuid
+
+# Percent encoding of the characters that would break a quoted Content-Disposition parameter, as urllib3 does
+_PARAM_ESCAPES = {10: '%0A', 13: '%0D', 34: '%22'}
+
+
+def _quote(value):
+    if isinstance(value, bytes):
+        value = value.decode('utf-8')
+
+    return '"%s"' % str(value).translate(_PARAM_ESCAPES)
+
+
+class MultipartEncoder:
+    """
+    A multipart/form-data body that is produced chunk by chunk while it is being sent, so files are never
+    fully loaded in memory. It can be read as a file object, iterated, or async iterated.
+
+    File sources can be paths, binary file objects, bytes, bytearrays or memoryviews, optionally wrapped
+    in a (filename, source) tuple. Files opened from paths are closed as soon as they are sent, or by close().
+    """
+    def __init__(self, fields, files, chunk_size=65536):
+        """
+        @fields: A dict of form field names and values
+        @files: A list of (field name, source) tuples
+        @chunk_size: Bytes read from each file at a time
+        """
+        self.boundary = uuid.uuid4().hex
+        self.content_type = 'multipart/form-data; boundary=%s' % self.boundary
+        self.chunk_size = chunk_size
+
+        self.__parts = []
+        self.__opened = []
+        self.__chunks = None
+        self.__buffer = b''
+        self.__position = 0
+
+        for name, value in fields.items():
+            if value is None:
+                continue  # as the requests encoder, None fields are left out
+
+            if not isinstance(value, bytes):
+                value = str(value).encode('utf-8')
+
+            self.__parts.append((self.__header(name), value))
+
+        for name, source in files:
+            filename, source = source if isinstance(source, tuple) else (None, source)
+            filename = filename or self.__filename(source, name)
+
+            self.__parts.append((self.__header(name, filename), source))
+
+        self.__end = ('--%s--\r\n' % self.boundary).encode('utf-8')
+
+        # Total body size, None when a file object is not seekable and the body has to be sent chunked
+        self.len = self.__length()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __iter__(self):
+        try:
+            for part_header, source in self.__parts:
+                yield part_header
+
+                if isinstance(source, (bytes, bytearray, memoryview)):
+                    for chunk in self.__read_buffer(source):
+                        yield chunk
+                else:
+                    for chunk in self.__read_file(source):
+                        yield chunk
+
+                yield b'\r\n'
+
+            yield self.__end
+        finally:
+            self.close()
+
+    async def __aiter__(self):
+        """
+        Same chunks as __iter__, files are opened and read in a worker thread not to block the event loop
+        """
+        try:
+            for part_header, source in self.__parts:
+                yield part_header
+
+                if isinstance(source, (bytes, bytearray, memoryview)):
+                    for chunk in self.__read_buffer(source):
+                        yield chunk
+                else:
+                    source = await asyncio.to_thread(self.__open, source)
+
+                    while True:
+                        chunk = await asyncio.to_thread(source.read, self.chunk_size)
+
+                        if not chunk:
+                            break
+
+                        yield chunk
+
+                    self.__release(source)
+
+                yield b'\r\n'
+
+            yield self.__end
+        finally:
+            self.close()
+
+    def read(self, size=-1):
+        if self.__chunks is None:
+            self.__chunks = iter(self)
+
+        pieces = []
+
+        while size != 0:
+            if self.__position >= len(self.__buffer):
+                self.__buffer, self.__position = next(self.__chunks, None), 0
+
+                if self.__buffer is None:
+                    self.__buffer = b''
+                    break
+
+            end = len(self.__buffer) if size < 0 else self.__position + size
+            piece = self.__buffer[self.__position:end]
+
+            self.__position += len(piece)
+            size -= len(piece) if size > 0 else 0
+            pieces.append(piece)
+
+        return b''.join(pieces)
+
+    def close(self):
+        """
+        Close every file opened by the encoder. File objects given by the caller are left open.
+        """
+        while self.__opened:
+            self.__opened.pop().close()
+
+    def __header(self, name, filename=None):
+        if filename is None:
+            header = 'Content-Disposition: form-data; name=%s\r\n\r\n' % _quote(name)
+        else:
+            content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+            header = 'Content-Disposition: form-data; name=%s; filename=%s\r\nContent-Type: %s\r\n\r\n' % (
+                _quote(name), _quote(filename), content_type)
+
+        return ('--%s\r\n' % self.boundary + header).encode('utf-8')
+
+    @staticmethod
+    def __filename(source, name):
+        if isinstance(source, (str, os.PathLike)):
+            return os.path.basename(os.fspath(source))
+
+        source_name = getattr(source, 'name', None)
+
+        if isinstance(source_name, str):
+            return os.path.basename(source_name)
+
+        return name
+
+    @staticmethod
+    def __size(source):
+        if isinstance(source, (bytes, bytearray)):
+            return len(source)
+
+        if isinstance(source, memoryview):
+            return source.nbytes
+
+        if isinstance(source, (str, os.PathLike)):
+            return os.path.getsize(source)
+
+        try:
+            position = source.tell()
+            end = source.seek(0, os.SEEK_END)
+            source.seek(position)
+        except (AttributeError, OSError, ValueError):
+            return None
+
+        return end - position
+
+    def __length(self):
+        length = len(self.__end)
+
+        for part_header, source in self.__parts:
+            size = self.__size(source)
+
+            if size is None:
+                return None
+
+            length += len(part_header) + size + 2
+
+        return length
+
+    def __read_buffer(self, source):
+        if isinstance(source, bytes):
+            yield source
+
+            return
+
+        view = memoryview(source).cast('B')
+
+        for index in range(0, len(view), self.chunk_size):
+            yield view[index:index + self.chunk_size].tobytes()
+
+    def __open(self, source):
+        if isinstance(source, (str, os.PathLike)):
+            source = open(source, 'rb')
+            self.__opened.append(source)
+
+        return source
+
+    def __release(self, source):
+        if source in self.__opened:
+            self.__opened.remove(source)
+            source.close()
+
+    def __read_file(self, source):
+        source = self.__open(source)
+
+        while True:
+            chunk = source.read(self.chunk_size)
+
+            if not chunk:
+                break
+
+            yield chunk
+
+        self.__release(source)
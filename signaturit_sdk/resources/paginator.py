@@ -0,0 +1,176 @@
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from signaturit_sdk.resources.deadline import propagate
+
+
+def _check_page(page):
+    if not isinstance(page, list):
+        raise ValueError('Expected a list of results, got: %r' % (page,))
+
+    return page
+
+
+def iter_pages(fetch, page_size=100, prefetch=True):
+    """
+    Lazily yield every item of a paginated endpoint, holding at most two pages in memory
+    @fetch: Callable receiving (limit, offset) and returning a page (list)
+    @page_size: Items requested per page
+    @prefetch: Fetch the next page in a background thread while the current one is consumed
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    pending = None
+    offset = 0
+
+    try:
+        page = _check_page(fetch(page_size, offset))
+
+        while True:
+            last = len(page) < page_size
+            offset += page_size
+
+            if executor is not None and not last:
+                pending = executor.submit(propagate(fetch), page_size, offset)
+
+            for item in page:
+                yield item
+
+            if last:
+                return
+
+            page = None
+
+            if pending is not None:
+                page, pending = _check_page(pending.result()), None
+            else:
+                page = _check_page(fetch(page_size, offset))
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+async def aiter_pages(fetch, page_size=100, prefetch=True):
+    """
+    asyncio version of iter_pages, fetch must return an awaitable
+    """
+    pending = None
+    offset = 0
+
+    try:
+        page = _check_page(await fetch(page_size, offset))
+
+        while True:
+            last = len(page) < page_size
+            offset += page_size
+
+            if prefetch and not last:
+                pending = asyncio.ensure_future(fetch(page_size, offset))
+
+            for item in page:
+                yield item
+
+            if last:
+                return
+
+            page = None
+
+            if pending is not None:
+                page, pending = _check_page(await pending), None
+            else:
+                page = _check_page(await fetch(page_size, offset))
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def _offsets(total, page_size):
+    if not isinstance(total, int):
+        raise ValueError('Expected a count, got: %r' % (total,))
+
+    return range(0, total, page_size)
+
+
+def iter_pages_concurrently(fetch, total, page_size=100, workers=4, ordered=True):
+    """
+    Yield every item of a paginated endpoint fetching up to `workers` pages at the same time
+    @fetch: Callable receiving (limit, offset) and returning a page (list)
+    @total: Number of items to fetch, usually the result of the matching count endpoint
+    @page_size: Items requested per page
+    @workers: Max pages requested concurrently
+    @ordered: Yield items in offset order, otherwise pages are yielded as soon as they arrive
+    """
+    offsets = iter(_offsets(total, page_size))
+    pending = deque()
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+
+    def submit():
+        for offset in offsets:
+            pending.append(executor.submit(propagate(fetch), page_size, offset))
+
+            return
+
+    try:
+        for _ in range(workers):
+            submit()
+
+        while pending:
+            if ordered:
+                future = pending.popleft()
+            else:
+                future = next(iter(wait(pending, return_when=FIRST_COMPLETED).done))
+                pending.remove(future)
+
+            page = _check_page(future.result())
+            submit()
+
+            for item in page:
+                yield item
+
+            page = None
+    finally:
+        for future in pending:
+            future.cancel()
+
+        executor.shutdown(wait=False)
+
+
+async def aiter_pages_concurrently(fetch, total, page_size=100, workers=4, ordered=True):
+    """
+    asyncio version of iter_pages_concurrently, fetch must return an awaitable
+    """
+    offsets = iter(_offsets(total, page_size))
+    pending = deque()
+
+    def submit():
+        for offset in offsets:
+            pending.append(asyncio.ensure_future(fetch(page_size, offset)))
+
+            return
+
+    try:
+        for _ in range(workers):
+            submit()
+
+        while pending:
+            if ordered:
+                future = pending.popleft()
+            else:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                future = next(iter(done))
+                pending.remove(future)
+
+            page = _check_page(await future)
+            submit()
+
+            for item in page:
+                yield item
+
+            page = None
+    finally:
+        for future in pending:
+            future.cancel()
@@ -1,3 +1,42 @@
+CONTAINERS = (dict, list)
+
+
+def _items(container):
+    return iter(container.items()) if isinstance(container, dict) else enumerate(container)
+
+
+def _is_container(value):
+    kind = type(value)
+
+    return kind is not str and kind is not int and isinstance(value, CONTAINERS)
+
+
+def _flatten(form_array, prefix, items):
+    """
+    Walk nested containers with an explicit stack, building every key once from its parent prefix
+    @prefix: Key prefix of the items, ending with '['
+    """
+    stack = []
+
+    while True:
+        for key, value in items:
+            key = f'{prefix}{key}]'
+
+            if _is_container(value):
+                stack.append((prefix, items))
+                prefix = key + '['
+                items = _items(value)
+
+                break
+
+            form_array[key] = value
+        else:
+            if not stack:
+                return
+
+            prefix, items = stack.pop()
+
+
 class Parser:
     """
     Parser: A class used to parse all the incoming data from user to a request-friendly format.
@@ -7,17 +46,20 @@ class Parser:
         pass
 
     def fill_array(self, form_array, parameters, parent):
-        iterable = parameters.items() if isinstance(parameters, dict) else enumerate(parameters)
+        """
+        Flatten nested dicts and lists in form keys, ex: {'a': [{'b': 1}]} -> {'a[0][b]': 1}
+        Any other value (strings, numbers, files, bytes, (filename, content) tuples) is kept as is.
+        @form_array: Dict filled with the flat keys
+        @parameters: Dict or list to flatten
+        @parent: Prefix of every key, '' for none
+        """
+        if parent:
+            _flatten(form_array, parent + '[', _items(parameters))
 
-        for key, value in iterable:
-            parent_key = "%s[%s]" % (parent, key) if len(parent) else key
+            return
 
-            if isinstance(value, dict):
-                self.fill_array(form_array, value, parent_key)
-            elif isinstance(value, list):
-                self.fill_array(form_array, value, parent_key)
+        for key, value in _items(parameters):
+            if _is_container(value):
+                _flatten(form_array, f'{key}[', _items(value))
             else:
-                if parent is 'files':
-                    value = open(value, 'rb')
-
-                form_array[parent_key] = value
\ No newline at end of file
+                form_array[key] = value
@@ -0,0 +1,52 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread safe token bucket shared by every request of a client.
+    Tokens are refilled at `rate` per second up to `capacity`, each request takes one.
+    """
+    def __init__(self, rate, capacity=None):
+        """
+        @rate: Sustained requests per second
+        @capacity: Max burst size, defaults to one second worth of requests
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1))
+
+        self.__tokens = self.capacity
+        self.__updated = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def __refill(self, now):
+        self.__tokens = min(self.capacity, self.__tokens + (now - self.__updated) * self.rate)
+        self.__updated = now
+
+    def reserve(self):
+        """
+        Take a token, possibly borrowed from the future
+        @return Seconds to wait before sending the request
+        """
+        with self.__lock:
+            self.__refill(time.monotonic())
+            self.__tokens -= 1
+
+            return 0.0 if self.__tokens >= 0 else -self.__tokens / self.rate
+
+    def acquire(self):
+        """
+        Block until a token is available
+        """
+        delay = self.reserve()
+
+        if delay > 0:
+            time.sleep(delay)
+
+    def hold(self, seconds):
+        """
+        Stop handing out tokens for the given seconds, used when the server asks us to slow down
+        """
+        with self.__lock:
+            self.__refill(time.monotonic())
+            self.__tokens = min(self.__tokens, -seconds * self.rate)
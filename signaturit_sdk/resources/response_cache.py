@@ -0,0 +1,89 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class CacheEntry:
+    __slots__ = ('group', 'body', 'etag', 'expires')
+
+    def __init__(self, group, body, etag, expires):
+        self.group = group
+        self.body = body
+        self.etag = etag
+        self.expires = expires
+
+    def fresh(self):
+        return time.monotonic() < self.expires
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache of GET response bodies, with a time to live per endpoint group.
+    Expired entries with an ETag are kept to revalidate them with a conditional request.
+    """
+    def __init__(self, max_entries=1024, ttl=300, ttls=None):
+        """
+        @max_entries: Max responses kept
+        @ttl: Default seconds a response is fresh
+        @ttls: A dict of seconds by group, ex: {'templates': 3600, 'signatures': 86400}
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.ttls = ttls or {}
+
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def get(self, key):
+        """
+        @return The CacheEntry for the key, fresh or not, or None
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            if entry is None:
+                return None
+
+            if not entry.fresh() and entry.etag is None:
+                del self.__entries[key]
+
+                return None
+
+            self.__entries.move_to_end(key)
+
+            return entry
+
+    def set(self, key, group, body, etag=None):
+        entry = CacheEntry(group, body, etag, time.monotonic() + self.ttls.get(group, self.ttl))
+
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+
+    def refresh(self, key):
+        """
+        Mark an entry as fresh again, after the server confirmed it did not change
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            if entry is not None:
+                entry.expires = time.monotonic() + self.ttls.get(entry.group, self.ttl)
+
+    def invalidate(self, *groups):
+        """
+        Drop every entry of the given groups
+        """
+        with self.__lock:
+            for key in [key for key, entry in self.__entries.items() if entry.group in groups]:
+                del self.__entries[key]
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
@@ -0,0 +1,66 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+
+class RetryPolicy:
+    """
+    Decides when a request is sent again and how long to wait before it.
+    Only idempotent methods are retried, waiting what the Retry-After header asks for or
+    an exponential backoff with full jitter.
+    """
+    IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+    RETRY_STATUSES = (429, 502, 503, 504)
+
+    def __init__(self, total=3, backoff_factor=0.5, max_backoff=30.0, statuses=RETRY_STATUSES,
+                 methods=IDEMPOTENT_METHODS, respect_retry_after=True):
+        """
+        @total: Max retries per request
+        @backoff_factor: Base delay in seconds, doubled on every attempt
+        @max_backoff: Max delay in seconds between two attempts
+        @statuses: Response statuses that are retried
+        @methods: Http methods that can be retried
+        @respect_retry_after: Wait what the Retry-After header asks for, when present
+        """
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(methods)
+        self.respect_retry_after = respect_retry_after
+
+    def can_retry(self, method, attempt):
+        return attempt < self.total and method.upper() in self.methods
+
+    def should_retry(self, method, status, attempt):
+        return status in self.statuses and self.can_retry(method, attempt)
+
+    def delay(self, attempt, headers=None):
+        """
+        @attempt: Number of retries already done
+        @headers: Headers of the failed response
+        @return Seconds to wait before the next attempt
+        """
+        retry_after = self.retry_after(headers) if self.respect_retry_after and headers else None
+
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * (2 ** attempt)))
+
+    @staticmethod
+    def retry_after(headers):
+        value = headers.get('Retry-After')
+
+        if value is None:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
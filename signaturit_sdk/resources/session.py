@@ -0,0 +1,23 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def create_session(pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive=True):
+    """
+    Build a requests session backed by a pooled HTTPS adapter
+    @pool_connections: Number of host pools to keep cached
+    @pool_maxsize: Max connections kept alive per host
+    @pool_block: Block when the pool is exhausted instead of opening extra connections
+    @keep_alive: Reuse connections between requests
+    """
+    session = requests.Session()
+
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    if keep_alive is False:
+        session.headers['Connection'] = 'close'
+
+    return session
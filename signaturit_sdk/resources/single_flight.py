@@ -0,0 +1,104 @@
+import asyncio
+import threading
+
+from signaturit_sdk.resources import deadline
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def _shared(error):
+    """
+    @return Whether the error of the leader is raised to its followers too. Running out of its own deadline is not
+    shared with followers which still have time left: they try again instead
+    """
+    return not isinstance(error, deadline.DeadlineExceeded) or not deadline.allows(0)
+
+
+class SingleFlight:
+    """
+    Thread safe de-duplication of concurrent calls: while a call for a key is in flight,
+    other callers of the same key wait for it and share its result instead of calling again.
+    Nothing is kept once the call returns, so results are never stale.
+    Callers wait no longer than their own deadline.
+    """
+    def __init__(self):
+        self.__calls = {}
+        self.__lock = threading.Lock()
+
+    def do(self, key, function):
+        """
+        @function: Callable without arguments, only called when no call for the key is in flight
+        @return The result of the call in flight, or of function
+        """
+        while True:
+            with self.__lock:
+                call = self.__calls.get(key)
+                leader = call is None
+
+                if leader:
+                    call = self.__calls[key] = _Call()
+
+            if leader:
+                break
+
+            if not call.done.wait(deadline.remaining()):
+                raise deadline.DeadlineExceeded('Deadline exceeded')
+
+            if call.error is None:
+                return call.result
+
+            if _shared(call.error):
+                raise call.error
+
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+
+            raise
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+
+            call.done.set()
+
+        return call.result
+
+
+class AsyncSingleFlight:
+    """
+    asyncio version of SingleFlight, function must return an awaitable.
+    The call runs in its own task, so cancelling one of the callers does not cancel it for the others.
+    """
+    def __init__(self):
+        self.__tasks = {}
+
+    async def do(self, key, function):
+        while True:
+            task = self.__tasks.get(key)
+
+            if task is None:
+                task = self.__tasks[key] = asyncio.ensure_future(function())
+                task.add_done_callback(lambda done: self.__forget(key, done))
+
+            try:
+                return await asyncio.wait_for(asyncio.shield(task), deadline.remaining())
+            except TimeoutError as error:
+                if not task.done():
+                    raise deadline.DeadlineExceeded('Deadline exceeded') from None
+
+                if _shared(error):
+                    raise
+
+                self.__forget(key, task)
+
+    def __forget(self, key, task):
+        if self.__tasks.get(key) is task:
+            del self.__tasks[key]
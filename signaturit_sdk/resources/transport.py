@@ -0,0 +1,244 @@
+import abc
+import io
+import json
+import threading
+from urllib.parse import urlsplit
+
+import requests
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+class Transport(abc.ABC):
+    """
+    Sends the http requests of a Connection. Subclass it to plug another http library:
+
+        class MyTransport(Transport):
+            def request(self, method, url, headers=None, timeout=None, data=None, stream=False):
+                ...
+
+    request must return an object with the requests.Response interface used by Connection: status_code,
+    headers, content, iter_content(chunk_size), raw.read() and close(). Connection errors must be raised as
+    requests.ConnectionError and timeouts as requests.Timeout, so they are retried.
+    """
+    @abc.abstractmethod
+    def request(self, method, url, headers=None, timeout=None, data=None, stream=False):
+        """
+        @timeout: None, seconds or a (connect, read) tuple
+        @data: None, bytes, str, a dict of form fields or a file like object with a read method
+        @stream: Don't read the body before returning the response
+        """
+
+    def close(self):
+        """
+        Release the connections
+        """
+
+
+class RequestsTransport(Transport):
+    """
+    Default transport, backed by a requests session (HTTP/1.1, one connection per concurrent request)
+    """
+    def __init__(self, session=None):
+        """
+        @session: A requests session, or the requests module for unpooled requests
+        """
+        self.session = session if session is not None else requests
+
+    def request(self, method, url, headers=None, timeout=None, data=None, stream=False):
+        return self.session.request(method, url, headers=headers, timeout=timeout, data=data, stream=stream)
+
+    def close(self):
+        if self.session is not requests:
+            self.session.close()
+
+
+class _Raw:
+    __slots__ = ('response',)
+
+    def __init__(self, response):
+        self.response = response
+
+    def read(self):
+        return self.response.read()
+
+
+class _HTTPXResponse:
+    """
+    requests.Response interface over an httpx.Response
+    """
+    __slots__ = ('response', 'status_code', 'headers', 'request')
+
+    def __init__(self, response):
+        self.response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.request = None
+
+    @property
+    def content(self):
+        return self.response.read()
+
+    @property
+    def raw(self):
+        return _Raw(self.response)
+
+    def iter_content(self, chunk_size=1):
+        try:
+            for chunk in self.response.iter_bytes(chunk_size):
+                yield chunk
+        except httpx.TimeoutException as error:
+            raise requests.Timeout(str(error)) from error
+        except (httpx.NetworkError, httpx.RemoteProtocolError) as error:
+            raise requests.ConnectionError(str(error)) from error
+
+    def close(self):
+        self.response.close()
+
+
+class HTTPXTransport(Transport):
+    """
+    Transport backed by an httpx.Client. With http2 every concurrent request of the client is multiplexed
+    over a single connection per host, instead of opening one TLS connection per thread.
+    HTTP/2 needs `pip install httpx[http2]`.
+    """
+    def __init__(self, http2=True, max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0,
+                 client=None):
+        """
+        @http2: Negotiate HTTP/2 with the server, falling back to HTTP/1.1 when it does not support it
+        @max_connections: Max concurrent connections
+        @max_keepalive_connections: Max idle connections kept alive
+        @keepalive_expiry: Seconds an idle connection is kept alive
+        @client: An already configured httpx.Client to use instead of building one
+        """
+        if httpx is None:
+            raise ImportError('HTTPXTransport requires httpx, install it with `pip install httpx[http2]`')
+
+        if client is None:
+            client = httpx.Client(http2=http2, limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            ))
+
+        self.client = client
+
+    @staticmethod
+    def timeout(timeout):
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+
+            return httpx.Timeout(read, connect=connect)
+
+        return httpx.Timeout(timeout)
+
+    def request(self, method, url, headers=None, timeout=None, data=None, stream=False):
+        if isinstance(data, dict):
+            kwargs = {'data': data}
+        elif hasattr(data, 'read'):
+            kwargs = {'content': iter(lambda: data.read(65536), b'')}
+
+            if getattr(data, 'len', None) is not None:
+                headers = dict(headers or {}, **{'Content-Length': str(data.len)})
+        else:
+            kwargs = {'content': data}
+
+        request = self.client.build_request(method, url, headers=headers, timeout=self.timeout(timeout), **kwargs)
+
+        try:
+            response = self.client.send(request, stream=stream)
+        except httpx.TimeoutException as error:
+            raise requests.Timeout(str(error)) from error
+        except (httpx.NetworkError, httpx.RemoteProtocolError) as error:
+            raise requests.ConnectionError(str(error)) from error
+
+        return _HTTPXResponse(response)
+
+    def close(self):
+        self.client.close()
+
+
+class InMemoryTransport(Transport):
+    """
+    Transport answering from registered routes without any network, for tests:
+
+        transport = InMemoryTransport()
+        transport.add('GET', '/v3/signatures/SIGNATURE_ID.json', {'id': 'SIGNATURE_ID'})
+
+        client = SignaturitClient('TOKEN', transport=transport)
+        client.get_signature('SIGNATURE_ID')
+
+        transport.requests[-1].url
+
+    Unknown routes answer 404. as_httpx() serves the same routes to AsyncSignaturitClient.
+    """
+    def __init__(self):
+        self.requests = []
+
+        self.__routes = {}
+        self.__lock = threading.Lock()
+
+    def add(self, method, path, body=b'', status=200, headers=None):
+        """
+        Answer the requests of the given method and path, whatever their query string
+        @body: bytes, str, a json serializable result, or a callable receiving the requests.PreparedRequest
+        and returning one of them or a (status, headers, body) tuple
+        """
+        self.__routes[(method.upper(), path)] = (body, status, headers or {})
+
+    def __answer(self, method, url, headers, data):
+        request = requests.Request(method, url, headers=headers, data=data).prepare()
+
+        with self.__lock:
+            self.requests.append(request)
+
+        route = self.__routes.get((method.upper(), urlsplit(url).path))
+
+        if route is None:
+            return 404, {'Content-Type': 'application/json'}, b'{"message": "Not found"}'
+
+        body, status, response_headers = route
+
+        if callable(body):
+            body = body(request)
+
+            if isinstance(body, tuple):
+                status, response_headers, body = body
+
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        elif not isinstance(body, (bytes, bytearray)):
+            body = json.dumps(body).encode('utf-8')
+            response_headers = dict(response_headers, **{'Content-Type': 'application/json'})
+
+        return status, response_headers, bytes(body)
+
+    def request(self, method, url, headers=None, timeout=None, data=None, stream=False):
+        if hasattr(data, 'read'):
+            data = data.read()
+
+        status, headers, body = self.__answer(method, url, headers, data)
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response.headers['Content-Length'] = str(len(body))
+        response.raw = io.BytesIO(body)
+        response.url = url
+
+        return response
+
+    def as_httpx(self):
+        """
+        @return An httpx.MockTransport serving the same routes, for httpx.AsyncClient(transport=...)
+        """
+        def handler(request):
+            status, headers, body = self.__answer(request.method, str(request.url), dict(request.headers),
+                                                  request.read())
+
+            return httpx.Response(status, headers=headers, content=body)
+
+        return httpx.MockTransport(handler)
@@ -1,5 +1,21 @@
+import copy
+import os
+from collections.abc import Mapping
+
+from signaturit_sdk.models import Email, SMS, Signature
+from signaturit_sdk.resources.artifact_cache import AS_MMAP, AS_PATH
 from signaturit_sdk.resources.connection import Connection
+from signaturit_sdk.resources.deadline import DEFAULT_TIMEOUT
+from signaturit_sdk.resources.decoder import get_decoder
+from signaturit_sdk.resources.endpoints import ENDPOINTS, encode_query, make_method
+from signaturit_sdk.resources.hooks import as_hooks
+from signaturit_sdk.resources.multi_get import chunk_ids, fetch_by_ids
+from signaturit_sdk.resources.paginator import iter_pages, iter_pages_concurrently
 from signaturit_sdk.resources.parser import Parser
+from signaturit_sdk.resources.retry import RetryPolicy
+from signaturit_sdk.resources.single_flight import SingleFlight
+from signaturit_sdk.resources.session import create_session
+from signaturit_sdk.resources.transport import RequestsTransport
 
 class SignaturitClient:
     BRANDINGS_URL = '/v3/brandings.json'
@@ -20,6 +36,8 @@ class SignaturitClient:
     PACKAGES_SMS_URL = '/v3/packages/sms.json'
     PACKAGES_AUDIT_TRAIL_URL = '/v3/packages/%s/download/audit_trail'
 
+    FINISHED_STATUSES = ('completed', 'canceled', 'declined', 'expired', 'error')
+
     PRODUCTION = True
 
     SMS_URL = '/v3/sms.json'
@@ -50,92 +68,300 @@ class SignaturitClient:
     TEAM_GROUPS_URL = '/v3/team/groups.json'
     TEAM_GROUPS_ID_URL = '/v3/team/groups/%s.json'
 
-    def __init__(self, token, production=False):
+    # Getter of the process owning each downloadable file, and the key of its documents. Email and sms
+    # certificates end in statuses such as email_delivered, their files are only cached with finished=True
+    ARTIFACT_OWNERS = {
+        SIGNS_DOCUMENTS_AUDIT_URL: ('get_signature', 'documents'),
+        SIGNS_DOCUMENTS_SIGNED_URL: ('get_signature', 'documents'),
+    }
+
+    def __init__(self, token, production=False, pool_connections=10, pool_maxsize=10, pool_block=False,
+                 keep_alive=True, session=None, rate_limiter=None, retry=None, cache=None,
+                 decoder=None, models=False, base_url=None, hooks=None, timeout=None, transport=None,
+                 single_flight=False, artifact_cache=None):
+        """
+        @token: Your access token
+        @production: Send requests to production instead of sandbox
+        @pool_connections: Number of host pools to keep cached
+        @pool_maxsize: Max connections kept alive per host
+        @pool_block: Block when the pool is exhausted instead of opening extra connections
+        @keep_alive: Reuse connections between requests
+        @session: An already configured requests session to use instead of building one
+        @rate_limiter: A TokenBucket shared by every request of the client
+        @retry: A RetryPolicy for idempotent requests, defaults to RetryPolicy(). Pass False to disable retries
+        @cache: A ResponseCache for brandings, templates, users, groups, contacts, subscriptions and finished signatures
+        @decoder: How response bodies are parsed: None for the standard library json, 'orjson', 'fastest'
+        (orjson when installed), 'raw' to get the bytes untouched, or a callable receiving the bytes
+        @models: Return typed models (Signature, Email, SMS, User...) instead of dicts
+        @base_url: Send requests to this server instead (ex: a local stub), production is ignored then
+        @hooks: A Hooks (ex: Metrics) or a list of them, called along the lifecycle of every request
+        @timeout: Seconds or a (connect, read) tuple, defaults to DEFAULT_TIMEOUT. Pass False to wait forever
+        @transport: A Transport sending the requests (ex: HTTPXTransport for HTTP/2), instead of a requests session.
+        The session and pool arguments are ignored then
+        @single_flight: Concurrent identical GET requests share the response of the first one instead of being sent again
+        @artifact_cache: An ArtifactCache keeping the downloaded documents and audit trails on disk
+        """
         self.token = token
+        self._headers = Connection.default_headers(token)
         self.production = production
+        self.base_url = base_url.rstrip('/') if base_url else None
+        self.rate_limiter = rate_limiter
+        self.retry = RetryPolicy() if retry is None else retry or None
+        self.cache = cache
+        self.decoder = get_decoder(decoder)
+        self.models = models
+        self.hooks = as_hooks(hooks)
+        self.timeout = DEFAULT_TIMEOUT if timeout is None else timeout or None
+        self.single_flight = SingleFlight() if single_flight else None
+        self.artifact_cache = artifact_cache
+
+        self._owns_session = session is None and transport is None
+
+        if transport is None:
+            session = session if session is not None else create_session(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                keep_alive=keep_alive
+            )
+            transport = RequestsTransport(session)
 
-    def get_signatures(self, limit=100, offset=0, conditions={}):
+        self._session = session
+        self._transport = transport
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
         """
-        Get all signatures
+        Release every pooled connection. Sessions and transports passed by the caller are left open.
         """
-        url = self.SIGNS_URL + "?limit=%s&offset=%s" % (limit, offset)
+        if self._owns_session and self._transport is not None:
+            self._transport.close()
 
-        for key, value in conditions.items():
-            if key is 'ids':
-                value = ",".join(value)
+        self._session = None
+        self._transport = None
 
-            url += '&%s=%s' % (key, value)
+    def with_timeout(self, timeout):
+        """
+        Copy of the client sharing its connections, sending requests with another timeout:
 
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
+            client.with_timeout((3, 300)).download_signed_document(signature_id, document_id, 'contract.pdf')
 
-        return connection.get_request()
+        @timeout: Seconds or a (connect, read) tuple. Pass False to wait forever
+        """
+        client = copy.copy(self)
+        client.timeout = timeout or None
+        client._owns_session = False
+
+        return client
 
-    def get_signature(self, signature_id):
+    def _connection(self):
         """
-        Get a concrete Signature
-        @return Signature data
+        Build a Connection bound to the shared transport
         """
-        connection = Connection(self.token)
-        connection.set_url(self.production, self.SIGNS_ID_URL % signature_id)
+        if self._transport is None:
+            raise RuntimeError('SignaturitClient is closed')
+
+        return Connection(self.token, transport=self._transport, rate_limiter=self.rate_limiter, retry=self.retry,
+                          cache=self.cache, decoder=self.decoder,
+                          models=self.models, headers=self._headers,
+                          base_url=self.base_url, hooks=self.hooks, timeout=self.timeout,
+                          single_flight=self.single_flight)
+
+    @classmethod
+    def _is_finished(cls, signature, children='documents'):
+        documents = signature.get(children) if isinstance(signature, Mapping) else None
 
-        return connection.get_request()
+        return bool(documents) and all(document.get('status') in cls.FINISHED_STATUSES for document in documents)
 
-    def count_signatures(self, conditions={}):
+    def _call(self, endpoint, values):
         """
-        Count all signatures
+        Send the request of a registry endpoint
+        @endpoint: An Endpoint of ENDPOINTS
+        @values: Argument values by name
         """
-        url = self.SIGNS_COUNT_URL + '?'
+        connection = self._connection()
+        connection.set_url(self.production, endpoint.url(values))
+        connection.set_endpoint(endpoint.path)
+
+        if endpoint.json:
+            connection.add_header('Content-Type', 'application/json')
+
+        params = endpoint.params(values)
+
+        if params is not None:
+            connection.add_params(params, json_format=endpoint.json and endpoint.method == 'POST')
+
+        if endpoint.cache is not None:
+            condition = getattr(self, endpoint.cache_condition) if endpoint.cache_condition else None
+            connection.cache_as(endpoint.cache, condition)
+
+        if endpoint.invalidates:
+            connection.invalidates(*endpoint.invalidates)
+
+        if endpoint.model is not None:
+            connection.model_as(endpoint.model)
+
+        return getattr(connection, endpoint.request)()
+
+    def _artifact_key(self, url, ids):
+        return '%s%s' % (self.base_url or ('production' if self.production else 'sandbox'), url % ids)
+
+    def _owner_finished(self, url, ids):
+        if url not in self.ARTIFACT_OWNERS:
+            return False
+
+        getter, children = self.ARTIFACT_OWNERS[url]
+
+        return self._is_finished(getattr(self, getter)(ids[0]), children)
+
+    def _download(self, url, ids, destination, chunk_size, checksum, finished):
+        cache = self.artifact_cache
+
+        if cache is not None and finished is not False:
+            key = self._artifact_key(url, ids)
+            cached = cache.get(key)
+
+            # The files of a process can change until it is finished, only the ones of finished processes are cached
+            if cached is not None or finished or self._owner_finished(url, ids):
+                return self._cached_download(cache, key, cached, url, ids, destination, chunk_size, checksum)
+
+        if destination in (AS_PATH, AS_MMAP):
+            raise ValueError('%r needs an artifact_cache and a finished process' % destination)
+
+        return self._fetch(url, ids, destination, chunk_size, checksum)
+
+    def _cached_download(self, cache, key, cached, url, ids, destination, chunk_size, checksum):
+        for _ in range(3):
+            if cached is None:
+                with cache.lock(key):
+                    cached = cache.get(key) or self._fill(cache, key, url, ids, chunk_size)
+
+                if not isinstance(cached, tuple):
+                    return cached  # error response
+
+            result = cache.deliver(*cached, destination, chunk_size)
+
+            if result is not None:
+                return result
+
+            cached = cache.get(key)
 
-        for key, value in conditions.items():
-            if key is 'ids':
-                value = ",".join(value)
+        # Evicted as soon as cached, by a cache too small for it
+        return self._fetch(url, ids, destination, chunk_size, checksum)
 
-            url += '&%s=%s' % (key, value)
+    def _fill(self, cache, key, url, ids, chunk_size):
+        temporary = cache.temporary()
 
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
+        try:
+            result = self._fetch(url, ids, temporary, chunk_size, True)
 
-        return connection.get_request()
+            if not isinstance(result, dict) or 'path' not in result:
+                return result
 
-    def download_audit_trail(self, signature_id, document_id):
+            return cache.put(key, temporary, result['sha256']), result['sha256']
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+    def _fetch(self, url, ids, destination, chunk_size, checksum):
+        connection = self._connection()
+        connection.set_url(self.production, url % ids)
+        connection.set_endpoint(url)
+
+        response, headers = connection.file_request(destination, chunk_size, checksum)
+
+        return response
+
+    def _fetch_by_ids(self, fetch, chunks, workers):
+        return fetch_by_ids(fetch, chunks, workers)
+
+    def _iter_pages(self, fetch, page_size, prefetch):
+        return iter_pages(fetch, page_size, prefetch)
+
+    def _iter_pages_concurrently(self, count, fetch, page_size, workers, ordered):
+        return iter_pages_concurrently(fetch, count(), page_size, workers, ordered)
+
+    def iter_signatures(self, conditions={}, page_size=100, prefetch=True, workers=None, ordered=True):
         """
-        Get the audit trail of concrete document
-        @signature_id: Id of signature
-        @document_id: Id of document
+        Iterate over all signatures, fetching pages lazily
+        @conditions: Same filters as get_signatures
+        @page_size: Items requested per page
+        @prefetch: Fetch the next page in background while the current one is consumed
+        @workers: Call count_signatures first and fetch up to this many pages concurrently
+        @ordered: With workers, yield in offset order instead of as pages arrive
         """
-        connection = Connection(self.token)
-        connection.set_url(self.production, self.SIGNS_DOCUMENTS_AUDIT_URL % (signature_id, document_id))
+        def fetch(limit, offset):
+            return self.get_signatures(limit, offset, conditions)
 
-        response, headers = connection.file_request()
+        if workers:
+            def count():
+                return self.count_signatures(conditions)
 
-        if headers['content-type'] == 'application/json':
-            return response
+            return self._iter_pages_concurrently(count, fetch, page_size, workers, ordered)
 
-        return response
+        return self._iter_pages(fetch, page_size, prefetch)
 
-    def download_signed_document(self, signature_id, document_id):
+    def get_signatures_by_ids(self, ids, conditions={}, workers=4, max_url_length=2000):
         """
-        Get the audit trail of concrete document
-        @signature_id: Id of signature
-        @document_id: Id of document
+        Get many signatures by id, splitting the ids in as few requests as the url length allows
+        @ids: Ids to fetch, any number
+        @conditions: Same filters as get_signatures
+        @workers: Max requests sent at the same time
+        @max_url_length: Max length of each request url
+        @return A dict of signatures by id, missing ids are left out
         """
-        connection = Connection(self.token)
+        def fetch(chunk):
+            chunk_conditions = dict(conditions)
+            chunk_conditions['ids'] = chunk
 
-        connection.set_url(self.production, self.SIGNS_DOCUMENTS_SIGNED_URL % (signature_id, document_id))
+            return self.get_signatures(len(chunk), 0, chunk_conditions)
 
-        response, headers = connection.file_request()
+        base_length = len(self.SIGNS_URL) + len(encode_query(conditions))
 
-        if headers['content-type'] == 'application/json':
-            return response
+        return self._fetch_by_ids(fetch, chunk_ids(ids, base_length, max_url_length), workers)
 
-        return response
+    def download_audit_trail(self, signature_id, document_id, destination=None, chunk_size=65536, checksum=False,
+                             finished=None):
+        """
+        Get the audit trail of concrete document
+        @signature_id: Id of signature
+        @document_id: Id of document
+        @destination: Path or writable file object to stream the file to. When omitted the content is returned
+        @chunk_size: Bytes read per chunk when streaming
+        @checksum: Compute the SHA-256 of the streamed file
+        @finished: Whether the signature is finished. With an artifact_cache, get_signature tells it when omitted,
+        and only the files of finished signatures are cached
+        @return The file content, or a dict with the written bytes and sha256 when streaming
+        """
+        return self._download(self.SIGNS_DOCUMENTS_AUDIT_URL, (signature_id, document_id), destination, chunk_size, checksum,
+                              finished)
+
+    def download_signed_document(self, signature_id, document_id, destination=None, chunk_size=65536, checksum=False,
+                                 finished=None):
+        """
+        Get the signed version of concrete document
+        @signature_id: Id of signature
+        @document_id: Id of document
+        @destination: Path or writable file object to stream the file to. When omitted the content is returned
+        @chunk_size: Bytes read per chunk when streaming
+        @checksum: Compute the SHA-256 of the streamed file
+        @finished: Whether the signature is finished. With an artifact_cache, get_signature tells it when omitted,
+        and only the files of finished signatures are cached
+        @return The file content, or a dict with the written bytes and sha256 when streaming
+        """
+        return self._download(self.SIGNS_DOCUMENTS_SIGNED_URL, (signature_id, document_id), destination, chunk_size, checksum,
+                              finished)
 
     def create_signature(self, files, recipients, params):
         """
         Create a new Signature request.
         @files
-            Files to send
+            Files to send, as paths, binary file objects, bytes or (filename, content) tuples
                 ex: ['/documents/internet_contract.pdf', ... ]
         @recipients
             A dictionary with the email and fullname of the person you want to sign.
@@ -165,174 +391,82 @@ class SignaturitClient:
 
         parser.fill_array(documents, files, 'files')
 
-        connection = Connection(self.token)
+        connection = self._connection()
         connection.set_url(self.production, self.SIGNS_URL)
         connection.add_params(parameters)
         connection.add_files(documents)
+        connection.model_as(Signature)
 
         return connection.post_request()
 
-    def cancel_signature(self, signature_id):
-        """
-        Cancel a concrete Signature
-        @signature_id: Id of signature
-        @return Signature data
-        """
-        connection = Connection(self.token)
-
-        connection.set_url(self.production, self.SIGNS_CANCEL_URL % signature_id)
-
-        return connection.patch_request()
-
-    def send_signature_reminder(self, signature_id):
-        """
-        Send a reminder email
-        @signature_id: Id of signature
-        @document_id: Id of document
-        """
-        connection = Connection(self.token)
-
-        connection.set_url(self.production, self.SIGNS_SEND_REMINDER_URL % signature_id)
-
-        return connection.post_request()
-
-    def get_branding(self, branding_id):
-        """
-        Get a concrete branding
-        @branding_id: Id of the branding to fetch
-        @return Branding
-        """
-        connection = Connection(self.token)
-
-        connection.set_url(self.production, self.BRANDINGS_ID_URL % branding_id)
-
-        return connection.get_request()
-
-    def get_brandings(self):
-        """
-        Get all account brandings
-        @return List of brandings
-        """
-        connection = Connection(self.token)
-
-        connection.set_url(self.production, self.BRANDINGS_URL)
-
-        return connection.get_request()
-
-    def create_branding(self, params):
-        """
-        Create a new branding
-        @params: An array of params (all params are optional)
-            - layout: Default color for all application widgets (hex code)
-            - text: Default text color for all application widgets (hex code)
-            - application_texts: A dict with the new text values
-            - sign_button: Text for sign button
-            - send_button: Text for send button
-            - decline_button: Text for decline button:
-            - decline_modal_title: Title for decline modal (when you click decline button)
-            - decline_modal_body: Body for decline modal (when you click decline button)
-            - photo: Photo message text, which tells the user that a photo is needed in the current process
-            - multi_pages: Header of the document, which tells the user the number of pages to sign
-            ex: { 'photo': 'Hey! Take a photo of yourself to validate the process!'}
-        """
-        connection = Connection(self.token)
-
-        connection.add_header('Content-Type', 'application/json')
-        connection.set_url(self.production, self.BRANDINGS_URL)
-        connection.add_params(params, json_format=True)
-
-        return connection.post_request()
-
-    def update_branding(self, branding_id, params):
+    def iter_templates(self, page_size=100, prefetch=True):
         """
-        Update a existing branding
-        @branding_id: Id of the branding to update
-        @params: Same params as method create_branding, see above
-        @return: A dict with updated branding data
+        Iterate over all account templates, fetching pages lazily
+        @page_size: Items requested per page
+        @prefetch: Fetch the next page in background while the current one is consumed
         """
-        connection = Connection(self.token)
-
-        connection.add_header('Content-Type', 'application/json')
-        connection.set_url(self.production, self.BRANDINGS_ID_URL % branding_id)
-        connection.add_params(params)
+        return self._iter_pages(self.get_templates, page_size, prefetch)
 
-        return connection.patch_request()
-
-    def get_templates(self, limit=100, offset=0):
+    def iter_emails(self, conditions={}, page_size=100, prefetch=True, workers=None, ordered=True):
         """
-        Get all account templates
+        Iterate over all certified emails, fetching pages lazily
+        @conditions: Same filters as get_emails
+        @page_size: Items requested per page
+        @prefetch: Fetch the next page in background while the current one is consumed
+        @workers: Call count_emails first and fetch up to this many pages concurrently
+        @ordered: With workers, yield in offset order instead of as pages arrive
         """
-        url = self.TEMPLATES_URL + "?limit=%s&offset=%s" % (limit, offset)
+        def fetch(limit, offset):
+            return self.get_emails(limit, offset, conditions)
 
-        connection = Connection(self.token)
+        if workers:
+            def count():
+                return self.count_emails(conditions)
 
-        connection.set_url(self.production, url)
+            return self._iter_pages_concurrently(count, fetch, page_size, workers, ordered)
 
-        return connection.get_request()
+        return self._iter_pages(fetch, page_size, prefetch)
 
-    def get_emails(self, limit=100, offset=0, conditions={}):
+    def get_emails_by_ids(self, ids, conditions={}, workers=4, max_url_length=2000):
         """
-        Get all certified emails
+        Get many certified emails by id, splitting the ids in as few requests as the url length allows
+        @ids: Ids to fetch, any number
+        @conditions: Same filters as get_emails
+        @workers: Max requests sent at the same time
+        @max_url_length: Max length of each request url
+        @return A dict of certified emails by id, missing ids are left out
         """
-        url = self.EMAILS_URL + "?limit=%s&offset=%s" % (limit, offset)
-
-        for key, value in conditions.items():
-            if key is 'ids':
-                value = ",".join(value)
+        def fetch(chunk):
+            chunk_conditions = dict(conditions)
+            chunk_conditions['ids'] = chunk
 
-            url += '&%s=%s' % (key, value)
+            return self.get_emails(len(chunk), 0, chunk_conditions)
 
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
+        base_length = len(self.EMAILS_URL) + len(encode_query(conditions))
 
-        return connection.get_request()
+        return self._fetch_by_ids(fetch, chunk_ids(ids, base_length, max_url_length), workers)
 
-    def count_emails(self, conditions={}):
+    def download_email_audit_trail(self, email_id, certificate_id, destination=None, chunk_size=65536, checksum=False,
+                                   finished=None):
         """
-        Count all certified emails
+        Get the audit trail of an email certificate
+        @email_id: Id of email
+        @certificate_id: Id of certificate
+        @destination: Path or writable file object to stream the file to. When omitted the content is returned
+        @chunk_size: Bytes read per chunk when streaming
+        @checksum: Compute the SHA-256 of the streamed file
+        @finished: Whether the email is finished. With an artifact_cache, the file is only cached when True
+        @return The file content, or a dict with the written bytes and sha256 when streaming
         """
-        url = self.EMAILS_COUNT_URL + "?"
-
-        for key, value in conditions.items():
-            if key is 'ids':
-                value = ",".join(value)
-
-            url += '&%s=%s' % (key, value)
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-        connection.set_url(self.production, url)
-
-        return connection.get_request()
-
-    def get_email(self, email_id):
-        """
-        Get a specific email
-        """
-        connection = Connection(self.token)
-
-        connection.set_url(self.production, self.EMAILS_ID_URL % email_id)
-
-        return connection.get_request()
-
-    def download_email_audit_trail(self, email_id, certificate_id):
-        connection = Connection(self.token)
-
-        connection.set_url(self.production, self.EMAILS_AUDIT_TRAIL % (email_id, certificate_id))
-
-        response, headers = connection.file_request()
-
-        if headers['content-type'] == 'application/json':
-            return response
-
-        return response
+        return self._download(self.EMAILS_AUDIT_TRAIL, (email_id, certificate_id), destination, chunk_size, checksum,
+                              finished)
 
     def create_email(self, files, recipients, subject, body, params={}):
         """
         Create a new certified email
 
         @files
-             Files to send
+             Files to send, as paths, binary file objects, bytes or (filename, content) tuples
                 ex: ['/documents/internet_contract.pdf', ... ]
         @recipients
             A dictionary with the email and fullname of the person you want to sign.
@@ -352,6 +486,8 @@ class SignaturitClient:
 
         documents = {}
 
+        files = files if isinstance(files, list) else [files]
+
         parser.fill_array(documents, files, 'files')
 
         recipients = recipients if isinstance(recipients, list) else [recipients]
@@ -367,76 +503,74 @@ class SignaturitClient:
         parameters['subject'] = subject
         parameters['body'] = body
 
-        connection = Connection(self.token)
+        connection = self._connection()
         connection.set_url(self.production, self.EMAILS_URL)
         connection.add_params(parameters)
         connection.add_files(documents)
+        connection.model_as(Email)
 
         return connection.post_request()
 
-    def count_SMS(self, conditions={}):
+    def iter_SMS(self, conditions={}, page_size=100, prefetch=True, workers=None, ordered=True):
         """
-        Count all certified sms
+        Iterate over all certified sms, fetching pages lazily
+        @conditions: Same filters as get_SMS
+        @page_size: Items requested per page
+        @prefetch: Fetch the next page in background while the current one is consumed
+        @workers: Call count_SMS first and fetch up to this many pages concurrently
+        @ordered: With workers, yield in offset order instead of as pages arrive
         """
-        url = self.SMS_COUNT_URL + "?"
+        def fetch(limit, offset):
+            return self.get_SMS(limit, offset, conditions)
 
-        for key, value in conditions.items():
-            if key is 'ids':
-                value = ",".join(value)
+        if workers:
+            def count():
+                return self.count_SMS(conditions)
 
-            url += '&%s=%s' % (key, value)
+            return self._iter_pages_concurrently(count, fetch, page_size, workers, ordered)
 
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-        connection.set_url(self.production, url)
+        return self._iter_pages(fetch, page_size, prefetch)
 
-        return connection.get_request()
-
-    def get_SMS(self, limit=100, offset=0, conditions={}):
+    def get_SMS_by_ids(self, ids, conditions={}, workers=4, max_url_length=2000):
         """
-        Get all certified sms
+        Get many certified sms by id, splitting the ids in as few requests as the url length allows
+        @ids: Ids to fetch, any number
+        @conditions: Same filters as get_SMS
+        @workers: Max requests sent at the same time
+        @max_url_length: Max length of each request url
+        @return A dict of certified sms by id, missing ids are left out
         """
-        url = self.SMS_URL + "?limit=%s&offset=%s" % (limit, offset)
-
-        for key, value in conditions.items():
-            if key is 'ids':
-                value = ",".join(value)
+        def fetch(chunk):
+            chunk_conditions = dict(conditions)
+            chunk_conditions['ids'] = chunk
 
-            url += '&%s=%s' % (key, value)
+            return self.get_SMS(len(chunk), 0, chunk_conditions)
 
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
+        base_length = len(self.SMS_URL) + len(encode_query(conditions))
 
-        return connection.get_request()
+        return self._fetch_by_ids(fetch, chunk_ids(ids, base_length, max_url_length), workers)
 
-    def get_single_SMS(self, sms_id):
+    def download_SMS_audit_trail(self, sms_id, certificate_id, destination=None, chunk_size=65536, checksum=False,
+                                 finished=None):
         """
-        Get a specific sms
+        Get the audit trail of a sms certificate
+        @sms_id: Id of sms
+        @certificate_id: Id of certificate
+        @destination: Path or writable file object to stream the file to. When omitted the content is returned
+        @chunk_size: Bytes read per chunk when streaming
+        @checksum: Compute the SHA-256 of the streamed file
+        @finished: Whether the sms is finished. With an artifact_cache, the file is only cached when True
+        @return The file content, or a dict with the written bytes and sha256 when streaming
         """
-        connection = Connection(self.token)
-
-        connection.set_url(self.production, self.SMS_ID_URL % sms_id)
-
-        return connection.get_request()
-
-    def download_SMS_audit_trail(self, sms_id, certificate_id):
-        connection = Connection(self.token)
-
-        connection.set_url(self.production, self.SMS_AUDIT_TRAIL % (sms_id, certificate_id))
-
-        response, headers = connection.file_request()
-
-        if headers['content-type'] == 'application/json':
-            return response
-
-        return response
+        return self._download(self.SMS_AUDIT_TRAIL, (sms_id, certificate_id), destination, chunk_size, checksum,
+                              finished)
 
     def create_SMS(self, files, recipients, body, params={}):
         """
         Create a new certified sms
 
         @files
-             Files to send
+             Files to send, as paths, binary file objects, bytes or (filename, content) tuples
                 ex: ['/documents/internet_contract.pdf', ... ]
         @recipients
             A dictionary with the phone and name of the person you want to sign. Phone must be always with prefix
@@ -454,6 +588,8 @@ class SignaturitClient:
 
         documents = {}
 
+        files = files if isinstance(files, list) else [files]
+
         parser.fill_array(documents, files, 'files')
 
         recipients = recipients if isinstance(recipients, list) else [recipients]
@@ -468,406 +604,62 @@ class SignaturitClient:
 
         parameters['body'] = body
 
-        connection = Connection(self.token)
+        connection = self._connection()
         connection.set_url(self.production, self.SMS_URL)
         connection.add_params(parameters)
         connection.add_files(documents)
+        connection.model_as(SMS)
 
         return connection.post_request()
 
-    def get_users(self, limit=100, offset=0):
-        """
-        Get all users from your current team
-        """
-        url = self.TEAM_USERS_URL + "?limit=%s&offset=%s" % (limit, offset)
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-
-        return connection.get_request()
-
-    def get_seats(self, limit=100, offset=0):
-        """
-        Get all seats from your current team
-        """
-        url = self.TEAM_SEATS_URL + "?limit=%s&offset=%s" % (limit, offset)
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-
-        return connection.get_request()
-
-    def get_user(self, user_id):
-        """
-           Get a single user
-        """
-        url = self.TEAM_USERS_ID_URL % user_id
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-
-        return connection.get_request()
-
-    def invite_user(self, email, role):
-        """
-        Send an invitation to email with a link to join your team
-        :param email: Email to add to your team
-        :param role: Can be admin or member
-        """
-        parameters = {
-            'email': email,
-            'role': role
-        }
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, self.TEAM_USERS_URL)
-        connection.add_params(parameters)
-
-        return connection.post_request()
-
-    def change_user_role(self, user_id, role):
-        """
-        Change role of current user
-        :param user_id: Id of user
-        :param role: Can be admin or member
-        """
-        parameters = {
-            'role': role
-        }
-
-        url = self.TEAM_USERS_ID_URL % user_id
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-        connection.add_params(parameters)
-
-        return connection.patch_request()
-
-    def remove_user(self, user_id):
-        """
-        Remove a user from your team
-        :param user_id: Id of user
-        """
-
-        url = self.TEAM_USERS_ID_URL % user_id
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-
-        return connection.delete_request()
-
-    def remove_seat(self, seat_id):
-        """
-        Remove a seat from your team
-        :param seat_id: Id of user
-        """
-
-        url = self.TEAM_SEATS_ID_URL % seat_id
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-
-        return connection.delete_request()
-
-    def get_groups(self, limit=100, offset=0):
-        """
-        Get all groups from your current team
-        """
-        url = self.TEAM_GROUPS_URL + "?limit=%s&offset=%s" % (limit, offset)
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-
-        return connection.get_request()
-
-    def get_group(self, group_id):
-        """
-        Get a single group
-        """
-        url = self.TEAM_GROUPS_ID_URL % group_id
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-
-        return connection.get_request()
-
-    def create_group(self, name):
-        """
-        Create group
-        :param name: Group name
-        """
-        parameters = {
-            'name': name
-        }
-
-        url = self.TEAM_GROUPS_URL
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-        connection.add_params(parameters)
-
-        return connection.post_request()
-
-    def update_group(self, group_id, name):
-        """
-        Change group name
-        :param group_id: Id of group
-        :param name: Group name
-        """
-        parameters = {
-            'name': name
-        }
-
-        url = self.TEAM_GROUPS_ID_URL % group_id
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-        connection.add_header('Content-Type', 'application/json')
-        connection.add_params(parameters)
-
-        return connection.patch_request()
-
-    def delete_group(self, group_id):
-        """
-        Remove a group from your team
-        :param group_id: Id of group
-        """
-
-        url = self.TEAM_GROUPS_ID_URL % group_id
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-
-        return connection.delete_request()
-
-    def add_member_to_group(self, group_id, user_id):
-        """
-        Add a user to a group as a member
-        :param group_id:
-        :param user_id:
-        """
-        url = self.TEAM_MEMBERS_URL % (group_id, user_id)
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-
-        return connection.post_request()
-
-    def remove_member_from_group(self, group_id, user_id):
-        """
-        Add a user to a group as a member
-        :param group_id:
-        :param user_id:
-        """
-        url = self.TEAM_MEMBERS_URL % (group_id, user_id)
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-
-        return connection.delete_request()
-
-    def add_manager_to_group(self, group_id, user_id):
-        """
-        Add a user to a group as a member
-        :param group_id:
-        :param user_id:
-        """
-        url = self.TEAM_MANAGERS_URL % (group_id, user_id)
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-
-        return connection.post_request()
-
-    def remove_manager_from_group(self, group_id, user_id):
-        """
-        Add a user to a group as a member
-        :param group_id:
-        :param user_id:
-        """
-        url = self.TEAM_MANAGERS_URL % (group_id, user_id)
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-
-        return connection.delete_request()
-
-    def get_subscriptions(self, limit=100, offset=0, params={}):
+    def iter_users(self, page_size=100, prefetch=True):
         """
-        Get all subscriptions
+        Iterate over all users from your current team, fetching pages lazily
+        @page_size: Items requested per page
+        @prefetch: Fetch the next page in background while the current one is consumed
         """
-        url = self.SUBSCRIPTIONS_URL + "?limit=%s&offset=%s" % (limit, offset)
-
-        for key, value in params.items():
-            if key is 'ids':
-                value = ",".join(value)
-
-            url += '&%s=%s' % (key, value)
+        return self._iter_pages(self.get_users, page_size, prefetch)
 
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-
-        return connection.get_request()
-
-    def count_subscriptions(self, params={}):
+    def iter_seats(self, page_size=100, prefetch=True):
         """
-        Count all subscriptions
+        Iterate over all seats from your current team, fetching pages lazily
+        @page_size: Items requested per page
+        @prefetch: Fetch the next page in background while the current one is consumed
         """
-        url = self.SUBSCRIPTIONS_COUNT_URL + '?'
-
-        for key, value in params.items():
-            if key is 'ids':
-                value = ",".join(value)
-
-            url += '&%s=%s' % (key, value)
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
+        return self._iter_pages(self.get_seats, page_size, prefetch)
 
-        return connection.get_request()
-
-    def get_subscription(self, subscription_id):
+    def iter_groups(self, page_size=100, prefetch=True):
         """
-        Get single subscription
+        Iterate over all groups from your current team, fetching pages lazily
+        @page_size: Items requested per page
+        @prefetch: Fetch the next page in background while the current one is consumed
         """
-        url = self.SUBSCRIPTIONS_ID_URL % subscription_id
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
+        return self._iter_pages(self.get_groups, page_size, prefetch)
 
-        return connection.get_request()
-
-    def create_subscription(self, url, events):
+    def iter_subscriptions(self, params={}, page_size=100, prefetch=True):
         """
-        Create subscription
-        :param events: Events to subscribe
-        :param url: Url to send events
+        Iterate over all subscriptions, fetching pages lazily
+        @params: Same filters as get_subscriptions
+        @page_size: Items requested per page
+        @prefetch: Fetch the next page in background while the current one is consumed
         """
-        params = {
-            'url': url,
-            'events': events
-        }
-
-        url = self.SUBSCRIPTIONS_URL
+        def fetch(limit, offset):
+            return self.get_subscriptions(limit, offset, params)
 
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-        connection.add_header('Content-Type', 'application/json')
-        connection.add_params(params, json_format=True)
+        return self._iter_pages(fetch, page_size, prefetch)
 
-        return connection.post_request()
-
-    def update_subscription(self, subscription_id, url=None, events=None):
+    def iter_contacts(self, params={}, page_size=100, prefetch=True):
         """
-        Create subscription
-        :param subscription_id: Subscription to update
-        :param events: Events to subscribe
-        :param url: Url to send events
+        Iterate over all account contacts, fetching pages lazily
+        @params: Same filters as get_contacts
+        @page_size: Items requested per page
+        @prefetch: Fetch the next page in background while the current one is consumed
         """
-        params = {}
-
-        if url is not None:
-            params['url'] = url
-
-        if events is not None:
-            params['events'] = events
+        def fetch(limit, offset):
+            return self.get_contacts(limit, offset, params)
 
-        url = self.SUBSCRIPTIONS_ID_URL % subscription_id
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-        connection.add_header('Content-Type', 'application/json')
-        connection.add_params(params)
-
-        return connection.patch_request()
-
-    def delete_subscription(self, subscription_id):
-        """
-        Delete single subscription
-        """
-        url = self.SUBSCRIPTIONS_ID_URL % subscription_id
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-
-        return connection.delete_request()
-
-    def get_contacts(self, limit=100, offset=0, params={}):
-        """
-        Get all account contacts
-        """
-        url = self.CONTACTS_URL + "?limit=%s&offset=%s" % (limit, offset)
-
-        for key, value in params.items():
-            if key is 'ids':
-                value = ",".join(value)
-
-            url += '&%s=%s' % (key, value)
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-
-        return connection.get_request()
-
-    def get_contact(self, contact_id):
-        """
-        Get single contact
-        """
-        url = self.CONTACTS_ID_URL % contact_id
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-
-        return connection.get_request()
-
-    def create_contact(self, email, name):
-        """
-        Create a new contact
-        :param email: user email
-        :param name: user name
-        """
-        params = {'email': email, 'name': name}
-
-        url = self.CONTACTS_URL
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-        connection.add_header('Content-Type', 'application/json')
-        connection.add_params(params, json_format=True)
-
-        return connection.post_request()
-
-    def update_contact(self, contact_id, email=None, name=None):
-        """
-        Update a current contact
-        :param contact_id: contact id
-        :param email: user email
-        :param name: user name
-        """
-        params = {}
-
-        if email is not None:
-            params['email'] = email
-
-        if name is not None:
-            params['name'] = name
-
-        url = self.CONTACTS_ID_URL % contact_id
-
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
-        connection.add_header('Content-Type', 'application/json')
-        connection.add_params(params)
-
-        return connection.patch_request()
-
-    def delete_contact(self, contact_id):
-        """
-        Delete single contact
-        """
-        url = self.CONTACTS_ID_URL % contact_id
+        return self._iter_pages(fetch, page_size, prefetch)
 
-        connection = Connection(self.token)
-        connection.set_url(self.production, url)
 
-        return connection.delete_request()
\ No newline at end of file
+for _endpoint in ENDPOINTS:
+    setattr(SignaturitClient, _endpoint.name, make_method(_endpoint))
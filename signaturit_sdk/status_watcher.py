@@ -0,0 +1,327 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Mapping
+from datetime import datetime
+
+from signaturit_sdk.resources.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class _Watched:
+    __slots__ = ('statuses', 'interval', 'due')
+
+    def __init__(self, statuses, interval, due):
+        self.statuses = statuses
+        self.interval = interval
+        self.due = due
+
+
+class StatusWatcher:
+    """
+    Tracks many signatures with batched get_signatures(conditions={'ids': [...]}) requests and calls
+    on_change(signature, old_statuses, new_statuses) whenever the status of any of its documents changes.
+
+    Recently created signatures are polled every min_interval, older ones less often, and the interval of
+    a signature doubles (up to max_interval) every time it is polled without changes. Finished signatures
+    are reported one last time and forgotten.
+
+        watcher = StatusWatcher(client, on_change=notify, max_requests_per_second=2)
+        watcher.watch('SIGNATURE_ID')
+        watcher.run(stop_event)
+
+    When a get_signatures request fails, its signatures are polled again later with a longer interval.
+    Signatures watched while run is waiting are scheduled right away, and with a stop_event run keeps
+    waiting for new signatures until it is set.
+    """
+    # Min seconds before polling again the signatures of a failed request
+    RETRY_DELAY = 1.0
+
+    def __init__(self, client, on_change, batch_size=50, min_interval=30.0, max_interval=3600.0,
+                 max_requests_per_second=1.0):
+        """
+        @client: A SignaturitClient or AsyncSignaturitClient (use arun with the latter)
+        @on_change: Callable receiving (signature, old statuses, new statuses), it can be a coroutine function
+        @batch_size: Max ids requested at once
+        @min_interval: Seconds between polls of a recently created or recently changed signature
+        @max_interval: Max seconds between two polls of the same signature
+        @max_requests_per_second: Max get_signatures requests sent per second
+        """
+        self.client = client
+        self.on_change = on_change
+        self.batch_size = batch_size
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.rate_limiter = TokenBucket(max_requests_per_second, capacity=1)
+
+        self.__watched = {}
+        self.__queue = []
+        self.__sequence = itertools.count()
+        self.__lock = threading.Lock()
+        # Notified by watch, so a waiting run schedules the new signature
+        self.__changed = threading.Condition(self.__lock)
+        self.__watches = 0
+        # (loop, asyncio.Event) of the running arun calls, set by watch
+        self.__wakeups = set()
+
+    def __len__(self):
+        return len(self.__watched)
+
+    def watch(self, signature_id, statuses=None, created_at=None):
+        """
+        Start watching a signature
+        @signature_id: Id of signature
+        @statuses: Known statuses of its documents, a change is reported on the first poll when omitted
+        @created_at: Creation date of the signature (datetime or api date string), used to poll new ones more often
+        """
+        interval = self.__initial_interval(created_at)
+
+        with self.__lock:
+            self.__watched[signature_id] = _Watched(tuple(statuses) if statuses is not None else None, interval,
+                                                    time.monotonic())
+            self.__push(signature_id)
+            self.__watches += 1
+            self.__changed.notify_all()
+            wakeups = list(self.__wakeups)
+
+        for loop, wakeup in wakeups:
+            loop.call_soon_threadsafe(wakeup.set)
+
+    def unwatch(self, signature_id):
+        with self.__lock:
+            self.__watched.pop(signature_id, None)
+
+    def next_due(self):
+        """
+        @return Seconds until the next signature has to be polled, or None when nothing is watched
+        """
+        with self.__lock:
+            while self.__queue:
+                due, _, signature_id = self.__queue[0]
+                watched = self.__watched.get(signature_id)
+
+                if watched is not None and watched.due == due:
+                    return max(0.0, due - time.monotonic())
+
+                heapq.heappop(self.__queue)
+
+        return None
+
+    def poll_once(self):
+        """
+        Poll one batch of due signatures
+        @return Number of signatures polled
+        """
+        ids = self.__due_batch()
+
+        if ids:
+            self.rate_limiter.acquire()
+
+            try:
+                signatures = self.client.get_signatures(len(ids), 0, {'ids': ids})
+            except BaseException:
+                self.__retry_later(ids)
+
+                raise
+
+            for change in self.__apply(ids, signatures):
+                self.on_change(*change)
+
+        return len(ids)
+
+    async def apoll_once(self):
+        """
+        asyncio version of poll_once, for AsyncSignaturitClient
+        """
+        ids = self.__due_batch()
+
+        if ids:
+            delay = self.rate_limiter.reserve()
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            try:
+                signatures = await self.client.get_signatures(len(ids), 0, {'ids': ids})
+            except BaseException:
+                self.__retry_later(ids)
+
+                raise
+
+            for change in self.__apply(ids, signatures):
+                result = self.on_change(*change)
+
+                if asyncio.iscoroutine(result):
+                    await result
+
+        return len(ids)
+
+    def run(self, stop_event=None):
+        """
+        Poll until stop_event is set, or until nothing is watched when it is omitted. Failed polls are logged
+        and retried later
+        """
+        if stop_event is None:
+            stop_event = threading.Event()
+            keep_waiting = False
+        else:
+            threading.Thread(target=self.__notify_when_set, args=(stop_event,), daemon=True).start()
+            keep_waiting = True
+
+        while not stop_event.is_set():
+            with self.__lock:
+                watches = self.__watches
+
+            wait = self.next_due()
+
+            if wait is None and not keep_waiting:
+                return
+
+            if wait is None or wait > 0:
+                with self.__changed:
+                    self.__changed.wait_for(lambda: stop_event.is_set() or self.__watches != watches, wait)
+            else:
+                try:
+                    self.poll_once()
+                except Exception:
+                    logger.exception('Polling signatures failed')
+
+    async def arun(self, stop_event=None):
+        """
+        asyncio version of run, stop_event is an asyncio.Event
+        """
+        keep_waiting = stop_event is not None
+        stop_event = stop_event or asyncio.Event()
+        wakeup = (asyncio.get_running_loop(), asyncio.Event())
+
+        with self.__lock:
+            self.__wakeups.add(wakeup)
+
+        try:
+            while not stop_event.is_set():
+                wakeup[1].clear()
+                wait = self.next_due()
+
+                if wait is None and not keep_waiting:
+                    return
+
+                if wait is None or wait > 0:
+                    await self.__sleep(stop_event, wakeup[1], wait)
+                else:
+                    try:
+                        await self.apoll_once()
+                    except Exception:
+                        logger.exception('Polling signatures failed')
+        finally:
+            with self.__lock:
+                self.__wakeups.discard(wakeup)
+
+    def __notify_when_set(self, stop_event):
+        """
+        Wake run once stop_event is set, instead of when the next signature is due
+        """
+        stop_event.wait()
+
+        with self.__changed:
+            self.__changed.notify_all()
+
+    @staticmethod
+    async def __sleep(stop_event, wakeup, timeout):
+        """
+        Wait until stop_event or wakeup is set, at most timeout seconds
+        """
+        waits = [asyncio.ensure_future(stop_event.wait()), asyncio.ensure_future(wakeup.wait())]
+
+        try:
+            await asyncio.wait(waits, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in waits:
+                task.cancel()
+
+    def __initial_interval(self, created_at):
+        if created_at is None:
+            return self.min_interval
+
+        if not isinstance(created_at, datetime):
+            created_at = datetime.strptime(created_at, '%Y-%m-%dT%H:%M:%S%z')
+
+        age = time.time() - created_at.timestamp()
+
+        return min(self.max_interval, max(self.min_interval, age / 10))
+
+    def __push(self, signature_id):
+        watched = self.__watched[signature_id]
+
+        heapq.heappush(self.__queue, (watched.due, next(self.__sequence), signature_id))
+
+    def __due_batch(self):
+        now = time.monotonic()
+        ids = []
+
+        with self.__lock:
+            while self.__queue and len(ids) < self.batch_size and self.__queue[0][0] <= now:
+                due, _, signature_id = heapq.heappop(self.__queue)
+                watched = self.__watched.get(signature_id)
+
+                if watched is not None and watched.due == due and signature_id not in ids:
+                    ids.append(signature_id)
+
+        return ids
+
+    def __retry_later(self, ids):
+        """
+        Schedule again the signatures of a failed request, backing off as if they did not change
+        """
+        now = time.monotonic()
+
+        with self.__lock:
+            for signature_id in ids:
+                watched = self.__watched.get(signature_id)
+
+                if watched is None:
+                    continue
+
+                watched.interval = min(self.max_interval, watched.interval * 2)
+                watched.due = now + max(self.RETRY_DELAY, watched.interval)
+                self.__push(signature_id)
+
+    def __apply(self, ids, signatures):
+        """
+        Update the schedule with the polled signatures
+        @return A list of (signature, old statuses, new statuses) changes
+        """
+        changes = []
+        now = time.monotonic()
+        found = dict((signature['id'], signature) for signature in signatures if isinstance(signature, Mapping))
+        finished_statuses = self.client.FINISHED_STATUSES
+
+        with self.__lock:
+            for signature_id in ids:
+                watched = self.__watched.get(signature_id)
+
+                if watched is None:
+                    continue
+
+                signature = found.get(signature_id)
+                statuses = tuple(document.get('status') for document in signature.get('documents', [])) \
+                    if signature is not None else watched.statuses
+
+                if signature is not None and statuses != watched.statuses:
+                    changes.append((signature, watched.statuses, statuses))
+                    watched.statuses = statuses
+                    watched.interval = self.min_interval
+                else:
+                    watched.interval = min(self.max_interval, watched.interval * 2)
+
+                if statuses and all(status in finished_statuses for status in statuses):
+                    del self.__watched[signature_id]
+                    continue
+
+                watched.due = now + watched.interval
+                self.__push(signature_id)
+
+        return changes
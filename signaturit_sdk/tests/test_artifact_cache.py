@@ -0,0 +1,197 @@
+import hashlib
+import io
+import os
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from signaturit_sdk.signaturit_client import SignaturitClient
+from signaturit_sdk.async_signaturit_client import AsyncSignaturitClient
+from signaturit_sdk.resources.artifact_cache import AS_MMAP, AS_PATH, ArtifactCache
+from signaturit_sdk.resources.transport import InMemoryTransport
+import httpx
+import warnings
+
+
+class TestArtifactCache(unittest.TestCase):
+    CONTENT = b'%PDF-1.4' + b'0' * 100
+    FINISHED = {'id': 'SIGN_ID', 'documents': [{'status': 'completed'}]}
+
+    def setUp(self):
+        warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed.*")
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.transport = InMemoryTransport()
+
+        self.transport.add('GET', '/v3/signatures/SIGN_ID.json', self.FINISHED)
+        self.transport.add('GET', '/v3/emails/EMAIL_ID.json',
+                           {'id': 'EMAIL_ID', 'certificates': [{'id': 'CERT_ID', 'status': 'email_delivered'}]})
+        self.transport.add('GET', '/v3/sms/SMS_ID.json',
+                           {'id': 'SMS_ID', 'certificates': [{'id': 'CERT_ID', 'status': 'sms_delivered'}]})
+
+        for document in ('DOC_1', 'DOC_2', 'DOC_3'):
+            self.transport.add('GET', '/v3/signatures/SIGN_ID/documents/%s/download/signed' % document,
+                               lambda request: time.sleep(0.05) or request.url.split('/')[-3].encode() * 20)
+
+        self.transport.add('GET', '/v3/emails/EMAIL_ID/certificates/CERT_ID/download/audit_trail', self.CONTENT)
+        self.transport.add('GET', '/v3/sms/SMS_ID/certificates/CERT_ID/download/audit_trail', self.CONTENT)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def downloads(self):
+        return [request for request in self.transport.requests if '/download/' in request.url]
+
+    def test_downloads_are_served_from_disk(self):
+        cache = ArtifactCache(self.directory.name)
+        client = SignaturitClient('SOME_TOKEN', transport=self.transport, artifact_cache=cache)
+        sha256 = hashlib.sha256(self.CONTENT).hexdigest()
+
+        self.assertEqual(self.CONTENT, client.download_email_audit_trail('EMAIL_ID', 'CERT_ID', finished=True))
+
+        path = client.download_email_audit_trail('EMAIL_ID', 'CERT_ID', AS_PATH, finished=True)
+        view = client.download_email_audit_trail('EMAIL_ID', 'CERT_ID', AS_MMAP, finished=True)
+        copy = os.path.join(self.directory.name, 'copy.pdf')
+        result = client.download_email_audit_trail('EMAIL_ID', 'CERT_ID', copy)
+        destination = io.BytesIO()
+
+        self.assertEqual(cache.object_path(sha256), path)
+        self.assertEqual(self.CONTENT, view[:])
+        self.assertEqual({'bytes': len(self.CONTENT), 'sha256': sha256, 'path': copy}, result)
+        self.assertEqual(self.CONTENT, client.download_email_audit_trail('EMAIL_ID', 'CERT_ID', destination) and
+                         destination.getvalue())
+        self.assertEqual(1, len(self.transport.requests))
+
+        view.close()
+
+        client.download_SMS_audit_trail('SMS_ID', 'CERT_ID', finished=True)
+
+        self.assertEqual(2, len(self.transport.requests))
+        self.assertEqual(len(self.CONTENT), cache.size())
+
+    def test_email_and_sms_files_are_only_cached_when_finished(self):
+        cache = ArtifactCache(self.directory.name)
+        client = SignaturitClient('SOME_TOKEN', transport=self.transport, artifact_cache=cache)
+
+        for _ in range(2):
+            self.assertEqual(self.CONTENT, client.download_email_audit_trail('EMAIL_ID', 'CERT_ID'))
+            self.assertEqual(self.CONTENT, client.download_SMS_audit_trail('SMS_ID', 'CERT_ID'))
+
+        # Their certificate statuses are not checked, every download is sent
+        self.assertEqual(4, len(self.transport.requests))
+        self.assertEqual(4, len(self.downloads()))
+        self.assertEqual(0, cache.size())
+
+        with self.assertRaises(ValueError):
+            client.download_email_audit_trail('EMAIL_ID', 'CERT_ID', AS_PATH)
+
+    def test_eviction(self):
+        cache = ArtifactCache(self.directory.name, max_bytes=250)
+        client = SignaturitClient('SOME_TOKEN', transport=self.transport, artifact_cache=cache)
+
+        for document in ('DOC_1', 'DOC_2', 'DOC_1', 'DOC_3'):
+            client.download_signed_document('SIGN_ID', document, finished=True)
+            time.sleep(0.01)
+
+        self.assertEqual(3, len(self.transport.requests))
+        self.assertLessEqual(cache.size(), 250)
+
+        client.download_signed_document('SIGN_ID', 'DOC_1', finished=True)
+        client.download_signed_document('SIGN_ID', 'DOC_2', finished=True)
+
+        self.assertEqual(4, len(self.transport.requests))
+
+    def test_errors_are_not_cached(self):
+        client = SignaturitClient('SOME_TOKEN', transport=self.transport,
+                                  artifact_cache=ArtifactCache(self.directory.name))
+
+        for _ in range(2):
+            self.assertEqual({'message': 'Not found'},
+                             client.download_audit_trail('SIGN_ID', 'DOC_ID', AS_PATH, finished=True))
+
+        self.assertEqual(2, len(self.transport.requests))
+        self.assertEqual([], os.listdir(os.path.join(self.directory.name, 'tmp')))
+
+        self.assertRaises(ValueError, SignaturitClient('SOME_TOKEN').download_audit_trail, 'SIGN_ID', 'DOC_ID',
+                          AS_MMAP)
+
+    def test_concurrent_downloads_are_sent_once(self):
+        def download(_):
+            # a cache per caller, as separate processes would have
+            client = SignaturitClient('SOME_TOKEN', transport=self.transport,
+                                      artifact_cache=ArtifactCache(self.directory.name))
+
+            return client.download_signed_document('SIGN_ID', 'DOC_1')
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(download, range(4)))
+
+        self.assertEqual(1, len(set(results)))
+        self.assertEqual(1, len(self.downloads()))
+
+    def test_files_of_unfinished_processes_are_not_cached(self):
+        version = [b'v1']
+
+        self.transport.add('GET', '/v3/signatures/SIGN_ID.json', lambda request: {
+            'id': 'SIGN_ID', 'documents': [{'status': 'completed' if version[0] == b'v3' else 'ready'}]})
+        self.transport.add('GET', '/v3/signatures/SIGN_ID/documents/DOC_ID/download/audit_trail',
+                           lambda request: version[0])
+
+        cache = ArtifactCache(self.directory.name)
+        client = SignaturitClient('SOME_TOKEN', transport=self.transport, artifact_cache=cache)
+
+        self.assertEqual(b'v1', client.download_audit_trail('SIGN_ID', 'DOC_ID'))
+
+        version[0] = b'v2'
+
+        self.assertEqual(b'v2', client.download_audit_trail('SIGN_ID', 'DOC_ID'))
+        self.assertEqual(0, cache.size())
+        self.assertRaises(ValueError, client.download_audit_trail, 'SIGN_ID', 'DOC_ID', AS_PATH)
+
+        version[0] = b'v3'
+
+        self.assertEqual(b'v3', client.download_audit_trail('SIGN_ID', 'DOC_ID'))
+        self.assertEqual(b'v3', client.download_audit_trail('SIGN_ID', 'DOC_ID', finished=False))
+        self.assertEqual(b'v3', client.download_audit_trail('SIGN_ID', 'DOC_ID'))
+        self.assertEqual(4, len(self.downloads()))
+        self.assertEqual(2, cache.size())
+
+    def test_empty_files(self):
+        cache = ArtifactCache(self.directory.name)
+        temporary = cache.temporary()
+        sha256 = hashlib.sha256(b'').hexdigest()
+        path = cache.put('empty', temporary, sha256)
+
+        self.assertEqual(b'', cache.deliver(path, sha256, AS_MMAP))
+        self.assertEqual({'bytes': 0, 'sha256': sha256}, cache.deliver(path, sha256, io.BytesIO()))
+
+
+class TestAsyncArtifactCache(unittest.IsolatedAsyncioTestCase):
+    async def test_downloads_are_served_from_disk(self):
+        calls = []
+
+        def handler(request):
+            if request.url.path == '/v3/signatures/SIGN_ID.json':
+                return httpx.Response(200, json={'id': 'SIGN_ID', 'documents': [{'status': 'completed'}]})
+
+            calls.append(request)
+
+            return httpx.Response(200, content=b'%PDF-1.4')
+
+        with tempfile.TemporaryDirectory() as directory:
+            client = AsyncSignaturitClient('SOME_TOKEN', artifact_cache=ArtifactCache(directory),
+                                           http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+            async with client:
+                self.assertEqual(b'%PDF-1.4', await client.download_signed_document('SIGN_ID', 'DOC_ID'))
+
+                path = await client.download_signed_document('SIGN_ID', 'DOC_ID', AS_PATH)
+
+                with open(path, 'rb') as file:
+                    self.assertEqual(b'%PDF-1.4', file.read())
+
+        self.assertEqual(1, len(calls))
+
+
+if __name__ == '__main__':
+    unittest.main()
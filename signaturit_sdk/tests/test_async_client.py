@@ -0,0 +1,61 @@
+import json
+import unittest
+from signaturit_sdk.async_signaturit_client import AsyncSignaturitClient
+import asyncio
+import httpx
+
+
+class TestAsyncClient(unittest.IsolatedAsyncioTestCase):
+    def client(self, handler):
+        return AsyncSignaturitClient('SOME_TOKEN', http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    async def test_public_methods_are_coroutines(self):
+        for name in ('get_signature', 'get_signatures', 'create_email', 'get_SMS', 'get_brandings', 'get_templates',
+                     'get_users', 'get_subscriptions', 'delete_contact', 'download_signed_document'):
+            self.assertTrue(asyncio.iscoroutinefunction(getattr(AsyncSignaturitClient, name)), name)
+
+    async def test_get_signature(self):
+        def handler(request):
+            self.assertEqual('https://api.sandbox.signaturit.com/v3/signatures/SIGNATURE_ID.json', str(request.url))
+            self.assertEqual('Bearer SOME_TOKEN', request.headers['Authorization'])
+
+            return httpx.Response(200, json={'id': 'SIGNATURE_ID'})
+
+        async with self.client(handler) as client:
+            response = await client.get_signature('SIGNATURE_ID')
+
+        self.assertEqual('SIGNATURE_ID', response['id'])
+
+    async def test_create_contact_sends_json(self):
+        def handler(request):
+            self.assertEqual('POST', request.method)
+            self.assertEqual({'email': 'bob@signaturit.com', 'name': 'Bob'}, json.loads(request.content))
+
+            return httpx.Response(200, json={'id': 'CONTACT_ID'})
+
+        async with self.client(handler) as client:
+            response = await client.create_contact('bob@signaturit.com', 'Bob')
+
+        self.assertEqual('CONTACT_ID', response['id'])
+
+    async def test_download_signed_document(self):
+        def handler(request):
+            return httpx.Response(200, content=b'%PDF', headers={'content-type': 'application/pdf'})
+
+        async with self.client(handler) as client:
+            response = await client.download_signed_document('SIGNATURE_ID', 'DOCUMENT_ID')
+
+        self.assertEqual(b'%PDF', response)
+
+    async def test_concurrent_requests(self):
+        def handler(request):
+            return httpx.Response(200, json={'path': request.url.path})
+
+        async with self.client(handler) as client:
+            responses = await asyncio.gather(*[client.get_branding(index) for index in range(10)])
+
+        self.assertEqual('/v3/brandings/9.json', responses[9]['path'])
+
+
+if __name__ == '__main__':
+    unittest.main()
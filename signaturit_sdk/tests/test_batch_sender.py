@@ -0,0 +1,71 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from signaturit_sdk.batch_sender import BatchSender, DocumentCache
+
+
+class FakeClient:
+    def __init__(self):
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def create_signature(self, files, recipients, params):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        time.sleep(0.01 * (params['index'] % 3))
+
+        with self.lock:
+            self.in_flight -= 1
+            self.calls.append(files)
+
+        if params['index'] == 2:
+            raise IOError('Connection reset')
+
+        return {'id': params['index']}
+
+
+class TestBatchSender(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.pdf')
+
+        with os.fdopen(handle, 'wb') as document:
+            document.write(b'%PDF')
+
+    def tearDown(self):
+        os.unlink(self.path)
+
+    def test_results_are_yielded_in_order(self):
+        client = FakeClient()
+
+        jobs = ((self.path, [{'email': 'test@test.com'}], {'index': index}) for index in range(10))
+
+        results = list(BatchSender(client, max_in_flight=3).send_signatures(jobs))
+
+        self.assertEqual(list(range(10)), [result.index for result in results])
+        self.assertEqual({'id': 0}, results[0].response)
+        self.assertIsInstance(results[2].error, IOError)
+        self.assertLessEqual(client.max_in_flight, 3)
+        self.assertEqual([(os.path.basename(self.path), b'%PDF')], client.calls[0])
+        self.assertIs(client.calls[0][0][1], client.calls[1][0][1])
+
+    def test_document_cache_is_bounded(self):
+        cache = DocumentCache(max_bytes=6)
+
+        self.assertEqual(b'%PDF', cache.get(self.path)[1])
+        self.assertEqual(4, cache.size)
+
+        with open(self.path, 'ab') as document:
+            document.write(b'-1.4')
+
+        self.assertEqual(self.path, cache.get(self.path))
+        self.assertEqual(4, cache.size)
+
+
+if __name__ == '__main__':
+    unittest.main()
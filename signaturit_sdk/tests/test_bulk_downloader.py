@@ -0,0 +1,115 @@
+import json
+import os
+import re
+import tempfile
+import time
+import unittest
+from signaturit_sdk.signaturit_client import SignaturitClient
+from signaturit_sdk.bulk_downloader import BulkDownloader
+from signaturit_sdk.resources.artifact_cache import ArtifactCache
+from signaturit_sdk.resources.deadline import DeadlineExceeded, deadline
+from signaturit_sdk.resources.transport import InMemoryTransport
+import httpretty
+import warnings
+
+
+class TestBulkDownloader(unittest.TestCase):
+    SIGNATURES = '[{"id": "S1", "documents": [{"id": "D1", "status": "completed"}, {"id": "D2", "status": "ready"}]},' \
+                 ' {"id": "S2", "documents": [{"id": "D3", "status": "completed"}]}]'
+
+    def setUp(self):
+        warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed.*")
+
+    def register_uris(self):
+        httpretty.register_uri(httpretty.GET, "https://api.sandbox.signaturit.com/v3/signatures.json",
+                               body=self.SIGNATURES, content_type="application/json")
+        httpretty.register_uri(httpretty.GET, re.compile(r'.*/download/(signed|audit_trail)$'),
+                               body=lambda request, uri, headers: [200, headers, uri.encode()])
+
+    @httpretty.activate
+    def test_download_and_resume(self):
+        self.register_uris()
+
+        with tempfile.TemporaryDirectory() as directory, SignaturitClient('SOME_TOKEN') as client:
+            downloader = BulkDownloader(client, directory, workers=2)
+
+            summary = downloader.download(signature_ids=['S1', 'S2'])
+
+            self.assertEqual({'downloaded': 4, 'skipped': 0, 'failed': {}}, summary)
+            self.assertEqual(['S1', 'S2'], httpretty.latest_requests()[0].querystring['ids'][0].split(','))
+
+            with open(os.path.join(directory, 'S1', 'D1_signed.pdf'), 'rb') as document:
+                self.assertTrue(document.read().endswith(b'/signatures/S1/documents/D1/download/signed'))
+
+            self.assertEqual(4, len(downloader.completed()))
+
+            os.remove(os.path.join(directory, 'S2', 'D3_audit_trail.pdf'))
+
+            summary = downloader.download(conditions={'status': 3})
+
+            self.assertEqual({'downloaded': 1, 'skipped': 3, 'failed': {}}, summary)
+
+    @httpretty.activate
+    def test_failed_downloads_are_not_recorded(self):
+        httpretty.register_uri(httpretty.GET, re.compile(r'.*/download/audit_trail$'), status=404,
+                               body='{"message": "Not found"}', content_type="application/json")
+        self.register_uris()
+
+        with tempfile.TemporaryDirectory() as directory, SignaturitClient('SOME_TOKEN') as client:
+            downloader = BulkDownloader(client, directory)
+
+            summary = downloader.download(signature_ids=['S1', 'S2'])
+
+            self.assertEqual(2, summary['downloaded'])
+            self.assertEqual(['S1/D1/audit_trail', 'S2/D3/audit_trail'], sorted(summary['failed']))
+            self.assertEqual({'message': 'Not found'}, summary['failed']['S1/D1/audit_trail'])
+            self.assertFalse(os.path.exists(os.path.join(directory, 'S1', 'D1_audit_trail.pdf.part')))
+
+            with open(downloader.manifest_path) as manifest:
+                keys = sorted(json.loads(line)['key'] for line in manifest)
+
+            self.assertEqual(['S1/D1/signed', 'S2/D3/signed'], keys)
+
+
+    def test_deadline_stops_the_download(self):
+        transport = InMemoryTransport()
+        transport.add('GET', '/v3/signatures.json', json.loads(self.SIGNATURES))
+
+        for document in ('S1/documents/D1', 'S2/documents/D3'):
+            transport.add('GET', '/v3/signatures/%s/download/signed' % document,
+                          lambda request: time.sleep(0.2) or b'%PDF-1.4')
+
+        with tempfile.TemporaryDirectory() as directory:
+            client = SignaturitClient('SOME_TOKEN', transport=transport)
+            downloader = BulkDownloader(client, directory, workers=1, kinds=(BulkDownloader.SIGNED,))
+
+            with deadline(0.1):
+                self.assertRaises(DeadlineExceeded, downloader.download, signature_ids=['S1', 'S2'])
+
+            self.assertEqual({}, downloader.completed())
+            self.assertEqual([], os.listdir(os.path.join(directory, 'S1')))
+
+    def test_completed_documents_are_cached_without_status_requests(self):
+        transport = InMemoryTransport()
+        transport.add('GET', '/v3/signatures.json', json.loads(self.SIGNATURES))
+
+        for document in ('S1/documents/D1', 'S2/documents/D3'):
+            transport.add('GET', '/v3/signatures/%s/download/signed' % document, b'%PDF-1.4')
+
+        with tempfile.TemporaryDirectory() as directory:
+            client = SignaturitClient('SOME_TOKEN', transport=transport,
+                                      artifact_cache=ArtifactCache(os.path.join(directory, 'cache')))
+
+            for target in ('first', 'second'):
+                downloader = BulkDownloader(client, os.path.join(directory, target), kinds=(BulkDownloader.SIGNED,))
+
+                self.assertEqual(2, downloader.download(signature_ids=['S1', 'S2'])['downloaded'])
+
+        urls = [request.url for request in transport.requests]
+
+        self.assertEqual(2, len([url for url in urls if '/download/' in url]))
+        self.assertEqual([], [url for url in urls if re.search(r'/signatures/S\d\.json$', url)])
+
+
+if __name__ == '__main__':
+    unittest.main()
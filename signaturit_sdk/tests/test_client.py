@@ -0,0 +1,49 @@
+import unittest
+from signaturit_sdk.signaturit_client import SignaturitClient
+import httpretty
+import requests
+import warnings
+from unittest import mock
+
+
+class TestClient(unittest.TestCase):
+    def setUp(self):
+        warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed.*")
+
+    def test_connections_share_the_client_session(self):
+        client = SignaturitClient('TOKEN', pool_maxsize=4)
+
+        adapter = client._session.get_adapter('https://api.sandbox.signaturit.com')
+
+        self.assertEqual(4, adapter._pool_maxsize)
+        self.assertIs(client._connection()._Connection__transport, client._connection()._Connection__transport)
+
+    def test_close_releases_owned_session(self):
+        with SignaturitClient('TOKEN') as client:
+            pass
+
+        self.assertRaises(RuntimeError, client.get_signatures)
+
+    def test_close_keeps_external_session_open(self):
+        session = mock.Mock(spec=requests.Session)
+
+        client = SignaturitClient('TOKEN', session=session)
+        client.close()
+
+        session.close.assert_not_called()
+
+    @httpretty.activate
+    def test_requests_go_through_pooled_session(self):
+        httpretty.register_uri(httpretty.GET, "https://api.sandbox.signaturit.com/v3/brandings.json",
+                               body='[]',
+                               content_type="application/json")
+
+        with SignaturitClient('SOME_TOKEN') as client:
+            self.assertEqual([], client.get_brandings())
+            self.assertEqual([], client.get_brandings())
+
+        self.assertEqual('Bearer SOME_TOKEN', httpretty.last_request().headers['Authorization'])
+
+
+if __name__ == '__main__':
+    unittest.main()
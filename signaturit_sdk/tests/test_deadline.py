@@ -0,0 +1,134 @@
+import time
+import unittest
+from signaturit_sdk.signaturit_client import SignaturitClient
+from signaturit_sdk.async_signaturit_client import AsyncSignaturitClient
+from signaturit_sdk.resources.deadline import DEFAULT_TIMEOUT, DeadlineExceeded, deadline, remaining
+from signaturit_sdk.resources.multi_get import fetch_by_ids
+from signaturit_sdk.resources.retry import RetryPolicy
+import httpretty
+import httpx
+import requests
+import warnings
+
+
+class RecordingSession:
+    def __init__(self):
+        self.timeouts = []
+        self.closed = False
+
+    def request(self, method, url, headers=None, timeout=None, **kwargs):
+        self.timeouts.append(timeout)
+
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"id": "SIGN_ID"}'
+
+        return response
+
+    def close(self):
+        self.closed = True
+
+
+class TestDeadline(unittest.TestCase):
+    def setUp(self):
+        warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed.*")
+
+    def test_timeouts(self):
+        session = RecordingSession()
+        client = SignaturitClient('SOME_TOKEN', session=session)
+
+        client.get_signature('SIGN_ID')
+        client.with_timeout((1, 300)).get_signature('SIGN_ID')
+        SignaturitClient('SOME_TOKEN', session=session, timeout=False).get_signature('SIGN_ID')
+
+        with deadline(5):
+            client.get_signature('SIGN_ID')
+
+        self.assertEqual([DEFAULT_TIMEOUT, (1, 300), None], session.timeouts[:3])
+        self.assertEqual(2, len(session.timeouts[3]))
+        self.assertLessEqual(max(session.timeouts[3]), 5)
+
+    def test_with_timeout_shares_the_session(self):
+        client = SignaturitClient('SOME_TOKEN', session=RecordingSession())
+        client._owns_session = True
+
+        with client.with_timeout(1) as copy:
+            self.assertEqual(1, copy.timeout)
+
+        self.assertFalse(client._session.closed)
+        self.assertEqual(DEFAULT_TIMEOUT, client.timeout)
+
+    def test_expired_deadline(self):
+        session = RecordingSession()
+        client = SignaturitClient('SOME_TOKEN', session=session)
+
+        with deadline(0.01):
+            time.sleep(0.02)
+
+            with self.assertRaises(DeadlineExceeded):
+                client.get_signature('SIGN_ID')
+
+        self.assertEqual([], session.timeouts)
+
+    @httpretty.activate
+    def test_retries_stop_at_the_deadline(self):
+        httpretty.register_uri(httpretty.GET, "https://api.sandbox.signaturit.com/v3/templates.json",
+                               body='{"message": "Unavailable"}', status=503, adding_headers={'Retry-After': '5'})
+
+        client = SignaturitClient('SOME_TOKEN', retry=RetryPolicy(total=3))
+        start = time.monotonic()
+
+        with deadline(1):
+            self.assertEqual({'message': 'Unavailable'}, client.get_templates())
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(1, len(httpretty.latest_requests()))
+
+    def test_deadline_follows_worker_threads(self):
+        budgets = []
+
+        def fetch(chunk):
+            budgets.append(remaining())
+
+            return [{'id': item} for item in chunk]
+
+        with deadline(10):
+            with deadline(20):
+                self.assertLessEqual(remaining(), 10)
+
+            fetch_by_ids(fetch, [['A'], ['B'], ['C']], workers=3)
+
+        self.assertIsNone(remaining())
+        self.assertEqual(3, len(budgets))
+        self.assertTrue(all(0 < budget <= 10 for budget in budgets))
+
+
+class TestAsyncDeadline(unittest.IsolatedAsyncioTestCase):
+    async def test_timeouts(self):
+        timeouts = []
+
+        def handler(request):
+            timeouts.append(request.extensions['timeout'])
+
+            return httpx.Response(200, json={'id': 'SIGN_ID'})
+
+        client = AsyncSignaturitClient('SOME_TOKEN', timeout=(2, 30),
+                                       http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+        async with client:
+            await client.get_signature('SIGN_ID')
+
+            with deadline(5):
+                await client.with_timeout(60).get_signature('SIGN_ID')
+
+            with deadline(0):
+                with self.assertRaises(DeadlineExceeded):
+                    await client.get_signature('SIGN_ID')
+
+        self.assertEqual((2, 30), (timeouts[0]['connect'], timeouts[0]['read']))
+        self.assertLessEqual(timeouts[1]['read'], 5)
+        self.assertEqual(2, len(timeouts))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+from signaturit_sdk.signaturit_client import SignaturitClient
+from signaturit_sdk.async_signaturit_client import AsyncSignaturitClient
+from signaturit_sdk.resources.decoder import decode_json, decode_raw, get_decoder, orjson
+import httpretty
+import httpx
+import warnings
+
+
+class TestDecoder(unittest.TestCase):
+    def setUp(self):
+        warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed.*")
+
+    def test_get_decoder(self):
+        self.assertIs(decode_json, get_decoder())
+        self.assertIs(decode_raw, get_decoder('raw'))
+        self.assertIs(len, get_decoder(len))
+        self.assertRaises(ValueError, get_decoder, 'yaml')
+
+    def test_decoders_parse_bytes(self):
+        body = '[{"id": "S1", "name": "Señal"}]'.encode('utf-8')
+
+        for name in ('json', 'fastest') + (('orjson',) if orjson is not None else ()):
+            self.assertEqual([{'id': 'S1', 'name': 'Señal'}], get_decoder(name)(body))
+
+    @httpretty.activate
+    def test_client_uses_decoder(self):
+        httpretty.register_uri(httpretty.GET, 'https://api.sandbox.signaturit.com/v3/signatures/S1.json',
+                               body='{"id": "S1"}', content_type='application/json')
+
+        self.assertEqual({'id': 'S1'}, SignaturitClient('TOKEN').get_signature('S1'))
+        self.assertEqual(b'{"id": "S1"}', SignaturitClient('TOKEN', decoder='raw').get_signature('S1'))
+        self.assertEqual(12, SignaturitClient('TOKEN', decoder=len).get_signature('S1'))
+
+
+class TestAsyncDecoder(unittest.IsolatedAsyncioTestCase):
+    async def test_client_uses_decoder(self):
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=b'{"id": "E1"}')))
+
+        async with AsyncSignaturitClient('TOKEN', http_client=http_client, decoder='raw') as client:
+            self.assertEqual(b'{"id": "E1"}', await client.get_email('E1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
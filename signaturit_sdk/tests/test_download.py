@@ -0,0 +1,90 @@
+import hashlib
+import io
+import os
+import tempfile
+import unittest
+from signaturit_sdk.signaturit_client import SignaturitClient
+from signaturit_sdk.async_signaturit_client import AsyncSignaturitClient
+import httpretty
+import httpx
+import warnings
+
+
+class TestDownload(unittest.TestCase):
+    SIGNED_URL = "https://api.sandbox.signaturit.com/v3/signatures/SIGNATURE_ID/documents/DOCUMENT_ID/download/signed"
+    CONTENT = b'%PDF-1.4' + b'0' * 200000
+
+    def setUp(self):
+        warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed.*")
+
+    @httpretty.activate
+    def test_download_signed_document_returns_content(self):
+        httpretty.register_uri(httpretty.GET, self.SIGNED_URL, body=self.CONTENT, content_type="application/pdf")
+
+        with SignaturitClient('SOME_TOKEN') as client:
+            self.assertEqual(self.CONTENT, client.download_signed_document('SIGNATURE_ID', 'DOCUMENT_ID'))
+
+    @httpretty.activate
+    def test_download_signed_document_to_path(self):
+        httpretty.register_uri(httpretty.GET, self.SIGNED_URL, body=self.CONTENT, content_type="application/pdf")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'signed.pdf')
+
+            with SignaturitClient('SOME_TOKEN') as client:
+                result = client.download_signed_document('SIGNATURE_ID', 'DOCUMENT_ID', path, chunk_size=1024,
+                                                         checksum=True)
+
+            with open(path, 'rb') as stored:
+                self.assertEqual(self.CONTENT, stored.read())
+
+        self.assertEqual(len(self.CONTENT), result['bytes'])
+        self.assertEqual(hashlib.sha256(self.CONTENT).hexdigest(), result['sha256'])
+        self.assertEqual(path, result['path'])
+
+    @httpretty.activate
+    def test_download_audit_trail_to_file_object(self):
+        httpretty.register_uri(httpretty.GET,
+                               "https://api.sandbox.signaturit.com/v3/emails/EMAIL_ID/certificates/CERT_ID/download/audit_trail",
+                               body=self.CONTENT, content_type="application/pdf")
+
+        destination = io.BytesIO()
+
+        with SignaturitClient('SOME_TOKEN') as client:
+            result = client.download_email_audit_trail('EMAIL_ID', 'CERT_ID', destination)
+
+        self.assertEqual(self.CONTENT, destination.getvalue())
+        self.assertEqual({'bytes': len(self.CONTENT), 'sha256': None}, result)
+
+    @httpretty.activate
+    def test_download_error_is_not_written(self):
+        httpretty.register_uri(httpretty.GET, self.SIGNED_URL, status=404, body='{"message": "Not found"}',
+                               content_type="application/json")
+
+        destination = io.BytesIO()
+
+        with SignaturitClient('SOME_TOKEN') as client:
+            result = client.download_signed_document('SIGNATURE_ID', 'DOCUMENT_ID', destination)
+
+        self.assertEqual({'message': 'Not found'}, result)
+        self.assertEqual(b'', destination.getvalue())
+
+
+class TestAsyncDownload(unittest.IsolatedAsyncioTestCase):
+    async def test_download_SMS_audit_trail_to_file_object(self):
+        def handler(request):
+            return httpx.Response(200, content=TestDownload.CONTENT, headers={'content-type': 'application/pdf'})
+
+        destination = io.BytesIO()
+
+        client = AsyncSignaturitClient('SOME_TOKEN', http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+        async with client:
+            result = await client.download_SMS_audit_trail('SMS_ID', 'CERT_ID', destination, checksum=True)
+
+        self.assertEqual(TestDownload.CONTENT, destination.getvalue())
+        self.assertEqual(hashlib.sha256(TestDownload.CONTENT).hexdigest(), result['sha256'])
+
+
+if __name__ == '__main__':
+    unittest.main()
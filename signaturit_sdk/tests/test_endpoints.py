@@ -0,0 +1,87 @@
+import inspect
+import unittest
+from signaturit_sdk.signaturit_client import SignaturitClient
+from signaturit_sdk.async_signaturit_client import AsyncSignaturitClient
+from signaturit_sdk.resources.endpoints import ENDPOINTS, encode_query
+import httpretty
+import httpx
+import json
+import re
+import warnings
+
+
+class TestEndpoints(unittest.TestCase):
+    def setUp(self):
+        warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed.*")
+
+    def test_every_endpoint_has_a_client_method(self):
+        for endpoint in ENDPOINTS:
+            method = getattr(SignaturitClient, endpoint.name)
+
+            self.assertEqual(endpoint.name, method.__name__)
+            self.assertTrue(callable(getattr(AsyncSignaturitClient, endpoint.name)))
+
+        self.assertEqual(['self', 'limit', 'offset', 'conditions'],
+                         list(inspect.signature(SignaturitClient.get_signatures).parameters))
+
+    def test_arguments_are_checked(self):
+        client = SignaturitClient('TOKEN')
+
+        self.assertRaises(TypeError, client.get_signature)
+        self.assertRaises(TypeError, client.get_signature, 'S1', 'S2')
+        self.assertRaises(TypeError, client.get_signature, signature_id='S1', other=1)
+        self.assertRaises(TypeError, client.get_group, 'G1', group_id='G1')
+
+    def test_encode_query(self):
+        self.assertEqual('limit=10&ids=A%2CB&crm_id=a+b%26c', encode_query({'limit': 10, 'ids': ['A', 'B'],
+                                                                           'crm_id': 'a b&c'}))
+
+    @httpretty.activate
+    def test_query_is_encoded(self):
+        httpretty.register_uri(httpretty.GET, re.compile(r'https://api.sandbox.signaturit.com/v3/signatures.json.*'),
+                               body='[]', content_type='application/json')
+
+        SignaturitClient('TOKEN').get_signatures(5, 10, {'ids': ['S1', 'S2'], 'crm_id': 'a&b'})
+
+        self.assertEqual('/v3/signatures.json?limit=5&offset=10&ids=S1%2CS2&crm_id=a%26b',
+                         httpretty.last_request().path)
+
+    @httpretty.activate
+    def test_count_without_conditions(self):
+        httpretty.register_uri(httpretty.GET, 'https://api.sandbox.signaturit.com/v3/emails/count.json',
+                               body='{"count": 3}', content_type='application/json')
+
+        self.assertEqual({'count': 3}, SignaturitClient('TOKEN').count_emails())
+        self.assertEqual('/v3/emails/count.json', httpretty.last_request().path)
+
+    @httpretty.activate
+    def test_optional_fields_and_json_body(self):
+        httpretty.register_uri(httpretty.PATCH, 'https://api.sandbox.signaturit.com/v3/contacts/C1.json',
+                               body='{"id": "C1"}', content_type='application/json')
+
+        SignaturitClient('TOKEN').update_contact('C1', name='Bob')
+
+        self.assertEqual({'name': 'Bob'}, json.loads(httpretty.last_request().body))
+        self.assertEqual('application/json', httpretty.last_request().headers['Content-Type'])
+
+
+class TestAsyncEndpoints(unittest.IsolatedAsyncioTestCase):
+    async def test_generated_methods_are_coroutines(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+
+            return httpx.Response(200, json={'id': 'G1'})
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async with AsyncSignaturitClient('TOKEN', http_client=http_client) as client:
+            self.assertEqual({'id': 'G1'}, await client.add_manager_to_group('G1', 'U1'))
+
+        self.assertEqual('POST', requests[0].method)
+        self.assertEqual('/v3/team/groups/G1/managers/U1.json', requests[0].url.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
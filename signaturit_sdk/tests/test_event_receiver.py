@@ -0,0 +1,140 @@
+import asyncio
+import io
+import json
+import threading
+import time
+import unittest
+from wsgiref.util import setup_testing_defaults
+from signaturit_sdk.event_receiver import EventReceiver
+
+
+class TestEventReceiver(unittest.TestCase):
+    EVENT = json.dumps({'type': 'document_completed', 'created_at': '2016-01-01T10:00:00+0000',
+                        'document': {'id': 'DOCUMENT_ID'}}).encode()
+
+    def post(self, receiver, body, content_type='application/json'):
+        environ = {'REQUEST_METHOD': 'POST', 'CONTENT_TYPE': content_type, 'CONTENT_LENGTH': str(len(body)),
+                   'wsgi.input': io.BytesIO(body)}
+        setup_testing_defaults(environ)
+        statuses = []
+
+        body = b''.join(receiver(environ, lambda status, headers: statuses.append(status)))
+
+        return statuses[0], body
+
+    def test_events_are_dispatched_once(self):
+        receiver = EventReceiver(workers=2)
+        received = []
+
+        receiver.on('document_completed', received.append)
+        receiver.on('*', lambda event: received.append(event['type']))
+        receiver.on('email_delivered', lambda event: self.fail('Wrong handler'))
+
+        self.assertEqual(('200 OK', b'accepted'), self.post(receiver, self.EVENT))
+        self.assertEqual(('200 OK', b'duplicate'), self.post(receiver, self.EVENT))
+
+        receiver.close()
+
+        self.assertEqual([json.loads(self.EVENT), 'document_completed'], received)
+
+    def test_form_encoded_and_invalid_events(self):
+        receiver = EventReceiver()
+        received = []
+
+        receiver.on(handler=received.append)
+
+        self.assertEqual(('200 OK', b'accepted'),
+                         self.post(receiver, b'type=email_opened&created_at=now', 'application/x-www-form-urlencoded'))
+        self.assertEqual(('400 Bad Request', b'invalid'), self.post(receiver, b'not json'))
+        self.assertEqual(('400 Bad Request', b'invalid'), self.post(receiver, b'{"no": "type"}'))
+
+        receiver.close()
+
+        self.assertEqual([{'type': 'email_opened', 'created_at': 'now'}], received)
+
+    def test_busy_receiver_answers_503(self):
+        receiver = EventReceiver(workers=1, max_pending=1)
+        release = threading.Event()
+
+        receiver.on(handler=lambda event: release.wait(5))
+
+        self.assertEqual(receiver.ACCEPTED, receiver.dispatch(b'{"type": "a"}'))
+        self.assertEqual(('503 Service Unavailable', b'busy'), self.post(receiver, b'{"type": "b"}'))
+
+        release.set()
+
+        for _ in range(100):
+            result = receiver.dispatch(b'{"type": "b"}')
+
+            if result != receiver.BUSY:
+                break
+
+            time.sleep(0.01)
+
+        receiver.close()
+
+        self.assertEqual(receiver.ACCEPTED, result)
+
+    def test_asgi_runs_coroutine_handlers_on_the_loop(self):
+        receiver = EventReceiver()
+        received = []
+
+        async def handler(event):
+            received.append(event['document']['id'])
+
+        receiver.on('document_completed', handler)
+
+        async def request():
+            sent = []
+            messages = [{'type': 'http.request', 'body': self.EVENT[:10], 'more_body': True},
+                        {'type': 'http.request', 'body': self.EVENT[10:]}]
+
+            async def receive():
+                return messages.pop(0)
+
+            async def send(message):
+                sent.append(message)
+
+            scope = {'type': 'http', 'method': 'POST', 'headers': [(b'content-type', b'application/json')]}
+
+            await receiver.asgi(scope, receive, send)
+            await asyncio.sleep(0)
+
+            return sent
+
+        sent = asyncio.run(request())
+
+        self.assertEqual(200, sent[0]['status'])
+        self.assertEqual(b'accepted', sent[1]['body'])
+        self.assertEqual(['DOCUMENT_ID'], received)
+
+    def test_asgi_handles_at_most_workers_events_at_once(self):
+        receiver = EventReceiver(workers=2)
+        running = []
+        peak = []
+
+        async def handler(event):
+            running.append(event['document']['id'])
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(event['document']['id'])
+
+        receiver.on('document_completed', handler)
+
+        async def dispatch():
+            for index in range(6):
+                event = {'type': 'document_completed', 'created_at': '2016-01-01T10:00:00+0000',
+                         'document': {'id': 'DOCUMENT_%d' % index}}
+
+                self.assertEqual(receiver.ACCEPTED, receiver.dispatch(json.dumps(event).encode()))
+
+            while len(peak) < 6 or running:
+                await asyncio.sleep(0.01)
+
+        asyncio.run(dispatch())
+
+        self.assertEqual(2, max(peak))
+
+
+if __name__ == '__main__':
+    unittest.main()
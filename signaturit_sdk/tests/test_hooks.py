@@ -0,0 +1,153 @@
+import io
+import unittest
+from signaturit_sdk.signaturit_client import SignaturitClient
+from signaturit_sdk.async_signaturit_client import AsyncSignaturitClient
+from signaturit_sdk.resources.hooks import Hooks
+from signaturit_sdk.resources.metrics import Metrics
+from signaturit_sdk.resources.retry import RetryPolicy
+import httpretty
+import httpx
+import warnings
+
+
+class Recorder(Hooks):
+    def __init__(self):
+        self.calls = []
+
+    def before_send(self, info):
+        self.calls.append(('before_send', info.method, info.endpoint, info.attempt))
+
+    def after_response(self, info):
+        self.calls.append(('after_response', info.status, info.bytes_received))
+
+    def on_error(self, info):
+        self.calls.append(('on_error', info.status, type(info.error).__name__ if info.error else None))
+
+    def on_retry(self, info, delay):
+        self.calls.append(('on_retry', info.status, info.attempt))
+
+
+class Broken(Hooks):
+    def after_response(self, info):
+        raise ValueError('Broken hook')
+
+
+class TestHooks(unittest.TestCase):
+    def setUp(self):
+        warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed.*")
+
+    @httpretty.activate
+    def test_lifecycle_with_retries(self):
+        httpretty.register_uri(httpretty.GET, "https://api.sandbox.signaturit.com/v3/signatures/SIGN_ID.json",
+                               responses=[httpretty.Response(body='', status=503),
+                                          httpretty.Response(body='{"id": "SIGN_ID"}', status=200)])
+
+        recorder = Recorder()
+        client = SignaturitClient('SOME_TOKEN', retry=RetryPolicy(backoff_factor=0.01), hooks=[recorder, Broken()])
+
+        self.assertEqual({'id': 'SIGN_ID'}, client.get_signature('SIGN_ID'))
+        self.assertEqual([
+            ('before_send', 'GET', '/v3/signatures/%s.json', 0),
+            ('on_retry', 503, 0),
+            ('before_send', 'GET', '/v3/signatures/%s.json', 1),
+            ('after_response', 200, 17),
+        ], recorder.calls)
+
+    @httpretty.activate
+    def test_error_status_and_downloads(self):
+        httpretty.register_uri(httpretty.GET, "https://api.sandbox.signaturit.com/v3/templates.json",
+                               body='{"message": "Not found"}', status=404)
+        httpretty.register_uri(httpretty.GET,
+                               "https://api.sandbox.signaturit.com/v3/signatures/SIGN_ID/documents/DOC_ID/download/signed",
+                               body=b'%PDF-1.4', content_type='application/pdf')
+
+        recorder = Recorder()
+        client = SignaturitClient('SOME_TOKEN', hooks=recorder)
+
+        client.get_templates()
+        client.download_signed_document('SIGN_ID', 'DOC_ID', destination=io.BytesIO())
+
+        self.assertEqual([
+            ('before_send', 'GET', '/v3/templates.json', 0),
+            ('after_response', 404, 24),
+            ('on_error', 404, None),
+            ('before_send', 'GET', '/v3/signatures/%s/documents/%s/download/signed', 0),
+            ('after_response', 200, 8),
+        ], recorder.calls)
+
+    @httpretty.activate
+    def test_metrics(self):
+        httpretty.register_uri(httpretty.GET, "https://api.sandbox.signaturit.com/v3/signatures/SIGN_ID.json",
+                               body='{"id": "SIGN_ID"}')
+        httpretty.register_uri(httpretty.POST, "https://api.sandbox.signaturit.com/v3/team/groups.json",
+                               body='{"message": "Bad request"}', status=400)
+
+        metrics = Metrics()
+        client = SignaturitClient('SOME_TOKEN', hooks=metrics)
+
+        client.get_signature('SIGN_ID')
+        client.get_signature('SIGN_ID')
+        client.create_group('Group')
+
+        snapshot = {(item['method'], item['endpoint']): item for item in metrics.snapshot()}
+        signatures = snapshot[('GET', '/v3/signatures/%s.json')]
+        groups = snapshot[('POST', '/v3/team/groups.json')]
+
+        self.assertEqual(2, signatures['count'])
+        self.assertEqual({200: 2}, signatures['statuses'])
+        self.assertEqual(34, signatures['bytes_received'])
+        self.assertLessEqual(signatures['p50'], signatures['max'])
+        self.assertEqual({'400': 1}, groups['errors'])
+        self.assertEqual(10, groups['bytes_sent'])
+
+        exposition = metrics.prometheus()
+
+        self.assertIn('signaturit_request_duration_seconds_count{method="GET",endpoint="/v3/signatures/%s.json"} 2',
+                      exposition)
+        self.assertIn('signaturit_request_duration_seconds_bucket{method="GET",endpoint="/v3/signatures/%s.json",'
+                      'le="+Inf"} 2', exposition)
+        self.assertIn('signaturit_errors_total{method="POST",endpoint="/v3/team/groups.json",error="400"} 1',
+                      exposition)
+
+        metrics.reset()
+
+        self.assertEqual([], metrics.snapshot())
+
+    def test_quantile(self):
+        metrics = Metrics(buckets=(0.1, 1.0))
+
+        self.assertIsNone(metrics.quantile([0, 0, 0], 0, 0.5, 0))
+        self.assertAlmostEqual(0.55, metrics.quantile([0, 10, 0], 10, 0.5, 1.0))
+        self.assertAlmostEqual(1.99, metrics.quantile([0, 0, 1], 1, 0.99, 2.0))
+
+
+class TestAsyncHooks(unittest.IsolatedAsyncioTestCase):
+    async def test_connection_errors(self):
+        def handler(request):
+            raise httpx.ConnectError('Connection refused', request=request)
+
+        recorder = Recorder()
+        metrics = Metrics()
+        client = AsyncSignaturitClient('SOME_TOKEN', retry=RetryPolicy(total=1, backoff_factor=0.01),
+                                       hooks=[recorder, metrics],
+                                       http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+        async with client:
+            with self.assertRaises(httpx.ConnectError):
+                await client.get_user('USER_ID')
+
+        self.assertEqual([
+            ('before_send', 'GET', '/v3/team/users/%s.json', 0),
+            ('on_retry', None, 0),
+            ('before_send', 'GET', '/v3/team/users/%s.json', 1),
+            ('on_error', None, 'ConnectError'),
+        ], recorder.calls)
+
+        users, = metrics.snapshot()
+
+        self.assertEqual(1, users['retries'])
+        self.assertEqual({'ConnectError': 1}, users['errors'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import io
+import json
+import unittest
+from signaturit_sdk.signaturit_client import SignaturitClient
+from signaturit_sdk.async_signaturit_client import AsyncSignaturitClient
+from signaturit_sdk.resources.journal import Journal, REDACTED
+from signaturit_sdk.resources.retry import RetryPolicy
+import httpretty
+import httpx
+import warnings
+
+
+class TestJournal(unittest.TestCase):
+    def setUp(self):
+        warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed.*")
+
+    @httpretty.activate
+    def test_records_attempts_redacted(self):
+        httpretty.register_uri(httpretty.GET, "https://api.sandbox.signaturit.com/v3/signatures.json",
+                               responses=[httpretty.Response(body='', status=503),
+                                          httpretty.Response(body='[{"id": "SIGN_ID"}]', status=200)])
+
+        journal = Journal(max_body=10)
+        client = SignaturitClient('SOME_TOKEN', retry=RetryPolicy(backoff_factor=0.01), hooks=journal)
+
+        client.get_signatures(conditions={'access_token': 'SECRET', 'status': 'completed'})
+
+        retried, final = journal.entries()
+
+        self.assertEqual((0, 503, None), (retried['attempt'], retried['status'], retried['response_body']))
+        self.assertEqual((1, 200, b'[{"id": "S'), (final['attempt'], final['status'], final['response_body']))
+        self.assertEqual('/v3/signatures.json', final['endpoint'])
+        self.assertIn(('Authorization', REDACTED), final['request_headers'])
+        self.assertNotIn('SECRET', final['url'])
+        self.assertIn('status=completed', final['url'])
+
+    @httpretty.activate
+    def test_ring_buffer_and_har(self):
+        httpretty.register_uri(httpretty.POST, "https://api.sandbox.signaturit.com/v3/team/groups.json",
+                               body='{"id": "GROUP_ID"}', content_type='application/json')
+
+        journal = Journal(size=2)
+        client = SignaturitClient('SOME_TOKEN', hooks=journal)
+
+        for index in range(5):
+            client.create_group('Group %d' % index)
+
+        self.assertEqual(2, len(journal))
+
+        output = io.StringIO()
+        journal.dump(output)
+        har = json.loads(output.getvalue())['log']
+
+        self.assertEqual('1.2', har['version'])
+        self.assertEqual(['name=Group+3', 'name=Group+4'],
+                         [entry['request']['postData']['text'] for entry in har['entries']])
+
+        entry = har['entries'][-1]
+
+        self.assertEqual(('POST', 200), (entry['request']['method'], entry['response']['status']))
+        self.assertEqual('{"id": "GROUP_ID"}', entry['response']['content']['text'])
+        self.assertEqual('application/json', entry['response']['content']['mimeType'])
+        self.assertNotIn('SOME_TOKEN', output.getvalue())
+
+        journal.clear()
+
+        self.assertEqual([], journal.har()['log']['entries'])
+
+
+class TestAsyncJournal(unittest.IsolatedAsyncioTestCase):
+    async def test_connection_errors_are_recorded(self):
+        def handler(request):
+            raise httpx.ConnectError('Connection refused', request=request)
+
+        journal = Journal()
+        client = AsyncSignaturitClient('SOME_TOKEN', retry=False, hooks=journal,
+                                       http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+        async with client:
+            with self.assertRaises(httpx.ConnectError):
+                await client.get_signature('SIGN_ID')
+
+        entry, = journal.entries()
+
+        self.assertIsNone(entry['status'])
+        self.assertIn('ConnectError', entry['error'])
+        self.assertEqual('https://api.sandbox.signaturit.com/v3/signatures/SIGN_ID.json', entry['url'])
+
+
+if __name__ == '__main__':
+    unittest.main()
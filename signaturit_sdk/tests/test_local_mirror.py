@@ -0,0 +1,114 @@
+import unittest
+from signaturit_sdk.local_mirror import LocalMirror
+from signaturit_sdk.signaturit_client import SignaturitClient
+
+
+class FakeClient:
+    FINISHED_STATUSES = SignaturitClient.FINISHED_STATUSES
+    SIGNS_URL = SignaturitClient.SIGNS_URL
+    EMAILS_URL = SignaturitClient.EMAILS_URL
+    SMS_URL = SignaturitClient.SMS_URL
+
+    def __init__(self):
+        self.signatures = {}
+        self.emails = {'E1': {'id': 'E1', 'created_at': '2016-01-01T10:00:00+0000',
+                              'certificates': [{'email': 'alice@signaturit.com', 'status': 'email_delivered'}]}}
+        self.calls = []
+        self.email_calls = []
+
+    @staticmethod
+    def iterate(records, conditions):
+        if 'ids' in conditions:
+            return [records[record_id] for record_id in conditions['ids']]
+
+        since = conditions.get('since', '')
+
+        return [record for record in records.values() if record['created_at'][:10] >= since]
+
+    def iter_signatures(self, conditions={}, page_size=100, prefetch=True):
+        self.calls.append(dict(conditions))
+
+        return self.iterate(self.signatures, conditions)
+
+    def iter_emails(self, conditions={}, page_size=100, prefetch=True):
+        self.email_calls.append(dict(conditions))
+
+        return self.iterate(self.emails, conditions)
+
+    def iter_SMS(self, conditions={}, page_size=100, prefetch=True):
+        return []
+
+    def add(self, signature_id, created_at, status, email):
+        self.signatures[signature_id] = {'id': signature_id, 'created_at': created_at,
+                                         'documents': [{'email': email, 'status': status}]}
+
+
+class TestLocalMirror(unittest.TestCase):
+    def test_incremental_sync(self):
+        client = FakeClient()
+        client.add('S0', '2015-12-31T10:00:00+0000', 'ready', 'dave@signaturit.com')
+        client.add('S1', '2016-01-01T10:00:00+0000', 'completed', 'bob@signaturit.com')
+        client.add('S2', '2016-01-02T10:00:00+0000', 'ready', 'bob@signaturit.com')
+
+        with LocalMirror(client, ':memory:') as mirror:
+            self.assertEqual({'signatures': 3, 'emails': 1, 'sms': 0}, mirror.sync())
+            self.assertEqual('2016-01-02T10:00:00+0000', mirror.high_water('signatures'))
+
+            client.add('S2', '2016-01-02T10:00:00+0000', 'completed', 'bob@signaturit.com')
+            client.add('S0', '2015-12-31T10:00:00+0000', 'declined', 'dave@signaturit.com')
+            client.add('S3', '2016-01-03T10:00:00+0000', 'ready', 'carol@signaturit.com')
+            client.calls = []
+
+            self.assertEqual({'signatures': 3}, mirror.sync(resources=('signatures',)))
+
+            self.assertEqual([{'since': '2016-01-02'}, {'ids': ['S0']}], client.calls)
+            self.assertEqual(['S0'], [s['id'] for s in mirror.query('signatures', status='declined')])
+
+            completed = mirror.query('signatures', status='completed', email='bob@signaturit.com')
+
+            self.assertEqual(['S2', 'S1'], [signature['id'] for signature in completed])
+            self.assertEqual(['S3'], [signature['id'] for signature in mirror.query('signatures', status='ready')])
+            self.assertEqual(['E1'], [email['id'] for email in mirror.query('emails', email='alice@signaturit.com')])
+            self.assertEqual(['S3'], [s['id'] for s in mirror.query('signatures', since='2016-01-03', limit=5)])
+
+    def test_emails_are_not_refreshed(self):
+        client = FakeClient()
+        client.emails['E0'] = {'id': 'E0', 'created_at': '2015-12-31T10:00:00+0000',
+                               'certificates': [{'email': 'dave@signaturit.com', 'status': 'email_opened'}]}
+
+        with LocalMirror(client, ':memory:') as mirror:
+            mirror.sync(resources=('emails',))
+            client.email_calls = []
+
+            self.assertEqual({'emails': 1}, mirror.sync(resources=('emails',)))
+            self.assertEqual([{'since': '2016-01-01'}], client.email_calls)
+
+    def test_high_water_waits_for_the_whole_sync(self):
+        client = FakeClient()
+
+        for index in range(600):
+            created_at = '2016-01-%02dT10:00:00+0000' % (index // 100 + 1)
+            client.add('S%03d' % index, created_at, 'ready', 'bob@signaturit.com')
+
+        def failing(conditions={}, page_size=100, prefetch=True):
+            for index, signature in enumerate(FakeClient.iterate(client.signatures, conditions)):
+                if index == 550:
+                    raise ConnectionError('Connection reset')
+
+                yield signature
+
+        client.iter_signatures = failing
+
+        with LocalMirror(client, ':memory:') as mirror:
+            self.assertRaises(ConnectionError, mirror.sync, resources=('signatures',))
+
+            self.assertEqual(500, len(mirror.query('signatures')))
+            self.assertIsNone(mirror.high_water('signatures'))
+
+    def test_unknown_resource(self):
+        with LocalMirror(FakeClient(), ':memory:') as mirror:
+            self.assertRaises(ValueError, mirror.query, 'packages')
+
+
+if __name__ == '__main__':
+    unittest.main()
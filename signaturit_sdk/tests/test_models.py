@@ -0,0 +1,82 @@
+import copy
+import pickle
+import unittest
+from signaturit_sdk.signaturit_client import SignaturitClient
+from signaturit_sdk.models import Document, Email, Group, Recipient, Signature, User, wrap
+import httpretty
+import json
+import re
+import warnings
+
+
+class TestModels(unittest.TestCase):
+    def setUp(self):
+        warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed.*")
+
+    def payload(self):
+        return {'id': 'S1', 'created_at': '2016-01-01T10:00:00+0000', 'custom': 1,
+                'documents': [{'id': 'D1', 'email': 'bob@signaturit.com', 'status': 'completed'}]}
+
+    def test_copy_and_pickle(self):
+        signature = Signature(self.payload())
+        signature.documents
+
+        for clone in (copy.copy(signature), copy.deepcopy(signature), pickle.loads(pickle.dumps(signature))):
+            self.assertIsInstance(clone, Signature)
+            self.assertEqual(signature, clone)
+            self.assertIsNone(clone._children)
+            self.assertEqual('completed', clone.documents[0].status)
+
+        self.assertIs(signature.to_dict(), copy.copy(signature).to_dict())
+        self.assertIsNot(signature.to_dict(), copy.deepcopy(signature).to_dict())
+        self.assertRaises(AttributeError, getattr, signature, '_missing')
+
+    def test_fields_and_lazy_children(self):
+        signature = Signature(self.payload())
+
+        self.assertEqual('S1', signature.id)
+        self.assertEqual(1, signature.custom)
+        self.assertIsNone(signature.url)
+        self.assertRaises(AttributeError, getattr, signature, 'missing')
+        self.assertIsNone(signature._children)
+
+        document = signature.documents[0]
+
+        self.assertIsInstance(document, Document)
+        self.assertEqual('completed', document.status)
+        self.assertIs(document, signature.documents[0])
+
+    def test_models_are_read_only_mappings_without_dict(self):
+        signature = Signature(self.payload())
+
+        self.assertEqual('S1', signature['id'])
+        self.assertEqual('S1', signature.get('id'))
+        self.assertEqual(self.payload(), dict(signature))
+        self.assertEqual(self.payload(), signature)
+        self.assertFalse(hasattr(signature, '__dict__'))
+        self.assertRaises(AttributeError, setattr, signature, 'id', 'S2')
+
+    def test_children_models(self):
+        self.assertIsInstance(Email({'id': 'E1', 'certificates': [{'id': 'C1'}]}).certificates[0], Recipient)
+        self.assertIsInstance(Group({'id': 'G1', 'members': [{'id': 'U1'}]}).members[0], User)
+        self.assertEqual([], Group({'id': 'G1'}).managers)
+
+    def test_wrap_leaves_errors_untouched(self):
+        self.assertEqual({'message': 'Not found'}, wrap(Signature, {'message': 'Not found'}))
+        self.assertEqual(b'{}', wrap(Signature, b'{}'))
+        self.assertIsInstance(wrap(Signature, [{'id': 'S1'}])[0], Signature)
+
+    @httpretty.activate
+    def test_client_returns_models(self):
+        httpretty.register_uri(httpretty.GET, re.compile(r'https://api.sandbox.signaturit.com/v3/signatures.json.*'),
+                               body=json.dumps([self.payload()]), content_type='application/json')
+
+        signatures = SignaturitClient('TOKEN', models=True).get_signatures()
+
+        self.assertIsInstance(signatures[0], Signature)
+        self.assertTrue(SignaturitClient._is_finished(signatures[0]))
+        self.assertIsInstance(SignaturitClient('TOKEN').get_signatures()[0], dict)
+
+
+if __name__ == '__main__':
+    unittest.main()
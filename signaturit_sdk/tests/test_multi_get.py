@@ -0,0 +1,75 @@
+import unittest
+from signaturit_sdk.signaturit_client import SignaturitClient
+from signaturit_sdk.async_signaturit_client import AsyncSignaturitClient
+from signaturit_sdk.resources.multi_get import chunk_ids
+import httpretty
+import httpx
+import json
+import re
+import warnings
+
+
+class TestMultiGet(unittest.TestCase):
+    def setUp(self):
+        warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed.*")
+
+    def test_chunk_ids_respects_url_length(self):
+        ids = ['%036d' % index for index in range(100)]
+
+        chunks = chunk_ids(ids, 20, max_url_length=500)
+
+        self.assertEqual(ids, [item for chunk in chunks for item in chunk])
+        self.assertTrue(all(20 + 100 + 39 * len(chunk) <= 500 for chunk in chunks))
+        self.assertEqual(9, len(chunks[0]))
+
+    def test_chunk_ids_respects_max_ids_and_drops_duplicates(self):
+        chunks = chunk_ids(['A', 'B', 'A', 'C'], 20, max_ids=2)
+
+        self.assertEqual([['A', 'B'], ['C']], chunks)
+
+    def test_chunk_ids_rejects_too_long_ids(self):
+        self.assertRaises(ValueError, chunk_ids, ['X' * 500], 20, 500)
+
+    @httpretty.activate
+    def test_get_signatures_by_ids(self):
+        requested = []
+
+        def callback(request, uri, headers):
+            ids = request.querystring['ids'][0].split(',')
+            requested.append(ids)
+
+            return 200, headers, json.dumps([{'id': signature_id} for signature_id in ids if signature_id != 'S3'])
+
+        httpretty.register_uri(httpretty.GET, re.compile(r'https://api.sandbox.signaturit.com/v3/signatures.json.*'),
+                               body=callback, content_type='application/json')
+
+        ids = ['S%d' % index for index in range(250)]
+        signatures = SignaturitClient('TOKEN').get_signatures_by_ids(ids, workers=2)
+
+        self.assertEqual(set(ids) - {'S3'}, set(signatures))
+        self.assertEqual({'id': 'S7'}, signatures['S7'])
+        self.assertEqual([100, 100, 50], sorted((len(chunk) for chunk in requested), reverse=True))
+
+
+class TestAsyncMultiGet(unittest.IsolatedAsyncioTestCase):
+    async def test_get_emails_by_ids(self):
+        requested = []
+
+        def handler(request):
+            ids = request.url.params['ids'].split(',')
+            requested.append(ids)
+
+            return httpx.Response(200, json=[{'id': email_id} for email_id in ids])
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async with AsyncSignaturitClient('TOKEN', http_client=http_client) as client:
+            emails = await client.get_emails_by_ids(['E%d' % index for index in range(150)], max_url_length=1000)
+
+        self.assertEqual(150, len(emails))
+        self.assertTrue(len(requested) > 1)
+        self.assertEqual(150, sum(len(chunk) for chunk in requested))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import email.parser
+import email.policy
+import io
+import os
+import tempfile
+import threading
+import unittest
+from signaturit_sdk.signaturit_client import SignaturitClient
+from signaturit_sdk.resources.multipart import MultipartEncoder
+import httpretty
+import warnings
+
+
+class TestMultipart(unittest.TestCase):
+    def setUp(self):
+        warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed.*")
+
+        handle, self.path = tempfile.mkstemp(suffix='.pdf')
+
+        with os.fdopen(handle, 'wb') as document:
+            document.write(b'%PDF' * 50000)
+
+    def tearDown(self):
+        os.unlink(self.path)
+
+    def parse(self, body, content_type):
+        message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+            b'Content-Type: ' + content_type.encode() + b'\r\n\r\n' + body)
+
+        return dict((part.get_param('name', header='content-disposition'), part) for part in message.iter_parts())
+
+    def test_length_matches_body(self):
+        encoder = MultipartEncoder({'subject': 'Hello', 'index': 3},
+                                   [('files[0]', self.path), ('files[1]', b'bytes'),
+                                    ('files[2]', ('view.txt', memoryview(b'view'))), ('files[3]', io.BytesIO(b'io'))],
+                                   chunk_size=1000)
+
+        body = encoder.read(100) + encoder.read()
+
+        self.assertEqual(encoder.len, len(body))
+
+        form = self.parse(body, encoder.content_type)
+
+        self.assertEqual(b'Hello', form['subject'].get_payload(decode=True))
+        self.assertEqual(b'3', form['index'].get_payload(decode=True))
+        self.assertEqual(os.path.basename(self.path), form['files[0]'].get_filename())
+        self.assertEqual(b'%PDF' * 50000, form['files[0]'].get_payload(decode=True))
+        self.assertEqual(b'bytes', form['files[1]'].get_payload(decode=True))
+        self.assertEqual('view.txt', form['files[2]'].get_filename())
+        self.assertEqual(b'io', form['files[3]'].get_payload(decode=True))
+
+    def test_none_fields_are_left_out(self):
+        encoder = MultipartEncoder({'subject': 'Hello', 'body': None}, [])
+        body = encoder.read()
+
+        self.assertEqual(encoder.len, len(body))
+        self.assertEqual(['subject'], list(self.parse(body, encoder.content_type)))
+
+    def test_names_are_escaped(self):
+        encoder = MultipartEncoder({'data[a"b]': 'value', 'x\r\nX-Injected: 1': 'other'},
+                                   [('files[0]', ('my "final".pdf', b'%PDF'))])
+        body = encoder.read()
+
+        self.assertEqual(encoder.len, len(body))
+        self.assertNotIn(b'\r\nX-Injected', body)
+        self.assertIn(b'name="data[a%22b]"', body)
+        self.assertIn(b'name="x%0D%0AX-Injected: 1"', body)
+        self.assertIn(b'filename="my %22final%22.pdf"', body)
+        self.assertEqual(['data[a%22b]', 'x%0D%0AX-Injected: 1', 'files[0]'],
+                         list(self.parse(body, encoder.content_type)))
+
+    def test_opened_files_are_closed(self):
+        encoder = MultipartEncoder({}, [('files[0]', self.path)], chunk_size=10)
+
+        encoder.read(200)
+
+        opened = encoder._MultipartEncoder__opened[0]
+
+        encoder.close()
+
+        self.assertTrue(opened.closed)
+
+    def test_caller_files_are_left_open(self):
+        source = io.BytesIO(b'content')
+
+        with MultipartEncoder({}, [('files[0]', source)]) as encoder:
+            encoder.read()
+
+        self.assertFalse(source.closed)
+
+    @httpretty.activate
+    def test_create_signature_streams_documents(self):
+        httpretty.register_uri(httpretty.POST, "https://api.sandbox.signaturit.com/v3/signatures.json",
+                               body='{"id": "SIGNATURE_ID"}')
+
+        with SignaturitClient('SOME_TOKEN') as client:
+            client.create_signature(('contract.pdf', b'%PDF'), {'email': 'test@test.com', 'name': 'Mr Test'},
+                                    {'subject': 'Hi'})
+
+        request = httpretty.last_request()
+        form = self.parse(request.body, request.headers['Content-Type'])
+
+        self.assertEqual(str(len(request.body)), request.headers['Content-Length'])
+        self.assertEqual(b'test@test.com', form['recipients[0][email]'].get_payload(decode=True))
+        self.assertEqual(b'Hi', form['subject'].get_payload(decode=True))
+        self.assertEqual(b'%PDF', form['files[0]'].get_payload(decode=True))
+        self.assertEqual('contract.pdf', form['files[0]'].get_filename())
+
+
+class TestAsyncMultipart(unittest.IsolatedAsyncioTestCase):
+    async def test_files_are_read_in_a_thread(self):
+        threads = []
+
+        class Source(io.BytesIO):
+            def read(self, size=-1):
+                threads.append(threading.get_ident())
+
+                return super().read(size)
+
+        encoder = MultipartEncoder({'subject': 'Hello'}, [('files[0]', Source(b'%PDF' * 1000))], chunk_size=1000)
+        body = b''.join([chunk async for chunk in encoder])
+
+        self.assertEqual(encoder.len, len(body))
+        self.assertIn(b'%PDF' * 1000, body)
+        self.assertEqual(5, len(threads))
+        self.assertNotIn(threading.get_ident(), threads)
+
+
+if __name__ == '__main__':
+    unittest.main()
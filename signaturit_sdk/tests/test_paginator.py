@@ -0,0 +1,128 @@
+import unittest
+from signaturit_sdk.signaturit_client import SignaturitClient
+from signaturit_sdk.async_signaturit_client import AsyncSignaturitClient
+from signaturit_sdk.resources.paginator import iter_pages, iter_pages_concurrently
+import time
+import httpretty
+import httpx
+import warnings
+
+
+class TestPaginator(unittest.TestCase):
+    def setUp(self):
+        warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed.*")
+
+    def fetcher(self, total, calls):
+        def fetch(limit, offset):
+            calls.append((limit, offset))
+
+            return list(range(offset, min(offset + limit, total)))
+
+        return fetch
+
+    def test_iter_pages_yields_every_item(self):
+        for prefetch in (True, False):
+            calls = []
+
+            self.assertEqual(list(range(25)), list(iter_pages(self.fetcher(25, calls), 10, prefetch)))
+            self.assertEqual([(10, 0), (10, 10), (10, 20)], calls)
+
+    def test_iter_pages_requests_an_empty_page_on_exact_multiple(self):
+        calls = []
+
+        self.assertEqual(list(range(20)), list(iter_pages(self.fetcher(20, calls), 10)))
+        self.assertEqual([(10, 0), (10, 10), (10, 20)], calls)
+
+    def test_iter_pages_stops_fetching_when_closed(self):
+        calls = []
+
+        items = iter_pages(self.fetcher(1000, calls), 10, prefetch=False)
+
+        self.assertEqual(0, next(items))
+        items.close()
+
+        self.assertEqual([(10, 0)], calls)
+
+    def test_iter_pages_rejects_error_payloads(self):
+        self.assertRaises(ValueError, list, iter_pages(lambda limit, offset: {'message': 'Unauthorized'}))
+
+    def test_iter_pages_concurrently_keeps_order(self):
+        def fetch(limit, offset):
+            time.sleep(0.02 if offset == 0 else 0)
+
+            return list(range(offset, min(offset + limit, 35)))
+
+        self.assertEqual(list(range(35)), list(iter_pages_concurrently(fetch, 35, 10, workers=4)))
+
+    def test_iter_pages_concurrently_unordered(self):
+        calls = []
+
+        items = list(iter_pages_concurrently(self.fetcher(35, calls), 35, 10, workers=2, ordered=False))
+
+        self.assertEqual(list(range(35)), sorted(items))
+        self.assertEqual([0, 10, 20, 30], sorted(offset for limit, offset in calls))
+
+    @httpretty.activate
+    def test_iter_emails_with_workers_uses_count(self):
+        def body(request, uri, headers):
+            offset = int(request.querystring['offset'][0])
+
+            return [200, headers, '[{"id": %d}]' % offset]
+
+        httpretty.register_uri(httpretty.GET, "https://api.sandbox.signaturit.com/v3/emails/count.json", body='3')
+        httpretty.register_uri(httpretty.GET, "https://api.sandbox.signaturit.com/v3/emails.json", body=body)
+
+        with SignaturitClient('SOME_TOKEN') as client:
+            emails = list(client.iter_emails(page_size=1, workers=3))
+
+        self.assertEqual([0, 1, 2], [email['id'] for email in emails])
+
+    @httpretty.activate
+    def test_iter_signatures(self):
+        def body(request, uri, headers):
+            offset = int(request.querystring['offset'][0])
+
+            return [200, headers, '[]' if offset else '[{"id": "A"}, {"id": "B"}]']
+
+        httpretty.register_uri(httpretty.GET, "https://api.sandbox.signaturit.com/v3/signatures.json", body=body)
+
+        with SignaturitClient('SOME_TOKEN') as client:
+            signatures = list(client.iter_signatures({'status': 3}, page_size=2))
+
+        self.assertEqual(['A', 'B'], [signature['id'] for signature in signatures])
+        self.assertEqual(['3'], httpretty.last_request().querystring['status'])
+
+
+class TestAsyncPaginator(unittest.IsolatedAsyncioTestCase):
+    async def test_iter_contacts(self):
+        def handler(request):
+            offset = int(request.url.params['offset'])
+
+            return httpx.Response(200, json=[{'id': index} for index in range(offset, min(offset + 2, 5))])
+
+        client = AsyncSignaturitClient('SOME_TOKEN', http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+        async with client:
+            contacts = [contact['id'] async for contact in client.iter_contacts(page_size=2)]
+
+        self.assertEqual([0, 1, 2, 3, 4], contacts)
+
+    async def test_iter_SMS_with_workers(self):
+        def handler(request):
+            if request.url.path.endswith('count.json'):
+                return httpx.Response(200, json=5)
+
+            offset = int(request.url.params['offset'])
+
+            return httpx.Response(200, json=[{'id': index} for index in range(offset, min(offset + 2, 5))])
+
+        client = AsyncSignaturitClient('SOME_TOKEN', http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+        async with client:
+            sms = [item['id'] async for item in client.iter_SMS(page_size=2, workers=3)]
+
+        self.assertEqual([0, 1, 2, 3, 4], sms)
+
+
+if __name__ == '__main__':
+    unittest.main()
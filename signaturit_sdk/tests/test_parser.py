@@ -0,0 +1,47 @@
+import unittest
+from signaturit_sdk.resources.parser import Parser
+
+
+class TestParser(unittest.TestCase):
+    def test_fill_array_flattens_nested_params(self):
+        form = {}
+
+        Parser().fill_array(form, {'email': 'bob@signaturit.com', 'require_sms_validation': 0,
+                                   'widgets': [{'page': 1, 'words': ['a', 'b']}], 'empty': {}}, 'recipients[0]')
+
+        self.assertEqual([('recipients[0][email]', 'bob@signaturit.com'),
+                          ('recipients[0][require_sms_validation]', 0),
+                          ('recipients[0][widgets][0][page]', 1),
+                          ('recipients[0][widgets][0][words][0]', 'a'),
+                          ('recipients[0][widgets][0][words][1]', 'b')], list(form.items()))
+
+    def test_fill_array_without_parent(self):
+        form = {}
+
+        Parser().fill_array(form, {'subject': 'Hi', 'data': {'crm_id': 7}}, '')
+
+        self.assertEqual({'subject': 'Hi', 'data[crm_id]': 7}, form)
+
+    def test_files_are_kept_as_is(self):
+        form = {}
+        document = ('contract.pdf', b'%PDF')
+
+        Parser().fill_array(form, ['/tmp/contract.pdf', document, b'%PDF'], 'files')
+
+        self.assertEqual({'files[0]': '/tmp/contract.pdf', 'files[1]': document, 'files[2]': b'%PDF'}, form)
+
+
+    def test_deep_params_do_not_hit_the_recursion_limit(self):
+        form = {}
+        params = 'leaf'
+
+        for _ in range(5000):
+            params = [params]
+
+        Parser().fill_array(form, params, 'deep')
+
+        self.assertEqual(['leaf'], list(form.values()))
+        self.assertTrue(next(iter(form)).startswith('deep[0][0]'))
+
+if __name__ == '__main__':
+    unittest.main()
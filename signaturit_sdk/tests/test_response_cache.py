@@ -0,0 +1,100 @@
+import unittest
+from signaturit_sdk.signaturit_client import SignaturitClient
+from signaturit_sdk.resources.response_cache import ResponseCache
+import httpretty
+import warnings
+
+
+class TestResponseCache(unittest.TestCase):
+    BRANDING_URL = "https://api.sandbox.signaturit.com/v3/brandings/BRANDING_ID.json"
+
+    def setUp(self):
+        warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed.*")
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+
+        cache.set('a', 'brandings', b'1')
+        cache.set('b', 'brandings', b'2')
+        cache.get('a')
+        cache.set('c', 'contacts', b'3')
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(b'1', cache.get('a').body)
+
+        cache.invalidate('contacts')
+
+        self.assertEqual(1, len(cache))
+
+    def test_expired_entries_without_etag_are_dropped(self):
+        cache = ResponseCache(ttl=0, ttls={'templates': 60})
+
+        cache.set('a', 'brandings', b'1')
+        cache.set('b', 'brandings', b'2', etag='"v1"')
+        cache.set('c', 'templates', b'3')
+
+        self.assertIsNone(cache.get('a'))
+        self.assertFalse(cache.get('b').fresh())
+        self.assertTrue(cache.get('c').fresh())
+
+    @httpretty.activate
+    def test_get_branding_is_cached_and_invalidated(self):
+        calls = []
+
+        def body(request, uri, headers):
+            calls.append(request.method)
+
+            return [200, headers, '{"id": "BRANDING_ID"}']
+
+        httpretty.register_uri(httpretty.GET, self.BRANDING_URL, body=body)
+        httpretty.register_uri(httpretty.PATCH, self.BRANDING_URL, body=body)
+
+        client = SignaturitClient('SOME_TOKEN', cache=ResponseCache())
+
+        self.assertEqual({'id': 'BRANDING_ID'}, client.get_branding('BRANDING_ID'))
+        self.assertEqual({'id': 'BRANDING_ID'}, client.get_branding('BRANDING_ID'))
+        self.assertEqual(['GET'], calls)
+
+        client.update_branding('BRANDING_ID', {'text_color': '#000000'})
+        client.get_branding('BRANDING_ID')
+
+        self.assertEqual(['GET', 'PATCH', 'GET'], calls)
+
+    @httpretty.activate
+    def test_expired_response_is_revalidated_with_etag(self):
+        def body(request, uri, headers):
+            if request.headers.get('If-None-Match') == '"v1"':
+                return [304, headers, '']
+
+            headers['ETag'] = '"v1"'
+
+            return [200, headers, '[{"id": "TEMPLATE_ID"}]']
+
+        httpretty.register_uri(httpretty.GET, "https://api.sandbox.signaturit.com/v3/templates.json", body=body)
+
+        client = SignaturitClient('SOME_TOKEN', cache=ResponseCache(ttl=0))
+
+        self.assertEqual([{'id': 'TEMPLATE_ID'}], client.get_templates())
+        self.assertEqual([{'id': 'TEMPLATE_ID'}], client.get_templates())
+        self.assertEqual('"v1"', httpretty.last_request().headers['If-None-Match'])
+
+    @httpretty.activate
+    def test_only_finished_signatures_are_cached(self):
+        statuses = ['ready', 'completed', 'ready']
+
+        def body(request, uri, headers):
+            return [200, headers, '{"id": "SIGNATURE_ID", "documents": [{"status": "%s"}]}' % statuses.pop(0)]
+
+        httpretty.register_uri(httpretty.GET, "https://api.sandbox.signaturit.com/v3/signatures/SIGNATURE_ID.json",
+                               body=body)
+
+        client = SignaturitClient('SOME_TOKEN', cache=ResponseCache())
+
+        self.assertEqual('ready', client.get_signature('SIGNATURE_ID')['documents'][0]['status'])
+        self.assertEqual('completed', client.get_signature('SIGNATURE_ID')['documents'][0]['status'])
+        self.assertEqual('completed', client.get_signature('SIGNATURE_ID')['documents'][0]['status'])
+        self.assertEqual(['ready'], statuses)
+
+
+if __name__ == '__main__':
+    unittest.main()
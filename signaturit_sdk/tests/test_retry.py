@@ -0,0 +1,121 @@
+import unittest
+from signaturit_sdk.signaturit_client import SignaturitClient
+from signaturit_sdk.async_signaturit_client import AsyncSignaturitClient
+from signaturit_sdk.resources.base_connection import ResponseError
+from signaturit_sdk.resources.rate_limiter import TokenBucket
+from signaturit_sdk.resources.retry import RetryPolicy
+import httpretty
+import httpx
+import warnings
+
+
+class TestRetry(unittest.TestCase):
+    def setUp(self):
+        warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed.*")
+
+    def test_only_idempotent_methods_are_retried(self):
+        policy = RetryPolicy(total=2)
+
+        self.assertTrue(policy.should_retry('GET', 503, 0))
+        self.assertTrue(policy.should_retry('delete', 429, 1))
+        self.assertFalse(policy.should_retry('GET', 503, 2))
+        self.assertFalse(policy.should_retry('POST', 503, 0))
+        self.assertFalse(policy.should_retry('GET', 500, 0))
+
+    def test_delay_honors_retry_after(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=10)
+
+        self.assertEqual(3.0, policy.delay(0, {'Retry-After': '3'}))
+        self.assertEqual(10, policy.delay(0, {'Retry-After': '120'}))
+        self.assertAlmostEqual(0, policy.delay(0, {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}))
+
+        for attempt in range(6):
+            self.assertLessEqual(policy.delay(attempt, {}), min(10, 2 ** attempt))
+
+    def test_token_bucket_spaces_requests(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+
+        self.assertEqual(0, bucket.reserve())
+        self.assertEqual(0, bucket.reserve())
+        self.assertAlmostEqual(0.1, bucket.reserve(), places=2)
+        self.assertAlmostEqual(0.2, bucket.reserve(), places=2)
+
+        bucket.hold(1)
+
+        self.assertGreaterEqual(bucket.reserve(), 1)
+
+    @httpretty.activate
+    def test_get_is_retried_on_unavailable(self):
+        httpretty.register_uri(httpretty.GET, "https://api.sandbox.signaturit.com/v3/templates.json",
+                               responses=[httpretty.Response(body='<html>Bad gateway</html>', status=502),
+                                          httpretty.Response(body='', status=429, adding_headers={'Retry-After': '0'}),
+                                          httpretty.Response(body='[{"id": "TEMPLATE_ID"}]', status=200)])
+
+        client = SignaturitClient('SOME_TOKEN', retry=RetryPolicy(backoff_factor=0.01),
+                                  rate_limiter=TokenBucket(rate=100))
+
+        self.assertEqual([{'id': 'TEMPLATE_ID'}], client.get_templates())
+        self.assertEqual(3, len(httpretty.latest_requests()))
+
+    @httpretty.activate
+    def test_undecodable_error_is_raised_once_retries_run_out(self):
+        httpretty.register_uri(httpretty.GET, "https://api.sandbox.signaturit.com/v3/templates.json",
+                               body='<html>Bad gateway</html>', status=502)
+
+        client = SignaturitClient('SOME_TOKEN', retry=RetryPolicy(total=1, backoff_factor=0.01))
+
+        with self.assertRaises(ResponseError) as context:
+            client.get_templates()
+
+        self.assertEqual(502, context.exception.status_code)
+        self.assertEqual(b'<html>Bad gateway</html>', context.exception.body)
+        self.assertEqual(2, len(httpretty.latest_requests()))
+
+    @httpretty.activate
+    def test_post_is_not_retried(self):
+        calls = []
+
+        def body(request, uri, headers):
+            calls.append(uri)
+
+            return [503, headers, '{"message": "Unavailable"}']
+
+        httpretty.register_uri(httpretty.POST, "https://api.sandbox.signaturit.com/v3/team/groups.json", body=body)
+
+        client = SignaturitClient('SOME_TOKEN', retry=RetryPolicy(backoff_factor=0.01))
+
+        self.assertEqual({'message': 'Unavailable'}, client.create_group('Group'))
+        self.assertEqual(1, len(calls))
+
+
+class TestAsyncRetry(unittest.IsolatedAsyncioTestCase):
+    async def test_get_is_retried(self):
+        statuses = [503, 504, 200]
+
+        def handler(request):
+            return httpx.Response(statuses.pop(0), json={'id': 'USER_ID'})
+
+        client = AsyncSignaturitClient('SOME_TOKEN', retry=RetryPolicy(backoff_factor=0.01),
+                                       http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+        async with client:
+            self.assertEqual({'id': 'USER_ID'}, await client.get_user('USER_ID'))
+
+        self.assertEqual([], statuses)
+
+    async def test_undecodable_error_is_raised(self):
+        def handler(request):
+            return httpx.Response(429, content=b'Too many requests', headers={'Retry-After': '0'})
+
+        client = AsyncSignaturitClient('SOME_TOKEN', retry=False,
+                                       http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+        async with client:
+            with self.assertRaises(ResponseError) as context:
+                await client.get_user('USER_ID')
+
+        self.assertEqual(429, context.exception.status_code)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,198 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from signaturit_sdk.signaturit_client import SignaturitClient
+from signaturit_sdk.async_signaturit_client import AsyncSignaturitClient
+from signaturit_sdk.resources.deadline import DeadlineExceeded, check, deadline
+from signaturit_sdk.resources.single_flight import AsyncSingleFlight, SingleFlight
+from signaturit_sdk.resources.transport import InMemoryTransport
+import httpx
+import warnings
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed.*")
+
+    def test_errors_are_shared(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        calls = []
+
+        def fail():
+            calls.append(1)
+            started.set()
+            time.sleep(0.1)
+
+            raise ValueError('Broken')
+
+        def call():
+            return flight.do('key', fail)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(call)
+            started.wait()
+            second = executor.submit(call)
+
+            self.assertRaises(ValueError, first.result)
+            self.assertRaises(ValueError, second.result)
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual('result', flight.do('key', lambda: 'result'))
+
+    def test_followers_wait_no_longer_than_their_deadline(self):
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def slow():
+            started.set()
+            time.sleep(0.5)
+
+            return 'result'
+
+        def follow():
+            started.wait()
+
+            with deadline(0.1):
+                begin = time.monotonic()
+
+                try:
+                    flight.do('key', slow)
+                except DeadlineExceeded:
+                    return time.monotonic() - begin
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(flight.do, 'key', slow)
+            waited = executor.submit(follow).result()
+
+            self.assertEqual('result', leader.result())
+
+        self.assertLess(waited, 0.3)
+
+    def test_deadline_of_the_leader_is_not_shared(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        calls = []
+
+        def call():
+            calls.append(1)
+            started.set()
+            time.sleep(0.2)
+            check()
+
+            return 'result'
+
+        def lead():
+            with deadline(0.1):
+                return flight.do('key', call)
+
+        def follow():
+            started.wait()
+
+            return flight.do('key', call)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(lead)
+            follower = executor.submit(follow)
+
+            self.assertRaises(DeadlineExceeded, leader.result)
+            self.assertEqual('result', follower.result())
+
+        self.assertEqual(2, len(calls))
+
+    def test_concurrent_gets_are_coalesced(self):
+        barrier = threading.Barrier(8)
+
+        def signature(request):
+            time.sleep(0.2)
+
+            return {'id': 'SIGN_ID'}
+
+        transport = InMemoryTransport()
+        transport.add('GET', '/v3/signatures/SIGN_ID.json', signature)
+        transport.add('GET', '/v3/templates.json', [])
+
+        client = SignaturitClient('SOME_TOKEN', transport=transport, single_flight=True)
+
+        def call(index):
+            barrier.wait()
+
+            return client.get_signature('SIGN_ID') if index < 6 else client.get_templates()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(call, range(8)))
+
+        self.assertEqual([{'id': 'SIGN_ID'}] * 6 + [[]] * 2, results)
+        self.assertIsNot(results[0], results[1])
+
+        client.get_signature('SIGN_ID')
+
+        signatures = [request for request in transport.requests if 'signatures' in request.url]
+
+        self.assertEqual(2, len(signatures))
+
+    def test_disabled_by_default(self):
+        transport = InMemoryTransport()
+        transport.add('GET', '/v3/templates.json', lambda request: time.sleep(0.05) or [])
+
+        client = SignaturitClient('SOME_TOKEN', transport=transport)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: client.get_templates(), range(4)))
+
+        self.assertEqual(4, len(transport.requests))
+
+
+class TestAsyncSingleFlight(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_gets_are_coalesced(self):
+        calls = []
+
+        async def handler(request):
+            calls.append(request.url.path)
+            await asyncio.sleep(0.05)
+
+            return httpx.Response(200, json={'id': 'USER_ID'})
+
+        client = AsyncSignaturitClient('SOME_TOKEN', single_flight=True,
+                                       http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+        async with client:
+            results = await asyncio.gather(*[client.get_user('USER_ID') for _ in range(5)])
+            await client.get_user('USER_ID')
+
+        self.assertEqual([{'id': 'USER_ID'}] * 5, results)
+        self.assertEqual(['/v3/team/users/USER_ID.json'] * 2, calls)
+
+    async def test_deadlines(self):
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.2)
+            check()
+
+            return 'result'
+
+        async def lead():
+            with deadline(0.1):
+                return await flight.do('key', call)
+
+        async def follow(seconds):
+            await asyncio.sleep(0.01)
+
+            with deadline(seconds):
+                return await flight.do('key', call)
+
+        results = await asyncio.gather(lead(), follow(0.05), follow(1), return_exceptions=True)
+
+        self.assertIsInstance(results[0], DeadlineExceeded)
+        self.assertIsInstance(results[1], DeadlineExceeded)
+        self.assertEqual('result', results[2])
+        self.assertEqual(2, len(calls))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+import asyncio
+import threading
+import time
+import unittest
+from signaturit_sdk.signaturit_client import SignaturitClient
+from signaturit_sdk.status_watcher import StatusWatcher
+
+
+class FakeClient:
+    FINISHED_STATUSES = SignaturitClient.FINISHED_STATUSES
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.requests = []
+        self.errors = []
+
+    def get_signatures(self, limit=100, offset=0, conditions={}):
+        self.requests.append(list(conditions['ids']))
+
+        if self.errors:
+            raise self.errors.pop(0)
+
+        return [{'id': signature_id, 'documents': [{'status': self.statuses[signature_id]}]}
+                for signature_id in conditions['ids'] if signature_id in self.statuses]
+
+
+class FakeAsyncClient(FakeClient):
+    async def get_signatures(self, limit=100, offset=0, conditions={}):
+        return FakeClient.get_signatures(self, limit, offset, conditions)
+
+
+class TestStatusWatcher(unittest.TestCase):
+    def test_changes_are_batched_and_reported(self):
+        client = FakeClient({'S%d' % index: 'ready' for index in range(5)})
+        changes = []
+
+        watcher = StatusWatcher(client, lambda *change: changes.append(change), batch_size=2, min_interval=60,
+                                max_requests_per_second=1000)
+
+        for index in range(5):
+            watcher.watch('S%d' % index, statuses=['ready'] if index else None)
+
+        self.assertEqual(2, watcher.poll_once())
+        self.assertEqual(2, watcher.poll_once())
+        self.assertEqual(1, watcher.poll_once())
+        self.assertEqual(0, watcher.poll_once())
+
+        self.assertEqual([['S0', 'S1'], ['S2', 'S3'], ['S4']], client.requests)
+        self.assertEqual([({'id': 'S0', 'documents': [{'status': 'ready'}]}, None, ('ready',))], changes)
+
+    def test_finished_signatures_are_reported_and_forgotten(self):
+        client = FakeClient({'S1': 'ready', 'S2': 'ready'})
+        changes = []
+
+        watcher = StatusWatcher(client, lambda *change: changes.append(change), min_interval=0,
+                                max_requests_per_second=1000)
+        watcher.watch('S1', statuses=['ready'])
+        watcher.watch('S2', statuses=['ready'])
+
+        watcher.poll_once()
+        client.statuses = {'S1': 'completed', 'S2': 'declined'}
+        watcher.run()
+
+        self.assertEqual([('S1', ('ready',), ('completed',)), ('S2', ('ready',), ('declined',))],
+                         [(signature['id'], old, new) for signature, old, new in changes])
+        self.assertEqual(0, len(watcher))
+
+    def test_unchanged_signatures_back_off(self):
+        client = FakeClient({'S1': 'ready'})
+
+        watcher = StatusWatcher(client, lambda *change: None, min_interval=10, max_interval=25)
+        watcher.watch('S1', statuses=['ready'])
+
+        watcher.poll_once()
+        self.assertAlmostEqual(20, watcher.next_due(), places=0)
+        self.assertEqual(0, watcher.poll_once())
+
+    def test_old_signatures_start_with_longer_interval(self):
+        watcher = StatusWatcher(FakeClient({}), lambda *change: None, min_interval=10, max_interval=1000)
+
+        watcher.watch('S1', created_at='2016-01-01T10:00:00+0000')
+        watcher.poll_once()
+
+        self.assertAlmostEqual(1000, watcher.next_due(), places=0)
+
+    def test_failed_polls_are_retried(self):
+        client = FakeClient({'S1': 'ready', 'S2': 'ready'})
+        client.errors = [TimeoutError('Read timed out')]
+
+        watcher = StatusWatcher(client, lambda *change: None, min_interval=10, max_requests_per_second=1000)
+        watcher.watch('S1', statuses=['ready'])
+        watcher.watch('S2', statuses=['ready'])
+
+        self.assertRaises(TimeoutError, watcher.poll_once)
+        self.assertEqual(2, len(watcher))
+        self.assertAlmostEqual(20, watcher.next_due(), places=0)
+
+    def test_run_survives_failed_polls(self):
+        client = FakeClient({'S1': 'completed'})
+        client.errors = [ConnectionError('Connection reset')]
+        changes = []
+
+        watcher = StatusWatcher(client, lambda *change: changes.append(change), min_interval=0,
+                                max_requests_per_second=1000)
+        watcher.RETRY_DELAY = 0.01
+        watcher.watch('S1', statuses=['ready'])
+
+        with self.assertLogs('signaturit_sdk.status_watcher', 'ERROR'):
+            watcher.run()
+
+        self.assertEqual([['S1'], ['S1']], client.requests)
+        self.assertEqual(1, len(changes))
+
+    def test_arun_with_coroutine_callback(self):
+        client = FakeAsyncClient({'S1': 'completed'})
+        changes = []
+
+        async def on_change(signature, old, new):
+            changes.append(new)
+
+        watcher = StatusWatcher(client, on_change)
+        watcher.watch('S1', statuses=['ready'])
+
+        asyncio.run(watcher.arun())
+
+        self.assertEqual([('completed',)], changes)
+        self.assertEqual(0, len(watcher))
+
+    def wait_for_requests(self, client, count):
+        deadline = time.monotonic() + 2
+
+        while len(client.requests) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_run_wakes_up_for_new_signatures(self):
+        client = FakeClient({'S1': 'ready', 'S2': 'ready'})
+        stop_event = threading.Event()
+
+        watcher = StatusWatcher(client, lambda *change: None, min_interval=60, max_requests_per_second=1000)
+        runner = threading.Thread(target=watcher.run, args=(stop_event,))
+        runner.start()
+
+        try:
+            watcher.watch('S1', statuses=['ready'])
+            self.wait_for_requests(client, 1)
+
+            watcher.watch('S2', statuses=['ready'])
+            self.wait_for_requests(client, 2)
+        finally:
+            stop_event.set()
+            runner.join(2)
+
+        self.assertFalse(runner.is_alive())
+        self.assertEqual([['S1'], ['S2']], client.requests)
+
+    def test_arun_wakes_up_for_new_signatures(self):
+        client = FakeAsyncClient({'S1': 'ready', 'S2': 'ready'})
+
+        watcher = StatusWatcher(client, lambda *change: None, min_interval=60, max_requests_per_second=1000)
+
+        async def watch():
+            stop_event = asyncio.Event()
+            runner = asyncio.ensure_future(watcher.arun(stop_event))
+
+            await asyncio.sleep(0.01)
+            watcher.watch('S1', statuses=['ready'])
+            await asyncio.sleep(0.01)
+            await asyncio.to_thread(watcher.watch, 'S2', statuses=['ready'])
+            await asyncio.sleep(0.01)
+
+            stop_event.set()
+            await asyncio.wait_for(runner, 2)
+
+        asyncio.run(watch())
+
+        self.assertEqual([['S1'], ['S2']], client.requests)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import io
+import unittest
+from signaturit_sdk.signaturit_client import SignaturitClient
+from signaturit_sdk.async_signaturit_client import AsyncSignaturitClient
+from signaturit_sdk.resources.retry import RetryPolicy
+from signaturit_sdk.resources.transport import HTTPXTransport, InMemoryTransport, Transport
+import httpx
+import requests
+import warnings
+
+
+class TestInMemoryTransport(unittest.TestCase):
+    def setUp(self):
+        warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed.*")
+
+    def test_routes(self):
+        transport = InMemoryTransport()
+        transport.add('GET', '/v3/signatures/SIGN_ID.json', {'id': 'SIGN_ID'})
+        transport.add('POST', '/v3/team/groups.json', lambda request: (201, {}, '{"id": "GROUP_ID"}'))
+        transport.add('GET', '/v3/signatures/SIGN_ID/documents/DOC_ID/download/signed', b'%PDF-1.4')
+
+        with SignaturitClient('SOME_TOKEN', transport=transport) as client:
+            self.assertEqual({'id': 'SIGN_ID'}, client.get_signature('SIGN_ID'))
+            self.assertEqual({'message': 'Not found'}, client.get_templates())
+            self.assertEqual({'id': 'GROUP_ID'}, client.create_group('Group'))
+
+            destination = io.BytesIO()
+            client.download_signed_document('SIGN_ID', 'DOC_ID', destination=destination)
+
+            self.assertEqual(b'%PDF-1.4', destination.getvalue())
+
+        self.assertEqual('name=Group', transport.requests[2].body)
+        self.assertEqual('Bearer SOME_TOKEN', transport.requests[0].headers['Authorization'])
+        self.assertEqual(['GET', 'GET', 'POST', 'GET'], [request.method for request in transport.requests])
+
+    def test_uploads(self):
+        transport = InMemoryTransport()
+        transport.add('POST', '/v3/signatures.json', lambda request: {'received': len(request.body)})
+
+        client = SignaturitClient('SOME_TOKEN', transport=transport)
+        response = client.create_signature([('contract.pdf', b'%PDF-1.4')], [{'email': 'bob@signaturit.com'}], {})
+
+        self.assertGreater(response['received'], 8)
+        self.assertIn(b'%PDF-1.4', transport.requests[0].body)
+        self.assertIn(b'bob@signaturit.com', transport.requests[0].body)
+
+
+class TestHTTPXTransport(unittest.TestCase):
+    def setUp(self):
+        warnings.filterwarnings("ignore", category=ResourceWarning, message="unclosed.*")
+
+    def test_requests(self):
+        memory = InMemoryTransport()
+        memory.add('GET', '/v3/signatures/SIGN_ID.json', {'id': 'SIGN_ID'})
+        memory.add('POST', '/v3/signatures.json', lambda request: {'received': len(request.body)})
+        memory.add('GET', '/v3/signatures/SIGN_ID/documents/DOC_ID/download/signed', b'%PDF-1.4' * 1000)
+
+        transport = HTTPXTransport(client=httpx.Client(transport=memory.as_httpx()))
+
+        with SignaturitClient('SOME_TOKEN', transport=transport) as client:
+            self.assertEqual({'id': 'SIGN_ID'}, client.get_signature('SIGN_ID'))
+            self.assertEqual({'message': 'Not found'}, client.get_templates())
+
+            response = client.create_signature([('contract.pdf', b'%PDF-1.4')], [{'email': 'bob@signaturit.com'}],
+                                               {})
+            upload = memory.requests[-1]
+
+            self.assertEqual(str(len(upload.body)), upload.headers['Content-Length'])
+            self.assertEqual({'received': len(upload.body)}, response)
+
+            destination = io.BytesIO()
+            result = client.download_signed_document('SIGN_ID', 'DOC_ID', destination=destination, chunk_size=1024)
+
+            self.assertEqual(8000, result['bytes'])
+            self.assertEqual(b'%PDF-1.4' * 1000, client.download_signed_document('SIGN_ID', 'DOC_ID'))
+
+    def test_connection_errors_are_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+
+            raise httpx.ConnectError('Connection refused', request=request)
+
+        transport = HTTPXTransport(client=httpx.Client(transport=httpx.MockTransport(handler)))
+        client = SignaturitClient('SOME_TOKEN', transport=transport, retry=RetryPolicy(total=2, backoff_factor=0.01))
+
+        with self.assertRaises(requests.ConnectionError):
+            client.get_signature('SIGN_ID')
+
+        self.assertEqual(3, len(calls))
+
+    def test_transports_must_implement_request(self):
+        class IncompleteTransport(Transport):
+            def close(self):
+                pass
+
+        with self.assertRaises(TypeError):
+            IncompleteTransport()
+
+
+class TestAsyncInMemoryTransport(unittest.IsolatedAsyncioTestCase):
+    async def test_routes(self):
+        memory = InMemoryTransport()
+        memory.add('GET', '/v3/signatures/SIGN_ID.json', {'id': 'SIGN_ID'})
+
+        client = AsyncSignaturitClient('SOME_TOKEN', http_client=httpx.AsyncClient(transport=memory.as_httpx()))
+
+        async with client:
+            self.assertEqual({'id': 'SIGN_ID'}, await client.get_signature('SIGN_ID'))
+
+        self.assertEqual('https://api.sandbox.signaturit.com/v3/signatures/SIGN_ID.json', memory.requests[0].url)
+
+
+if __name__ == '__main__':
+    unittest.main()